@@ -0,0 +1,21 @@
+"""Whole-table comparisons of algorithms."""
+
+import numpy as np
+import pandas as pd
+
+from tig_sota import analytics
+
+
+def test_by_round_ignores_unsolved():
+    df = pd.DataFrame({
+        "dataset": ["A", "A", "A", "B", "A"],
+        "instance": ["1", "2", "3", "1", "1"],
+        "algorithm": ["x", "x", "x", "x", "y"],
+        # unsolved results carry a placeholder gap of 0
+        "gap_percent": [2.0, 4.0, 0.0, 0.0, 1.0],
+        "status": ["solution", "solution", "timeout", "no solution", "solution"],
+    })
+    table = analytics.by_round(df, [(1, "x"), (2, "y")], "dataset")
+    assert table[["dataset", "round", "algorithm"]].values.tolist() == [["A", 1, "x"], ["A", 2, "y"], ["B", 1, "x"]]
+    assert table["gap_percent"].tolist()[:2] == [3.0, 1.0]
+    assert np.isnan(table["gap_percent"].iloc[2])
@@ -0,0 +1,91 @@
+"""TIGClient against a local stub of the mainnet API."""
+
+import http.server
+import json
+import threading
+import urllib.parse
+
+import pytest
+
+from tig_sota.api import TOKEN_DECIMALS, TIGClient
+
+CURRENT_ROUND = 13
+ALGORITHMS = {"c001_a001": "greedy", "c001_a002": "tabu", "c002_a001": "clarke_wright"}
+EMISSIONS = {
+    10: {"c001_a001": 3, "c001_a002": 5, "c002_a001": 7},
+    # no c001 algorithm earned anything
+    11: {"c002_a001": 7},
+    12: {"c001_a001": 2},
+    CURRENT_ROUND: {"c001_a002": 1},
+}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    requests = []
+    # set to make every round-emissions request wait for the others
+    barrier = None
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        self.requests.append((url.path, params))
+        if url.path == "/get-block":
+            body = {"block": {"id": "b1", "details": {"round": CURRENT_ROUND}}}
+        elif url.path == "/get-algorithms":
+            body = {"algorithms": [{"id": a_id, "details": {"name": name}} for a_id, name in ALGORITHMS.items()]}
+        elif url.path == "/get-round-emissions":
+            if self.barrier is not None:
+                self.barrier.wait()
+            amounts = EMISSIONS[int(params["round"])]
+            body = {"algorithms": {a_id: str(x * 10 ** TOKEN_DECIMALS) for a_id, x in amounts.items()}}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(tmp_path):
+    Handler.requests = []
+    Handler.barrier = None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield TIGClient(f"http://127.0.0.1:{server.server_address[1]}", cache_root=str(tmp_path), retries=1, timeout=5)
+    server.shutdown()
+    server.server_close()
+
+
+def rounds_requested():
+    return sorted(int(params["round"]) for path, params in Handler.requests if path == "/get-round-emissions")
+
+
+def test_top_algorithms_skips_empty_rounds(client):
+    assert client.top_algorithms("c001", start=10) == [(10, "tabu", 5.0), (12, "greedy", 2.0)]
+    # challenges can be given by name
+    top = client.top_algorithms("vehicle_routing", start=10, end=12)
+    assert top == [(10, "clarke_wright", 7.0), (11, "clarke_wright", 7.0)]
+
+
+def test_completed_rounds_cached(client):
+    client.top_algorithms("c001", start=10, end=CURRENT_ROUND + 1)
+    assert rounds_requested() == [10, 11, 12, 13]
+    Handler.requests = []
+    assert client.top_algorithms("c001", start=10, end=CURRENT_ROUND + 1)[-1] == (CURRENT_ROUND, "tabu", 1.0)
+    # only the current round, which may still change, is fetched again
+    assert rounds_requested() == [CURRENT_ROUND]
+
+
+def test_rounds_fetched_concurrently(client):
+    # every request waits until all three are in flight, so a sequential client would time out
+    Handler.barrier = threading.Barrier(3, timeout=5)
+    assert sorted(client.rounds_emissions(range(10, 13), CURRENT_ROUND)) == [10, 11, 12]
+    assert rounds_requested() == [10, 11, 12]
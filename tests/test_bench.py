@@ -0,0 +1,30 @@
+"""bench.compare against baselines recorded on the same and on another host."""
+
+from tig_sota import bench
+
+HOST = {"host": "a", "machine": "x86_64", "processor": "", "cpus": 8, "python": "3.11.7", "numpy": "2.0.0"}
+BASELINE = bench.Baseline(HOST, {"s": {"seconds": 1.0, "rows": 100, "bytes": 1000, "peak_bytes": 10 << 20}})
+
+
+def result(seconds, peak_bytes=10 << 20):
+    return bench.Result("s", seconds, 100, 1000, peak_bytes)
+
+
+def test_same_host_within_tolerance():
+    assert bench.compare([result(1.2)], BASELINE, tolerance=0.3, current=HOST) == []
+    assert [r.metric for r in bench.compare([result(2.0)], BASELINE, tolerance=0.3, current=HOST)] == [
+        "rows_per_second"
+    ]
+
+
+def test_other_software_still_compares_throughput():
+    current = {**HOST, "numpy": "2.1.0"}
+    assert bench.environment_differences(BASELINE, current) == {"numpy": ("2.0.0", "2.1.0")}
+    assert [r.metric for r in bench.compare([result(2.0)], BASELINE, current=current)] == ["rows_per_second"]
+
+
+def test_other_host_compares_memory_only():
+    current = {**HOST, "host": "b", "cpus": 2}
+    assert bench.compare([result(2.0)], BASELINE, current=current) == []
+    regressions = bench.compare([result(2.0, peak_bytes=20 << 20)], BASELINE, current=current)
+    assert [r.metric for r in regressions] == ["peak_bytes"]
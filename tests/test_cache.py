@@ -0,0 +1,149 @@
+"""DownloadCache against a local http.server serving one file, with Range support."""
+
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+import requests
+
+from tig_sota.cache import CHUNK_SIZE, VALIDATOR_SUFFIX, ChecksumError, DownloadCache
+
+CONTENT = bytes(range(256)) * 4096
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    content = CONTENT
+    ranges = []
+    # bytes of the body sent before dropping the connection, to interrupt a download
+    truncate = None
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        self.ranges.append(header)
+        etag = f'"{hashlib.sha256(self.content).hexdigest()[:16]}"'
+        if header is not None and self.headers.get("If-Range") not in (None, etag):
+            # changed since the partial download: send the whole new content
+            header = None
+        if header is None:
+            self.send_response(200)
+            body = self.content
+        else:
+            start = int(header[len("bytes="):].split("-")[0])
+            if start >= len(self.content):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(self.content) - 1}/{len(self.content)}")
+            body = self.content[start:]
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body[:self.truncate])
+        if self.truncate is not None:
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    Handler.content = CONTENT
+    Handler.ranges = []
+    Handler.truncate = None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/file.bin"
+    server.shutdown()
+    server.server_close()
+
+
+def partial_path(cache, url):
+    return os.path.join(cache.root, "partial", hashlib.sha256(url.encode()).hexdigest())
+
+
+def write_partial(cache, url, data, validator=None):
+    """A partial download of `data`, with the validator the server sent for it (by default,
+    that of the current content)"""
+    with open(partial_path(cache, url), "wb") as f:
+        f.write(data)
+    with open(partial_path(cache, url) + VALIDATOR_SUFFIX, "w") as f:
+        f.write(validator or f'"{hashlib.sha256(CONTENT).hexdigest()[:16]}"')
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_fetch_once(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    path = cache.fetch(url)
+    assert read(path) == CONTENT
+    assert os.path.basename(path) == hashlib.sha256(CONTENT).hexdigest()
+    assert cache.fetch(url) == path
+    assert Handler.ranges == [None]
+
+
+def test_resume(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    write_partial(cache, url, CONTENT[:1000])
+    assert read(cache.fetch(url)) == CONTENT
+    assert Handler.ranges == ["bytes=1000-"]
+    assert os.listdir(os.path.join(cache.root, "partial")) == []
+
+
+def test_stale_partial_restarts_after_416(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    write_partial(cache, url, CONTENT + b"stale tail")
+    assert read(cache.fetch(url)) == CONTENT
+    assert Handler.ranges == [f"bytes={len(CONTENT) + 10}-", None]
+
+
+def test_digest_mismatch(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    with pytest.raises(ChecksumError):
+        cache.fetch(url, sha256="0" * 64)
+    assert not os.path.exists(partial_path(cache, url))
+    assert cache.cached() == {}
+
+
+def test_pinned_digest(tmp_path, url):
+    sha256 = hashlib.sha256(CONTENT).hexdigest()
+    assert read(DownloadCache(str(tmp_path), digests={url: sha256}).fetch(url)) == CONTENT
+    with pytest.raises(ChecksumError):
+        DownloadCache(str(tmp_path / "other"), digests={url: "0" * 64}).fetch(url)
+    # a pinned object already in the cache is used without a request
+    Handler.ranges = []
+    DownloadCache(str(tmp_path), digests={url: sha256}).fetch(url)
+    assert Handler.ranges == []
+
+
+def test_partial_without_validator_restarts(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    with open(partial_path(cache, url), "wb") as f:
+        f.write(b"x" * 1000)
+    assert read(cache.fetch(url)) == CONTENT
+    assert Handler.ranges == [None]
+
+
+def test_content_changed_between_attempts(tmp_path, url):
+    cache = DownloadCache(str(tmp_path), digests={})
+    # interrupted after the first chunk was written
+    Handler.content = CONTENT * 3
+    Handler.truncate = CHUNK_SIZE + 1000
+    with pytest.raises(requests.RequestException):
+        cache.fetch(url)
+    assert os.path.getsize(partial_path(cache, url)) == CHUNK_SIZE
+    # the remote file changes before the download is resumed
+    Handler.truncate = None
+    Handler.content = bytes(reversed(CONTENT)) * 3
+    path = cache.fetch(url)
+    assert read(path) == Handler.content
+    assert os.path.basename(path) == hashlib.sha256(Handler.content).hexdigest()
+    assert Handler.ranges == [None, f"bytes={CHUNK_SIZE}-"]
@@ -0,0 +1,75 @@
+"""DIMACS .cnf parsing, .cnfb round trips and the CNF index."""
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.satisfiability import cnf_binary
+
+# SATLIB layout: comments, clauses spanning lines, and a `%` trailer after the last clause
+CNF = """c a comment
+p cnf 4 4
+ 1 -2 0
+3
+ 4 -1 0
+-3 0 2 0
+%
+0
+"""
+
+
+def test_parse(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text(CNF)
+    num_variables, offsets, literals = cnf_binary.parse_cnf(str(path))
+    assert num_variables == 4
+    assert offsets.tolist() == [0, 2, 5, 6, 7]
+    assert literals.tolist() == [1, -2, 3, 4, -1, -3, 2]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text(CNF)
+    cnf_binary.convert(str(path))
+    instance = cnf_binary.read_instance(cnf_binary.cnfb_path(str(path)))
+    num_variables, offsets, literals = cnf_binary.parse_cnf(str(path))
+    assert (instance.num_variables, instance.num_clauses) == (num_variables, 4)
+    assert np.array_equal(instance.offsets, offsets)
+    assert np.array_equal(instance.literals, literals)
+
+
+def test_empty_clauses(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text("p cnf 2 3\n0\n1 2 0\n0\n")
+    cnf_binary.convert(str(path))
+    instance = cnf_binary.read_instance(cnf_binary.cnfb_path(str(path)))
+    assert instance.offsets.tolist() == [0, 0, 2, 2]
+    assert instance.literals.tolist() == [1, 2]
+
+
+def test_missing_clauses(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text("p cnf 2 3\n1 2 0\n")
+    with pytest.raises(ValueError):
+        cnf_binary.parse_cnf(str(path))
+
+
+def test_version_mismatch(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text(CNF)
+    cnf_binary.convert(str(path))
+    data = bytearray(open(cnf_binary.cnfb_path(str(path)), "rb").read())
+    data[4] = cnf_binary.VERSION + 1
+    open(cnf_binary.cnfb_path(str(path)), "wb").write(data)
+    with pytest.raises(ValueError):
+        cnf_binary.read_instance(cnf_binary.cnfb_path(str(path)))
+
+
+def test_index(tmp_path):
+    path = tmp_path / "a.cnf"
+    path.write_text(CNF)
+    cnf_binary.convert(str(path))
+    stats = cnf_binary.instance_stats(cnf_binary.cnfb_path(str(path)))
+    assert (stats["num_literals"], stats["min_clause_length"], stats["max_clause_length"]) == (7, 1, 3)
+    assert (stats["positive_literals"], stats["negative_literals"]) == (4, 3)
+    cnf_binary.write_index(str(tmp_path), [(cnf_binary.cnfb_path(str(path)), stats)])
+    assert cnf_binary.read_index(str(tmp_path)) == {"a.cnf": stats}
@@ -0,0 +1,80 @@
+"""BuildContext.fetch_stale: freshness from the recorded URL and digest, not the cached file."""
+
+import http.server
+import os
+import shutil
+import threading
+
+import pytest
+
+from tig_sota.cache import DownloadCache
+from tig_sota.datasets import BuildContext
+from tig_sota.fetch import FetchEngine
+from tig_sota.manifest import Manifest, describe
+
+FILES = {f"/{name}": name.encode() * 100 for name in ("a", "b")}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        body = FILES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    Handler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def build(tmp_path, base_url, cache_dir, params=()):
+    out_dir = str(tmp_path / "out")
+    os.makedirs(out_dir, exist_ok=True)
+
+    def copy(path, instance):
+        out_path = os.path.join(out_dir, instance)
+        shutil.copyfile(path, out_path)
+        return describe(out_path)
+
+    with BuildContext(workers=1) as ctx:
+        ctx.engine = FetchEngine(max_workers=2, cache=DownloadCache(str(cache_dir), digests={}))
+        with Manifest(out_dir) as manifest:
+            downloads = {f"{base_url}{path}": (path[1:], params) for path in FILES}
+            return ctx.fetch_stale(manifest, downloads, copy)
+
+
+def test_fresh_without_cached_download(tmp_path, base_url):
+    assert build(tmp_path, base_url, tmp_path / "cache") == []
+    assert sorted(Handler.requests) == ["/a", "/b"]
+    # a new cache directory: the manifest's recorded digests are enough
+    Handler.requests = []
+    assert build(tmp_path, base_url, tmp_path / "other") == []
+    assert Handler.requests == []
+
+
+def test_rebuilds_stale(tmp_path, base_url):
+    build(tmp_path, base_url, tmp_path / "cache")
+    os.remove(tmp_path / "out" / "a")
+    Handler.requests = []
+    build(tmp_path, base_url, tmp_path / "other")
+    assert Handler.requests == ["/a"]
+    # changed params make every instance stale, served from the cache
+    Handler.requests = []
+    build(tmp_path, base_url, tmp_path / "cache", params=(2,))
+    assert Handler.requests == []
+    assert (tmp_path / "out" / "a").read_bytes() == FILES["/a"]
+
@@ -0,0 +1,56 @@
+"""Exact k-NN ground truth against brute-force search."""
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.vector_search import ground_truth, vector_bin
+
+
+def brute_force(database, queries, k):
+    distances = ((queries[:, None, :].astype(np.float64) - database[None, :, :]) ** 2).sum(axis=2)
+    # nearest first, ties to the lower index
+    order = np.lexsort((np.broadcast_to(np.arange(len(database)), distances.shape), distances), axis=1)[:, :k]
+    return order, np.sqrt(np.take_along_axis(distances, order, axis=1))
+
+
+@pytest.mark.parametrize("k", [1, 5])
+def test_random(k):
+    rng = np.random.default_rng(0)
+    database = rng.normal(size=(500, 8)).astype(np.float32)
+    queries = rng.normal(size=(37, 8)).astype(np.float32)
+    # batches and blocks that do not divide the sizes
+    indices, distances = ground_truth.exact_knn(database, queries, k=k, workers=2, query_batch=10, database_block=64)
+    expected_indices, expected_distances = brute_force(database, queries, k)
+    assert np.array_equal(indices, expected_indices)
+    assert np.allclose(distances, expected_distances)
+
+
+def test_ties():
+    rng = np.random.default_rng(1)
+    # SIFT-like integer vectors, with duplicated rows so that some neighbours are equidistant
+    database = rng.integers(0, 256, size=(300, 16)).astype(np.float32)
+    database[[40, 120, 250]] = database[7]
+    database[[99, 200]] = database[150]
+    queries = np.concatenate([database[[7, 150, 3]], rng.integers(0, 256, size=(10, 16))]).astype(np.float32)
+    indices, distances = ground_truth.exact_knn(database, queries, k=3, query_batch=4, database_block=50)
+    expected_indices, expected_distances = brute_force(database, queries, 3)
+    assert np.array_equal(indices, expected_indices)
+    assert indices[:2].tolist() == [[7, 40, 120], [99, 150, 200]]
+    assert np.allclose(distances, expected_distances)
+
+
+def test_verify_and_regenerate(tmp_path):
+    rng = np.random.default_rng(2)
+    database = rng.normal(size=(200, 6)).astype(np.float32)
+    queries = rng.normal(size=(15, 6)).astype(np.float32)
+    expected, _ = brute_force(database, queries, 1)
+    stored = expected[:, 0].copy()
+    stored[[3, 9]] = (stored[[3, 9]] + 1) % len(database)
+    path = str(tmp_path / "a.bin")
+    vector_bin.write_bin(path, database, queries, stored)
+
+    wrong, exact = ground_truth.verify(path)
+    assert wrong.tolist() == [3, 9]
+    assert np.array_equal(exact, expected[:, 0])
+    assert ground_truth.regenerate(path) == 2
+    assert len(ground_truth.verify(path)[0]) == 0
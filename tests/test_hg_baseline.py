@@ -0,0 +1,28 @@
+"""HG baseline index: parsing .sol files and the order of baselines.csv."""
+
+import csv
+
+from tig_sota.datasets.vehicle_routing import hg, hg_baseline
+
+
+def write_sol(path, routes, cost):
+    path.write_text("".join(f"Route #{i + 1}: {' '.join(map(str, r))}\n" for i, r in enumerate(routes))
+                    + f"Cost {cost}\n")
+
+
+def test_index(tmp_path):
+    write_sol(tmp_path / "C1_2_2.sol", [[1, 2], [3]], 12.5)
+    write_sol(tmp_path / "C1_2_10.sol", [[1]], 7)
+    write_sol(tmp_path / "C1_10_1.sol", [[2, 1, 3]], 3.25)
+
+    index = hg_baseline.build_index(str(tmp_path))
+    assert list(index.instances) == ["C1_10_1", "C1_2_10", "C1_2_2"]
+    assert index["C1_2_2.txt"] == hg_baseline.Baseline("C1_2_2", 2, 12.5, [2, 1])
+    assert hg_baseline.BaselineIndex.load(str(tmp_path))["C1_10_1"] == index["C1_10_1"]
+
+    # in the given order, as the original script wrote sota.csv
+    order = [name for name in hg.INSTANCES if (tmp_path / f"{name}.sol").exists()]
+    assert order == ["C1_2_2", "C1_2_10", "C1_10_1"]
+    hg_baseline.build_index(str(tmp_path), instances=order)
+    with open(tmp_path / hg_baseline.FILENAME, newline="") as f:
+        assert [row["instance"] for row in csv.DictReader(f)] == order
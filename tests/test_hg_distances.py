@@ -0,0 +1,63 @@
+"""HG .dist distance matrices against the evaluator's per-pair computation."""
+
+import math
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.vehicle_routing import hg_distances
+
+INSTANCE = """C1_2_1
+
+VEHICLE
+NUMBER     CAPACITY
+  50          200
+
+CUSTOMER
+CUST NO.  XCOORD.   YCOORD.    DEMAND   READY TIME  DUE DATE   SERVICE TIME
+
+    0      70         70          0          0       1351          0
+    1      33.35      78.05      20        750        809         90
+    2      59         -6.25      20        265        324         90
+    3      0.05       0          10          0         59         90
+    x      1          2           3          4          5          6
+    4      10         20         30
+"""
+
+
+def rust_round(value):
+    """f64::round: half away from zero"""
+    return math.copysign(math.floor(abs(value) + 0.5), value)
+
+
+def evaluator_matrix(coordinates):
+    points = [(rust_round(x * hg_distances.SCALE), rust_round(y * hg_distances.SCALE)) for x, y in coordinates]
+    return [[int(rust_round(math.hypot(xi - xj, yi - yj))) for xj, yj in points] for xi, yi in points]
+
+
+def test_round_half_away():
+    values = np.array([0.5, 1.5, 2.5, -0.5, -2.5, 2.4999, 3.0])
+    assert hg_distances.round_half_away(values).tolist() == [rust_round(v) for v in values]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "C1_2_1.txt"
+    path.write_text(INSTANCE)
+    written = hg_distances.write_matrix(str(path))
+    assert written == str(tmp_path / "C1_2_1.dist")
+    matrix = hg_distances.read_matrix(written)
+    # malformed customer lines are skipped, as by the evaluator
+    expected = evaluator_matrix([(70, 70), (33.35, 78.05), (59, -6.25), (0.05, 0)])
+    assert matrix.tolist() == expected
+    assert matrix.dtype == np.dtype("<i4") and not matrix.flags.writeable
+
+
+def test_version_mismatch(tmp_path):
+    path = tmp_path / "C1_2_1.txt"
+    path.write_text(INSTANCE)
+    written = hg_distances.write_matrix(str(path))
+    data = bytearray(open(written, "rb").read())
+    data[4] = hg_distances.VERSION + 1
+    open(written, "wb").write(data)
+    with pytest.raises(ValueError):
+        hg_distances.read_matrix(written)
@@ -0,0 +1,75 @@
+"""Large QKP instances generated out of order from replayed RNG states match the original sequential generator."""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.knapsack import large_qkp, qkp_binary
+
+# n_nodes above, below and equal to ROW_CHUNK, including a partial last chunk
+COMBOS = [(7, 50), (3, 100), (4, 25), (10, 5)]
+ROW_CHUNK = 4
+
+
+def ofvs(n_nodes, density):
+    return {f'{n_nodes}_{density}_{int(float(b) * 10)}.txt': 1000 + i for i, b in enumerate(large_qkp.budgets)}
+
+
+def original(out_dir):
+    """The generation loop of the original download script"""
+    np.random.seed(24)
+    for n_nodes, density in COMBOS:
+        utility_matrix = np.random.randint(1, 101, size=(n_nodes, n_nodes))
+        utility_matrix = np.tril(utility_matrix) + np.tril(utility_matrix, -1).T
+        utility_matrix = utility_matrix * (np.random.rand(n_nodes, n_nodes) < (density / 100))
+        edges = {}
+        for i in range(n_nodes):
+            for j in range(i, n_nodes):
+                if utility_matrix[i, j] > 0:
+                    edges[i, j] = utility_matrix[i, j]
+        weights = np.random.randint(1, 51, size=n_nodes)
+        temp_file = os.path.join(out_dir, f'{n_nodes}_{density}.txt')
+        with open(temp_file, 'w') as f:
+            f.write(f'{n_nodes} {len(edges)} int\n')
+            for (i, j) in edges:
+                f.write(f'{i} {j} {edges[(i, j)]}\n')
+            for weight in weights:
+                f.write(f'{weight} ')
+            f.write('\n')
+        for b in large_qkp.budgets:
+            b = int(float(b) * 10)
+            instance = f'{n_nodes}_{density}_{b}.txt'
+            shutil.copyfile(temp_file, os.path.join(out_dir, instance))
+            with open(os.path.join(out_dir, instance), 'a') as f:
+                f.write(f'{int(b / 1000.0 * np.sum(weights))}\n')
+                f.write(f'{ofvs(n_nodes, density)[instance]}\n')
+        os.remove(temp_file)
+
+
+@pytest.fixture
+def small_combos(monkeypatch):
+    monkeypatch.setattr(large_qkp, "combos", COMBOS)
+    monkeypatch.setattr(large_qkp, "ROW_CHUNK", ROW_CHUNK)
+
+
+def test_matches_original(tmp_path, small_combos):
+    expected, got = tmp_path / "expected", tmp_path / "got"
+    expected.mkdir()
+    got.mkdir()
+    original(str(expected))
+    states = large_qkp.replay_states()
+    for n_nodes, density in reversed(COMBOS):
+        large_qkp.generate_instance(str(got), n_nodes, density, states[n_nodes, density], ofvs(n_nodes, density))
+
+    names = sorted(os.listdir(expected))
+    assert len(names) == len(COMBOS) * len(large_qkp.budgets)
+    assert sorted(n for n in os.listdir(got) if n.endswith(".txt")) == names
+    for name in names:
+        assert (got / name).read_bytes() == (expected / name).read_bytes()
+        text = qkp_binary.read_qkp(str(expected / name))
+        packed = qkp_binary.read_instance(str(got / qkp_binary.bin_path(name)))
+        assert (packed.num_items, packed.budget, packed.ofv) == (text.num_items, text.budget, text.ofv)
+        for field in ("rows", "cols", "vals", "weights"):
+            assert np.array_equal(getattr(packed, field), getattr(text, field))
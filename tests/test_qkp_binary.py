@@ -0,0 +1,63 @@
+"""QKP .txt/.bin round trips, and read_qkp's choice between them."""
+
+import os
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.knapsack import qkp_binary, qkp_convert
+
+ROWS, COLS, VALS = [0, 0, 1, 2], [0, 2, 1, 2], [5, -3, 4, 7]
+WEIGHTS = [3, 1, 4]
+
+
+def write(path, ofv=42):
+    qkp_convert.write_instance(str(path), 3, ROWS, COLS, VALS, WEIGHTS, 6, ofv)
+
+
+def assert_instance(instance, ofv=42):
+    assert (instance.num_items, instance.budget, instance.ofv) == (3, 6, ofv)
+    assert np.array_equal(instance.weights, WEIGHTS)
+    for got, expected in zip((instance.rows, instance.cols, instance.vals), (ROWS, COLS, VALS)):
+        assert np.array_equal(got, expected)
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "a.txt"
+    write(path)
+    assert_instance(qkp_binary.read_instance(qkp_binary.bin_path(str(path))))
+    os.remove(qkp_binary.bin_path(str(path)))
+    assert_instance(qkp_binary.read_qkp(str(path)))
+
+
+def test_version_mismatch(tmp_path):
+    path = tmp_path / "a.txt"
+    write(path)
+    data = bytearray(open(qkp_binary.bin_path(str(path)), "rb").read())
+    data[4] = qkp_binary.VERSION + 1
+    open(qkp_binary.bin_path(str(path)), "wb").write(data)
+    with pytest.raises(ValueError):
+        qkp_binary.read_instance(qkp_binary.bin_path(str(path)))
+
+
+def test_stale_sidecar_ignored(tmp_path):
+    path = tmp_path / "a.txt"
+    write(path)
+    bin_mtime = os.stat(qkp_binary.bin_path(str(path))).st_mtime_ns
+    # the .txt regenerated with another OFV, after its .bin
+    text = path.read_text().splitlines()
+    path.write_text("\n".join(text[:-1] + ["99"]) + "\n")
+    os.utime(path, ns=(bin_mtime + 10 ** 9, bin_mtime + 10 ** 9))
+    assert_instance(qkp_binary.read_qkp(str(path)), ofv=99)
+    # a .bin written after the .txt is used
+    os.utime(qkp_binary.bin_path(str(path)), ns=(bin_mtime + 2 * 10 ** 9, bin_mtime + 2 * 10 ** 9))
+    assert_instance(qkp_binary.read_qkp(str(path)), ofv=42)
+
+
+def test_no_edges(tmp_path):
+    path = tmp_path / "a.txt"
+    qkp_convert.write_instance(str(path), 3, [], [], [], WEIGHTS, 6, 42)
+    os.remove(qkp_binary.bin_path(str(path)))
+    instance = qkp_binary.read_qkp(str(path))
+    assert (instance.num_items, instance.budget, instance.ofv) == (3, 6, 42)
+    assert len(instance.rows) == len(instance.cols) == len(instance.vals) == 0
@@ -0,0 +1,68 @@
+"""The vectorized QKP converters write byte-identical .txt files to the original per-line loops."""
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.knapsack import qkp_group_ii, qkp_group_iii, standard_qkp
+
+OFV = 1234
+
+
+def raw_instance(num_items, seed):
+    """(linear, upper-triangular rows, weights, budget) with many zero utilities, zero linear
+    terms included"""
+    rng = np.random.default_rng(seed)
+    linear = rng.integers(0, 100, size=num_items) * (rng.random(num_items) < 0.7)
+    rows = [(rng.integers(1, 100, size=num_items - 1 - i) * (rng.random(num_items - 1 - i) < 0.4)).tolist()
+            for i in range(num_items)]
+    weights = rng.integers(1, 50, size=num_items).tolist()
+    return linear.tolist(), rows, weights, sum(weights) // 2
+
+
+def line(values):
+    return " ".join(map(str, values))
+
+
+def reference(num_items, linear, rows, weights, budget, keep_zero_linear):
+    """Output of the original download scripts' loops"""
+    edges = [(i, i, linear[i]) for i in range(num_items)]
+    for i in range(num_items):
+        for j in range(i + 1, num_items):
+            edges.append((i, j, rows[i][j - (i + 1)]))
+    edges = [e for e in edges if e[2] != 0 or (keep_zero_linear and e[0] == e[1])]
+    text = f"{num_items} {len(edges)} int\n"
+    text += "".join(f"{i} {j} {val:.6f}\n" for i, j, val in edges)
+    return text + " ".join(str(w) for w in weights) + "\n" + f"{budget}\n" + f"{OFV}\n"
+
+
+@pytest.mark.parametrize("num_items", [2, 7, 40])
+def test_standard_qkp(tmp_path, num_items):
+    linear, rows, weights, budget = raw_instance(num_items, 1)
+    raw = tmp_path / "jeu.txt"
+    raw.write_text("\n".join(["jeu", str(num_items), line(linear), *map(line, rows), "", str(budget),
+                              line(weights)]) + "\n")
+    out = tmp_path / "out.txt"
+    standard_qkp.save_instance(str(raw), str(out), OFV)
+    assert out.read_text() == reference(num_items, linear, rows, weights, budget, keep_zero_linear=True)
+
+
+@pytest.mark.parametrize("num_items", [2, 7, 40])
+def test_group_ii(tmp_path, num_items):
+    linear, rows, weights, budget = raw_instance(num_items, 2)
+    raw = tmp_path / "a.dat"
+    raw.write_text("\n".join([str(num_items), line(linear), *map(line, rows), "0", str(budget),
+                              line(weights)]) + "\n")
+    out = tmp_path / "out.txt"
+    qkp_group_ii.process_dat_file(str(raw), str(out), OFV)
+    assert out.read_text() == reference(num_items, linear, rows, weights, budget, keep_zero_linear=True)
+
+
+@pytest.mark.parametrize("num_items", [2, 7, 40])
+def test_group_iii(tmp_path, num_items):
+    linear, rows, weights, budget = raw_instance(num_items, 3)
+    raw = tmp_path / "a.txt"
+    raw.write_text("\n".join(["a", str(num_items), "", line(linear), *map(line, rows), "", "0", str(budget),
+                              line(weights)]) + "\n")
+    out = tmp_path / "out.txt"
+    qkp_group_iii.process_file(str(raw), str(out), OFV)
+    assert out.read_text() == reference(num_items, linear, rows, weights, budget, keep_zero_linear=False)
@@ -0,0 +1,60 @@
+"""CSR scoring of QKP selections against the dense interaction matrix."""
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.knapsack import qkp_binary, qkp_score
+
+
+def random_instance(rng, num_items, num_edges, ordered=True):
+    rows = rng.integers(0, num_items, size=num_edges)
+    cols = rng.integers(0, num_items, size=num_edges)
+    vals = rng.integers(-20, 100, size=num_edges)
+    if ordered:
+        keys = np.unique(np.minimum(rows, cols) * num_items + np.maximum(rows, cols))
+        rows, cols = keys // num_items, keys % num_items
+        vals = vals[:len(keys)]
+    weights = rng.integers(1, 50, size=num_items)
+    return qkp_binary.QKPInstance(num_items, int(weights.sum() // 2), 5000, weights, rows, cols, vals)
+
+
+def dense_values(instance, selections):
+    """Objective of each selection from the dense upper-triangular matrix, the last value of a
+    pair listed twice winning"""
+    dense = np.zeros((instance.num_items, instance.num_items), dtype=np.int64)
+    for i, j, val in zip(instance.rows, instance.cols, instance.vals):
+        dense[min(i, j), max(i, j)] = val
+    return np.maximum(np.einsum("bi,ij,bj->b", selections.astype(np.int64), dense, selections.astype(np.int64)), 0)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("gather_size", [qkp_score.GATHER_SIZE, 64])
+def test_matches_dense(monkeypatch, ordered, gather_size):
+    # a small gather size splits the CSR rows over many blocks
+    monkeypatch.setattr(qkp_score, "GATHER_SIZE", gather_size)
+    rng = np.random.default_rng(0)
+    instance = random_instance(rng, 60, 700, ordered)
+    selections = rng.random((9, 60)) < 0.4
+    selections[0] = False
+    selections[1] = True
+    scores = qkp_score.score(instance, selections)
+    assert np.array_equal(scores.value, dense_values(instance, selections))
+    assert np.array_equal(scores.weight, selections @ instance.weights)
+    assert np.array_equal(scores.feasible, scores.weight <= instance.budget)
+    assert np.allclose(scores.gap_percent[1:], (5000 / scores.value[1:] - 1) * 100)
+
+
+def test_empty_instance():
+    instance = qkp_binary.QKPInstance(3, 2, 10, np.array([1, 1, 1]), np.array([]), np.array([]), np.array([]))
+    scores = qkp_score.score(instance, [[True, False, True]])
+    assert scores.value.tolist() == [0] and scores.weight.tolist() == [2]
+
+
+def test_selection_files(tmp_path):
+    path = tmp_path / "a.sol"
+    path.write_text("0 2\n\n1\n")
+    assert qkp_score.read_selections(str(path), 3).tolist() == [[True, False, True], [False, True, False]]
+    with pytest.raises(ValueError):
+        qkp_score.selection_matrix([[0, 3]], 3)
+    with pytest.raises(ValueError):
+        qkp_score.selection_matrix([[1, 1]], 3)
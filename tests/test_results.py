@@ -0,0 +1,73 @@
+"""Importing harness evaluation CSVs into the Parquet results store and loading them back."""
+
+import os
+
+import pandas as pd
+
+from tig_sota import results
+
+KNAPSACK_CSV = (
+    "instance,knapsack_value,baseline_value,gap_percent,time_milliseconds,status\n"
+    "1000_25_50.txt,980,1000,2.0,12.5,solved\n"
+    "1000_25_100.txt,0,1000,0,1000.0,timeout\n"
+)
+SAT_CSV = (
+    "instance_name,ime_milliseconds,status\n"
+    "uf50-01.cnf,1.5,solved\n"
+    "uf50-010.cnf,2.5,solved\n"
+)
+
+
+def write(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def test_round_trip(tmp_path):
+    root = str(tmp_path / "results")
+    path = write(tmp_path, "c003_Large_QKP_my_algo.csv", KNAPSACK_CSV)
+    assert results.parse_csv_name(path) == ("knapsack", "Large_QKP", "my_algo")
+    part = results.import_csv(path, root=root)
+    assert os.path.dirname(part) == results.partition_dir("knapsack", "Large_QKP", "my_algo", root)
+
+    df = results.load("knapsack", root=root).sort_values("index").reset_index(drop=True)
+    assert df["instance"].tolist() == ["1000_25_50.txt", "1000_25_100.txt"]
+    assert df[["size", "density", "index"]].values.tolist() == [[1000, 25, 50], [1000, 25, 100]]
+    assert df["knapsack_value"].tolist() == [980, 0]
+    assert df["gap_percent"].tolist() == [2.0, 0.0]
+    assert df["status"].tolist() == ["solved", "timeout"]
+    assert (df["dataset"] == "Large_QKP").all() and (df["algorithm"] == "my_algo").all()
+    assert df["source"].tolist() == ["c003_Large_QKP_my_algo.csv"] * 2
+    assert df["peak_rss_bytes"].isna().all()
+
+
+def test_old_column_names(tmp_path):
+    root = str(tmp_path / "results")
+    results.import_csv(write(tmp_path, "c001_SATLIB_my_algo.csv", SAT_CSV), root=root)
+    df = results.load("satisfiability", columns=["instance", "index", "time_milliseconds"], root=root)
+    assert sorted(df.columns) == ["algorithm", "dataset", "index", "instance", "time_milliseconds"]
+    assert sorted(zip(df["index"], df["time_milliseconds"])) == [(1, 1.5), (10, 2.5)]
+
+
+def test_reimport(tmp_path):
+    root = str(tmp_path / "results")
+    path = write(tmp_path, "c003_Large_QKP_my_algo.csv", KNAPSACK_CSV)
+    assert results.import_csv(path, root=root) is not None
+    # the same file again is a no-op
+    assert results.import_csv(path, root=root) is None
+    # a re-run evaluation supersedes the previous import of the file
+    write(tmp_path, "c003_Large_QKP_my_algo.csv", KNAPSACK_CSV.replace("980", "990"))
+    assert results.import_paths([str(tmp_path)], root=root) != []
+    df = results.load("knapsack", root=root)
+    assert sorted(df["knapsack_value"]) == [0, 990]
+
+
+def test_partition_pruning(tmp_path):
+    root = str(tmp_path / "results")
+    results.import_csv(write(tmp_path, "c003_Large_QKP_a.csv", KNAPSACK_CSV), root=root)
+    results.import_csv(write(tmp_path, "c003_QKPGroupII_b.csv", KNAPSACK_CSV), root=root)
+    df = results.load("knapsack", algorithms=["b"], root=root)
+    assert set(df["dataset"]) == {"QKPGroupII"}
+    assert isinstance(df, pd.DataFrame) and len(df) == 2
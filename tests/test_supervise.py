@@ -0,0 +1,98 @@
+"""Supervised per-instance runs of a stand-in harness that finishes, hangs or allocates."""
+
+import csv
+import os
+import sys
+
+import pytest
+
+from tig_sota import supervise
+
+# the stand-in harness, run as `<binary> <dataset>` in its work directory like the real ones
+HARNESS = f"""#!{sys.executable}
+import os, sys, time
+mode = os.environ["MODE"]
+if mode == "sleep":
+    time.sleep(60)
+if mode == "allocate":
+    block = bytearray(400 << 20)
+    time.sleep(60)
+if mode == "exit":
+    sys.exit(3)
+# "solve": hold some memory for a while, then report the instance
+block = bytearray(64 << 20)
+start = time.process_time()
+while time.process_time() - start < 0.2:
+    pass
+os.makedirs("evaluations")
+instance = os.listdir(sys.argv[1])[0]
+with open(os.path.join("evaluations", "c003_" + sys.argv[1] + "_algo.csv"), "w") as f:
+    f.write("instance,knapsack_value,baseline_value,gap_percent,time_milliseconds,status\\n")
+    f.write(instance + ",990,1000,1.0,200,solved\\n")
+"""
+
+
+@pytest.fixture
+def harness(tmp_path):
+    path = tmp_path / "harness"
+    path.write_text(HARNESS)
+    path.chmod(0o755)
+    instance = tmp_path / "data" / "a.txt"
+    instance.parent.mkdir()
+    instance.write_text("")
+
+    def run(mode, **limits):
+        env = {**os.environ, "MODE": mode}
+        rows = supervise.run_instance(str(path), "knapsack", "QKP", str(instance), env=env, **limits)
+        assert len(rows) == 1
+        return dict(zip(supervise.header("knapsack"), rows[0]))
+
+    return run
+
+
+def test_solved(harness):
+    row = harness("solve", timeout=30, memory_limit=1 << 30)
+    assert (row["instance"], row["knapsack_value"], row["status"]) == ("a.txt", "990", "solved")
+
+
+def test_timeout(harness):
+    row = harness("sleep", timeout=0.5)
+    assert (row["instance"], row["status"]) == ("a.txt", "timeout")
+    assert row["knapsack_value"] == ""
+    assert 500 <= row["time_milliseconds"] < 30000
+
+
+def test_oom(harness):
+    row = harness("allocate", timeout=30, memory_limit=100 << 20)
+    assert row["status"] == "oom"
+
+
+def test_crash(harness):
+    assert harness("exit")["status"] == "error: exit code 3"
+
+
+def test_evaluate_dataset(harness, tmp_path, monkeypatch):
+    monkeypatch.setenv("MODE", "exit")
+    counts = supervise.evaluate_dataset(
+        str(tmp_path / "harness"), "knapsack", "algo", "QKP", str(tmp_path / "out.csv"),
+        dataset_dir=str(tmp_path / "data"),
+    )
+    assert counts == {"error": 1}
+    with open(tmp_path / "out.csv", newline="") as f:
+        assert next(csv.reader(f)) == supervise.header("knapsack")
+
+
+def test_telemetry(harness):
+    row = harness("solve", timeout=30)
+    wall, user, system, peak_rss, threads = (row[name] for name in supervise.TELEMETRY_HEADER)
+    # the harness spins for 200 ms of CPU time while holding a 64 MiB block
+    assert user + system >= 150
+    assert wall >= user
+    assert peak_rss >= 64 << 20
+    assert threads >= 1
+
+
+def test_telemetry_of_killed_instance(harness):
+    row = harness("sleep", timeout=0.5)
+    assert row["wall_milliseconds"] >= 500
+    assert row["user_milliseconds"] < row["wall_milliseconds"]
@@ -0,0 +1,100 @@
+"""Variant ladders are identical wherever they are built, and only rebuilt when stale."""
+
+import os
+
+import numpy as np
+import pytest
+
+from tig_sota import manifest, variants
+from tig_sota.datasets.knapsack import qkp_binary, qkp_convert
+from tig_sota.datasets.vector_search import vector_bin
+
+HG_HEADER = """{name}
+
+VEHICLE
+NUMBER     CAPACITY
+  25          200
+
+CUSTOMER
+CUST NO.  XCOORD.   YCOORD.    DEMAND   READY TIME  DUE DATE   SERVICE TIME
+
+"""
+
+
+def write_hg(path, num_customers, rng):
+    lines = [f"{0:5d} {50:9d} {50:9d} {0:9d} {0:9d} {100000:9d} {0:9d}"]
+    for i in range(1, num_customers + 1):
+        x, y = rng.integers(0, 100, size=2)
+        lines.append(f"{i:5d} {x:9d} {y:9d} {int(rng.integers(1, 30)):9d} {0:9d} {5000:9d} {10:9d}")
+    path.write_text(HG_HEADER.format(name=path.stem) + "\n".join(lines) + "\n")
+
+
+def write_qkp(path, num_items, rng):
+    rows, cols = np.triu_indices(num_items)
+    keep = (rows == cols) | (rng.random(len(rows)) < 0.3)
+    weights = rng.integers(1, 50, size=num_items)
+    qkp_convert.write_instance(str(path), num_items, rows[keep], cols[keep], rng.integers(1, 100, size=keep.sum()),
+                               weights, int(weights.sum() // 3), 1)
+
+
+def write_vectors(path, rng):
+    database = rng.normal(size=(300, 8)).astype(np.float32)
+    queries = rng.normal(size=(20, 8)).astype(np.float32)
+    vector_bin.write_bin(str(path), database, queries, np.zeros(20, dtype=np.uint32))
+
+
+DATASETS = {
+    "vehicle_routing": ("HG", [("a.txt", lambda path, rng: write_hg(path, 40, rng)),
+                               ("small.txt", lambda path, rng: write_hg(path, 10, rng))], [8, 20]),
+    "knapsack": ("QKP", [("a.txt", lambda path, rng: write_qkp(path, 30, rng)),
+                         ("b.txt", lambda path, rng: write_qkp(path, 30, rng))], [10, 25]),
+    "vector_search": ("SIFT", [("a.bin", lambda path, rng: write_vectors(path, rng))], [50, 120]),
+}
+
+
+def write_dataset(data_dir, challenge):
+    dataset, files, _ = DATASETS[challenge]
+    directory = data_dir / dataset
+    directory.mkdir(parents=True)
+    rng = np.random.default_rng(0)
+    for name, write in files:
+        write(directory / name, rng)
+
+
+def variant_files(out_dir):
+    """{name: bytes} of the files of a variant, its manifest excluded"""
+    return {
+        name: open(os.path.join(out_dir, name), "rb").read()
+        for name in sorted(os.listdir(out_dir)) if name != manifest.FILENAME
+    }
+
+
+@pytest.mark.parametrize("challenge", list(DATASETS))
+def test_ladder_is_deterministic(tmp_path, challenge):
+    dataset, _, sizes = DATASETS[challenge]
+    ladders = []
+    for data_dir in (tmp_path / "one", tmp_path / "two"):
+        write_dataset(data_dir, challenge)
+        out_dirs = variants.build_ladder(challenge, dataset, sizes, data_dir=str(data_dir), workers=2)
+        assert [os.path.basename(d) for d in out_dirs] == [variants.variant_name(dataset, s) for s in sizes]
+        ladders.append([variant_files(d) for d in out_dirs])
+    assert ladders[0] == ladders[1]
+    # only the largest instances are sources
+    assert all(name.startswith(("a.", "b.", "baselines")) for name in ladders[0][0])
+
+    other = variants.build_ladder(challenge, dataset, sizes[:1], seed=1, data_dir=str(tmp_path / "one"))
+    if challenge != "knapsack":
+        # knapsack prefixes do not depend on the seed
+        assert variant_files(other[0]) != ladders[0][0]
+
+
+def test_variants_are_reused(tmp_path, capsys):
+    write_dataset(tmp_path, "knapsack")
+    (out_dir,) = variants.build_ladder("knapsack", "QKP", [10], data_dir=str(tmp_path), workers=1)
+    assert "0 up to date, 2 to build" in capsys.readouterr().out
+    built = variant_files(out_dir)
+    variants.build_ladder("knapsack", "QKP", [10], data_dir=str(tmp_path), workers=1)
+    assert "2 up to date, 0 to build" in capsys.readouterr().out
+    assert variant_files(out_dir) == built
+    prefix = qkp_binary.read_qkp(os.path.join(out_dir, "a.txt"))
+    assert prefix.num_items == 10 and prefix.ofv > 0
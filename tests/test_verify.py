@@ -0,0 +1,74 @@
+"""SAT assignment checks, and the choice between a .cnf and its .cnfb."""
+
+import os
+
+import numpy as np
+import pytest
+
+from tig_sota.datasets.satisfiability import cnf_binary, verify
+
+
+def write_cnf(path, clauses, num_variables=3):
+    path.write_text(f"p cnf {num_variables} {len(clauses)}\n" + "".join(f"{c} 0\n" for c in clauses))
+
+
+def brute_force(clauses, assignments):
+    """Unsatisfied clauses of each assignment, clause by clause"""
+    return [
+        sum(not any(assignment[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+        for assignment in assignments
+    ]
+
+
+@pytest.mark.parametrize("gather_size", [verify.GATHER_SIZE, 16])
+def test_empty_clauses(tmp_path, monkeypatch, gather_size):
+    # a small gather size checks the assignments a few at a time
+    monkeypatch.setattr(verify, "GATHER_SIZE", gather_size)
+    rng = np.random.default_rng(0)
+    clauses = [[int(v) * int(rng.choice([-1, 1])) for v in rng.integers(1, 7, size=rng.integers(1, 4))]
+               for _ in range(30)]
+    # leading, consecutive and trailing empty clauses
+    for index in (0, 10, 11, 32):
+        clauses.insert(index, [])
+    path = tmp_path / "a.cnf"
+    write_cnf(path, [" ".join(map(str, clause)) for clause in clauses], num_variables=6)
+    assignments = rng.random((25, 6)) < 0.5
+    expected = brute_force(clauses, assignments)
+    assert verify.unsatisfied_counts(verify.load(str(path)), assignments).tolist() == expected
+    cnf_binary.convert(str(path))
+    instance = verify.load(str(path))
+    assert instance.num_clauses == 34
+    assert verify.unsatisfied_counts(instance, assignments).tolist() == expected
+    unsatisfied = verify.unsatisfied_clauses(instance, assignments)
+    assert unsatisfied[:, [0, 10, 11, 32]].all()
+
+
+def test_only_empty_clauses(tmp_path):
+    path = tmp_path / "a.cnf"
+    write_cnf(path, ["", ""])
+    assert verify.unsatisfied_counts(verify.load(str(path)), [[True, True, True]]).tolist() == [2]
+
+
+def test_read_assignments(tmp_path):
+    path = tmp_path / "a.sol"
+    path.write_text("c comment\ns SATISFIABLE\nv 1 -2\nv 3 0\n-1 2 0\n2")
+    assert verify.read_assignments(str(path), 3).tolist() == [
+        [True, False, True], [False, True, False], [False, True, False]
+    ]
+    path.write_text("1 4 0\n")
+    with pytest.raises(ValueError):
+        verify.read_assignments(str(path), 3)
+
+
+def test_stale_sidecar_ignored(tmp_path):
+    path = tmp_path / "a.cnf"
+    write_cnf(path, ["1 -2", "2 3"])
+    cnf_binary.convert(str(path))
+    assert verify.load(str(path)).num_clauses == 2
+    cnfb_mtime = os.stat(cnf_binary.cnfb_path(str(path))).st_mtime_ns
+    # the .cnf edited after its .cnfb was written
+    write_cnf(path, ["1 -2", "2 3", "-1"])
+    os.utime(path, ns=(cnfb_mtime + 10 ** 9, cnfb_mtime + 10 ** 9))
+    instance = verify.load(str(path))
+    assert instance.num_clauses == 3
+    assert verify.unsatisfied_counts(instance, [[True, False, False]]).tolist() == [2]
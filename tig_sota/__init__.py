@@ -0,0 +1 @@
+"""Shared tooling for the tig-SOTA-metrics evaluators."""
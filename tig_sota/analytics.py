@@ -0,0 +1,140 @@
+"""Vectorized comparisons of algorithms over a whole table of results.
+
+Every function takes a long DataFrame with one row per (algorithm, instance) result, as
+returned by `results.load`, and works on whole columns at once (no per-row Python).
+Results that are not a ``solution`` (no or invalid solution, timeouts, ...) carry a
+placeholder gap of 0 in the harness CSVs, so they count as unsolved here.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .datasets import REPO_ROOT
+
+SOLVED = "solution"
+
+# keys identifying an instance across algorithms
+INSTANCE_KEYS = ["dataset", "instance"]
+
+
+def solved(df):
+    return df["status"].eq(SOLVED)
+
+
+def time_seconds(df):
+    """Harness-reported solve time, in seconds, whatever unit the challenge records it in"""
+    if "time_microseconds" in df and df["time_microseconds"].notna().any():
+        return df["time_microseconds"] / 1e6
+    return df["time_milliseconds"] / 1e3
+
+
+def instance_stem(instances):
+    return instances.str.replace(r"\.[^.]*$", "", regex=True)
+
+
+def load_sota(challenge, datasets, data_dir=None):
+    """SOTA results of `datasets` as (dataset, instance, algorithm, gap_percent, time_seconds) rows,
+    read from each dataset's ``sota.csv``"""
+    data_dir = data_dir or os.path.join(REPO_ROOT, f"{challenge}_evaluator", "data")
+    frames = []
+    for dataset in datasets:
+        df = pd.read_csv(os.path.join(data_dir, dataset, "sota.csv"))
+        if "algorithm" in df:
+            # knapsack: one row per (instance, algorithm)
+            df = df.rename(columns={"gap": "gap_percent", "runtime": "time_seconds"})
+        else:
+            # vehicle routing: one SOTA algorithm, with its RPD against the baseline solution
+            df = df.assign(algorithm="HGSADC", gap_percent=df["rpd"], time_seconds=np.nan)
+        df["dataset"] = dataset
+        df["instance"] = instance_stem(df["instance"].astype(str))
+        frames.append(df[["dataset", "instance", "algorithm", "gap_percent", "time_seconds"]])
+    return pd.concat(frames, ignore_index=True)
+
+
+def instance_gaps(df, sota):
+    """`df` with the best SOTA gap of each instance (``sota_gap_percent``) and the difference
+    to it in percentage points (``gap_to_sota``, negative where the algorithm beats SOTA).
+    Unsolved results get a NaN gap."""
+    best = sota.groupby(INSTANCE_KEYS, as_index=False)["gap_percent"].min()
+    best = best.rename(columns={"gap_percent": "sota_gap_percent"})
+    df = df.assign(instance=instance_stem(df["instance"]), gap_percent=df["gap_percent"].where(solved(df)))
+    df = df.merge(best, on=INSTANCE_KEYS, how="left")
+    df["gap_to_sota"] = df["gap_percent"] - df["sota_gap_percent"]
+    return df
+
+
+def shifted_geometric_mean(df, value, by="algorithm", shift=1.0):
+    """exp(mean(log(x + shift))) - shift of `value` per `by` group. The shift keeps values near
+    zero (e.g. gaps or times of easy instances) from dominating; values must exceed -shift.
+    Unsolved results and NaNs are ignored."""
+    logs = np.log(df[value].where(solved(df)) + shift)
+    return np.exp(logs.groupby([df[key] for key in np.atleast_1d(by)]).mean()) - shift
+
+
+def _metric_matrix(df, value, solver, shift):
+    """(instances x solvers) matrix of `value`, with unsolved and missing results as inf"""
+    metric = df[value].where(solved(df) & df[value].notna(), np.inf) + shift
+    matrix = (
+        df.assign(_metric=metric)
+          .pivot_table(index=INSTANCE_KEYS, columns=solver, values="_metric", aggfunc="min")
+    )
+    return matrix.fillna(np.inf)
+
+
+def performance_profile(df, value="time_milliseconds", solver="algorithm", taus=None, shift=0.0):
+    """Dolan-More performance profile: for each solver, the fraction of instances on which its
+    `value` is within a factor tau of the best solver's, for every tau in `taus` (by default
+    every distinct finite ratio). Instances no solver solved are left out.
+
+    Lower values are better. Use `shift` for metrics that can be zero, such as gaps."""
+    matrix = _metric_matrix(df, value, solver, shift)
+    values = matrix.to_numpy()
+    best = values.min(axis=1, keepdims=True)
+    values, best = values[np.isfinite(best[:, 0])], best[np.isfinite(best[:, 0])]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(values == best, 1.0, values / best)
+    ratios.sort(axis=0)
+    if taus is None:
+        taus = np.unique(np.concatenate([[1.0], ratios[np.isfinite(ratios)]]))
+    taus = np.asarray(taus, dtype=float)
+    counts = np.stack([np.searchsorted(ratios[:, i], taus, side="right") for i in range(ratios.shape[1])], axis=1)
+    return pd.DataFrame(counts / max(len(ratios), 1), index=pd.Index(taus, name="tau"), columns=matrix.columns)
+
+
+def time_to_target(df, target, gap="gap_percent", solver="algorithm", times=None):
+    """Time-to-target curves: for each solver, the fraction of instances it solved to within
+    `target` of `gap` within each time (in seconds) of `times` (by default every distinct
+    time at which an instance reached the target)."""
+    reached = solved(df) & (df[gap] <= target)
+    seconds = time_seconds(df).where(reached, np.inf)
+    matrix = (
+        df.assign(_seconds=seconds)
+          .pivot_table(index=INSTANCE_KEYS, columns=solver, values="_seconds", aggfunc="min")
+          .fillna(np.inf)
+    )
+    values = np.sort(matrix.to_numpy(), axis=0)
+    if times is None:
+        times = np.unique(values[np.isfinite(values)])
+    times = np.asarray(times, dtype=float)
+    counts = np.stack([np.searchsorted(values[:, i], times, side="right") for i in range(values.shape[1])], axis=1)
+    return pd.DataFrame(counts / max(len(values), 1), index=pd.Index(times, name="seconds"), columns=matrix.columns)
+
+
+def by_round(df, top_algos, by, value="gap_percent"):
+    """Mean `value` over the solved results of each round's top-earning algorithm per `by`
+    group, from `top_algos` [(round, algorithm)], sorted by group and round. A group the
+    algorithm solved nothing in gets NaN."""
+    by = list(np.atleast_1d(by))
+    # unsolved results carry a placeholder gap of 0, which would flatter the mean
+    values = df.assign(**{value: df[value].where(solved(df))})
+    means = values.groupby(by + ["algorithm"], as_index=False)[value].mean()
+    rounds = pd.DataFrame(list(top_algos), columns=["round", "algorithm"])
+    return means.merge(rounds, on="algorithm").sort_values(by + ["round"], ignore_index=True)
+
+
+def algorithm_changes(df, by):
+    """Rows of a `by_round` table where the top-earning algorithm differs from the previous round's"""
+    previous = df.groupby(by)["algorithm"].shift()
+    return df[df["algorithm"].ne(previous)]
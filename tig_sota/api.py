@@ -0,0 +1,111 @@
+"""Client for the TIG mainnet API, caching completed rounds on disk.
+
+The emissions of a round never change once the round is over, so each completed round is
+fetched once and stored under ``api/<host>/round-emissions/<round>.json`` in the download
+cache directory. The current block, the algorithms and the current round are always
+fetched fresh. Uncached rounds are fetched concurrently over one keep-alive session.
+"""
+
+import concurrent.futures
+import json
+import os
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import cache
+from .datasets import CHALLENGE_IDS
+
+API_URL = os.environ.get("TIG_API_URL", "https://mainnet-api.tig.foundation")
+
+# first round of each challenge's current (Rust) implementation
+START_ROUNDS = {"c001": 25, "c002": 64, "c003": 44, "c004": 74}
+
+# emissions are reported in the token's smallest unit
+TOKEN_DECIMALS = 18
+
+
+class TIGClient:
+    def __init__(self, base_url=API_URL, cache_root=None, max_workers=8, retries=3, backoff=1.0, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        host = urllib.parse.urlparse(self.base_url).netloc.replace(":", "_")
+        self.cache_dir = os.path.join(cache_root or os.path.join(cache.DEFAULT_ROOT, "api"), host)
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, endpoint, **params):
+        """JSON response of ``<base_url>/<endpoint>``, retrying failed attempts with exponential backoff"""
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.retries):
+            try:
+                resp = self.session.get(url, params=params, timeout=self.timeout)
+                resp.raise_for_status()
+                return resp.json()
+            except (requests.RequestException, ValueError) as e:
+                if attempt + 1 == self.retries:
+                    raise
+                print(f"Error fetching {url} {params}: {e}")
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def block(self):
+        return self.get("get-block")["block"]
+
+    def current_round(self, block=None):
+        return (block or self.block())["details"]["round"]
+
+    def algorithms(self, block_id):
+        """{algorithm id: algorithm} as of `block_id`"""
+        return {x["id"]: x for x in self.get("get-algorithms", block_id=block_id)["algorithms"]}
+
+    def round_emissions(self, round, completed=False):
+        """Emissions of `round`, read from and (if `completed`) stored in the cache"""
+        path = os.path.join(self.cache_dir, "round-emissions", f"{round}.json")
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        data = self.get("get-round-emissions", round=round)
+        if completed:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        return data
+
+    def rounds_emissions(self, rounds, current_round):
+        """{round: emissions} of `rounds`, fetching uncached ones `max_workers` at a time"""
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {r: executor.submit(self.round_emissions, r, r < current_round) for r in rounds}
+            return {r: future.result() for r, future in futures.items()}
+
+    def top_algorithms(self, challenge, start=None, end=None):
+        """[(round, algorithm name, earnings in TIG)] of the top-earning algorithm of `challenge`
+        (a challenge id such as ``c001``, or its name) in each round from `start` (the
+        challenge's `START_ROUNDS` entry by default) up to, excluding, `end` (the current
+        round by default). Rounds without any algorithm of the challenge are left out."""
+        prefix = CHALLENGE_IDS.get(challenge, challenge)
+        block = self.block()
+        end = self.current_round(block) if end is None else end
+        start = START_ROUNDS[prefix] if start is None else start
+        algorithms = self.algorithms(block["id"])
+        emissions = self.rounds_emissions(range(start, end), self.current_round(block))
+
+        top = []
+        for r, data in emissions.items():
+            earnings = [(a_id, int(amount) / 10 ** TOKEN_DECIMALS)
+                        for a_id, amount in data["algorithms"].items() if a_id.startswith(prefix)]
+            if not earnings:
+                continue
+            a_id, amount = max(earnings, key=lambda x: x[1])
+            top.append((r, algorithms[a_id]["details"]["name"], amount))
+        return top
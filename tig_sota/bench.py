@@ -0,0 +1,298 @@
+"""Offline micro-benchmarks of the dataset conversion pipeline.
+
+Every stage runs on synthetic fixtures written to a scratch directory, so no network access
+or downloaded dataset is needed:
+
+* ``qkp_parse`` / ``qkp_edges`` / ``qkp_write``: a Standard QKP style upper-triangular
+  instance parsed, turned into edges and written as .txt and .bin (`qkp_convert`)
+* ``fvecs``: a SIFT style .fvecs blob decoded into .bin vectors (`sift.extract_vectors`)
+* ``hg_sol`` / ``hg_dist``: HG style ``.sol`` files indexed into ``baselines.csv``
+  (`hg_baseline`) and a ``.txt`` instance turned into its distance matrix (`hg_distances`)
+* ``sota_csv``: a QKP ``sota.csv`` written from parsed SOTA tables (`qkp_sota`)
+* ``cnf``: a random 3-SAT instance converted to .cnfb (`cnf_binary`)
+
+Each stage is timed as the best of a few runs, then run once more under `tracemalloc` for
+its peak allocated memory (Python and NumPy allocations; memory-mapped files and the page
+cache are not counted). Results are compared against a stored baseline, written with
+``python -m tig_sota bench --save``; throughput or peak memory worse than the baseline by
+more than the tolerance is reported as a regression. The baseline records the host and
+software it was measured with; timings depend on the host, so throughput is only compared
+against a baseline recorded on the same one, while peak memory is compared everywhere.
+"""
+
+import collections
+import gc
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from .datasets import REPO_ROOT
+from .datasets.knapsack import qkp_convert, qkp_sota
+from .datasets.satisfiability import cnf_binary
+from .datasets.vector_search import sift
+from .datasets.vehicle_routing import hg_baseline, hg_distances
+
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+# relative slowdown or memory growth over the baseline reported as a regression
+TOLERANCE = 0.3
+# peak memory growth ignored regardless of the tolerance, for stages that allocate next to nothing
+MEMORY_SLACK = 1 << 20
+SEED = 0
+
+# (stage name, function to time, rows processed, bytes processed)
+Stage = collections.namedtuple("Stage", ["name", "run", "rows", "bytes"])
+Result = collections.namedtuple("Result", ["stage", "seconds", "rows", "bytes", "peak_bytes"])
+Regression = collections.namedtuple("Regression", ["stage", "metric", "baseline", "current"])
+Baseline = collections.namedtuple("Baseline", ["environment", "stages"])
+
+# environment keys identifying the host, as opposed to the software versions
+HOST_KEYS = ("host", "machine", "processor", "cpus")
+
+
+# --- fixtures
+
+
+def write_lines(path, lines):
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return os.path.getsize(path)
+
+
+def qkp_stages(scratch, num_items):
+    """Stages converting a Standard QKP style instance of `num_items` items"""
+    rng = np.random.default_rng([SEED, num_items])
+    path = os.path.join(scratch, f"qkp_{num_items}.txt")
+    quad = rng.integers(0, 101, size=num_items * (num_items - 1) // 2) * (rng.random(num_items * (num_items - 1) // 2) < 0.5)
+    row_starts = np.cumsum(np.arange(num_items - 1, 0, -1)) - np.arange(num_items - 1, 0, -1)
+    weights = rng.integers(1, 51, size=num_items)
+    size = write_lines(path, [
+        f"qkp_{num_items}", str(num_items), " ".join(map(str, rng.integers(0, 101, size=num_items))),
+        *(" ".join(map(str, quad[start:start + num_items - 1 - i].tolist())) for i, start in enumerate(row_starts)),
+        "", "0", str(int(weights.sum() // 2)), " ".join(map(str, weights)),
+    ])
+
+    def parse():
+        with open(path) as f:
+            lines = f.read().split("\n")
+        return qkp_convert.parse_triangular(lines[2:3 + num_items], num_items)
+
+    linear, quad = parse()
+    rows, cols, vals = qkp_convert.triangular_edges(linear, quad, num_items)
+    out_path = os.path.join(scratch, f"qkp_{num_items}_out.txt")
+    return [
+        Stage(f"qkp_parse/{num_items}", parse, len(quad), size),
+        Stage(f"qkp_edges/{num_items}", lambda: qkp_convert.triangular_edges(linear, quad, num_items),
+              len(quad), linear.nbytes + quad.nbytes),
+        Stage(f"qkp_write/{num_items}", lambda: qkp_convert.write_instance(
+            out_path, num_items, rows, cols, vals, weights, int(weights.sum() // 2), 0,
+        ), len(vals), rows.nbytes + cols.nbytes + vals.nbytes),
+    ]
+
+
+def fvecs_stages(scratch, num_vectors, dims=128):
+    """Stage decoding an .fvecs blob of `num_vectors` vectors"""
+    rng = np.random.default_rng([SEED, num_vectors])
+    records = np.empty((num_vectors, dims + 1), dtype="<f4")
+    records[:, 1:] = rng.random((num_vectors, dims), dtype=np.float32)
+    records.view("<i4")[:, 0] = dims
+    blob = records.tobytes()
+    out_path = os.path.join(scratch, "vectors.bin")
+
+    def decode():
+        with open(out_path, "wb") as out:
+            sift.extract_vectors(io.BytesIO(blob), len(blob), out)
+
+    return [Stage(f"fvecs/{num_vectors}", decode, num_vectors, len(blob))]
+
+
+def hg_stages(scratch, num_customers, num_instances=50):
+    """Stages indexing `num_instances` HG style .sol files and computing the distance matrix of
+    one .txt instance, all of `num_customers` customers"""
+    rng = np.random.default_rng([SEED, num_customers])
+    dataset_dir = os.path.join(scratch, f"hg_{num_customers}")
+    os.makedirs(dataset_dir, exist_ok=True)
+    sol_bytes = 0
+    for i in range(num_instances):
+        customers = rng.permutation(np.arange(1, num_customers + 1))
+        routes = np.array_split(customers, max(1, num_customers // 10))
+        sol_bytes += write_lines(os.path.join(dataset_dir, f"I_{i}.sol"), [
+            *(f"Route #{r + 1}: {' '.join(map(str, route))}" for r, route in enumerate(routes)),
+            f"Cost {rng.random() * 1e5:.1f}",
+        ])
+    txt_path = os.path.join(dataset_dir, "I_0.txt")
+    x, y = rng.integers(0, 1000, size=(2, num_customers + 1))
+    ready = rng.integers(0, 500, size=num_customers + 1)
+    txt_bytes = write_lines(txt_path, [
+        "I_0", "", "VEHICLE", "NUMBER     CAPACITY", f"  {num_customers // 10}         200", "", "CUSTOMER",
+        "CUST NO.  XCOORD.   YCOORD.    DEMAND   READY TIME  DUE DATE   SERVICE TIME", "",
+        *(f"{i:5d} {x[i]:9d} {y[i]:9d} {10:9d} {ready[i]:9d} {ready[i] + 100:9d} {10:9d}"
+          for i in range(num_customers + 1)),
+    ])
+    return [
+        Stage(f"hg_sol/{num_customers}", lambda: hg_baseline.build_index(dataset_dir), num_instances, sol_bytes),
+        Stage(f"hg_dist/{num_customers}", lambda: hg_distances.write_matrix(txt_path),
+              (num_customers + 1) ** 2, txt_bytes),
+    ]
+
+
+def sota_stages(scratch, num_instances):
+    """Stage writing a QKP sota.csv of `num_instances` instances"""
+    rng = np.random.default_rng([SEED, num_instances])
+    instance_data = {
+        f"{i}.txt": {
+            "gaps": {algo: float(gap) for algo, gap in zip(qkp_sota.SOTA_algos, rng.random(len(qkp_sota.SOTA_algos)))},
+            "runtimes": {algo: float(t) for algo, t in zip(qkp_sota.SOTA_algos, rng.random(len(qkp_sota.SOTA_algos)))},
+        }
+        for i in range(num_instances)
+    }
+    path = os.path.join(scratch, "sota.csv")
+    qkp_sota.write_sota_csv(instance_data, path)
+    return [Stage(f"sota_csv/{num_instances}", lambda: qkp_sota.write_sota_csv(instance_data, path),
+                  num_instances * len(qkp_sota.SOTA_algos), os.path.getsize(path))]
+
+
+def cnf_stages(scratch, num_variables):
+    """Stage converting a random 3-SAT instance of `num_variables` variables at ratio 4.26"""
+    rng = np.random.default_rng([SEED, num_variables])
+    num_clauses = int(num_variables * 4.26)
+    literals = (rng.integers(1, num_variables + 1, size=(num_clauses, 3))
+                * rng.choice([-1, 1], size=(num_clauses, 3)))
+    path = os.path.join(scratch, f"sat_{num_variables}.cnf")
+    size = write_lines(path, [f"p cnf {num_variables} {num_clauses}", *(f"{a} {b} {c} 0" for a, b, c in literals.tolist())])
+    return [Stage(f"cnf/{num_variables}", lambda: cnf_binary.convert(path), num_clauses, size)]
+
+
+# benchmark group -> (fixture sizes, stages of a fixture)
+BENCHMARKS = {
+    "qkp": ([1000, 5000], qkp_stages),
+    "fvecs": ([100000], fvecs_stages),
+    "hg": ([200, 1000], hg_stages),
+    "sota_csv": ([10000], sota_stages),
+    "cnf": ([100000], cnf_stages),
+}
+
+
+# --- measurement
+
+
+def measure(stage, repeat):
+    """`Result` of `stage`: the best time of `repeat` runs, and the peak of one traced run"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        stage.run()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        stage.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(stage.name, min(times), stage.rows, stage.bytes, peak)
+
+
+def run(groups=None, repeat=3, scratch=None):
+    """Results of every stage of the benchmark `groups` (default: all), with fixtures written to
+    `scratch` (default: a temporary directory)"""
+    groups = groups or list(BENCHMARKS)
+    unknown = set(groups) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks {sorted(unknown)}, expected some of {list(BENCHMARKS)}")
+    results = []
+    with tempfile.TemporaryDirectory(dir=scratch) as tmp:
+        for group in groups:
+            sizes, stages = BENCHMARKS[group]
+            for size in sizes:
+                for stage in stages(tmp, size):
+                    results.append(measure(stage, repeat))
+                    print(format_result(results[-1]), flush=True)
+    return results
+
+
+def rates(result):
+    """(rows per second, MB per second) of a `Result`"""
+    return result.rows / result.seconds, result.bytes / result.seconds / 1e6
+
+
+def format_result(result, baseline=None):
+    rows_per_second, mb_per_second = rates(result)
+    line = (f"{result.stage:<18} {rows_per_second:>14,.0f} rows/s {mb_per_second:>9.1f} MB/s "
+            f"{result.peak_bytes / 2 ** 20:>9.1f} MiB peak")
+    if baseline is not None:
+        line += (f"   x{rows_per_second / (baseline['rows'] / baseline['seconds']):.2f} throughput, "
+                 f"x{result.peak_bytes / max(baseline['peak_bytes'], 1):.2f} memory vs baseline")
+    return line
+
+
+# --- baseline
+
+
+def environment():
+    """Host and software versions the benchmarks run with, as recorded in a baseline"""
+    return {
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    baseline = {
+        "environment": environment(),
+        "stages": {r.stage: {"seconds": r.seconds, "rows": r.rows, "bytes": r.bytes, "peak_bytes": r.peak_bytes}
+                   for r in results},
+    }
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def load_baseline(path=BASELINE_PATH):
+    """`Baseline` of a saved baseline: its environment and {stage: {"seconds", "rows", "bytes",
+    "peak_bytes"}}"""
+    with open(path) as f:
+        data = json.load(f)
+    return Baseline(data.get("environment", {}), data["stages"])
+
+
+def environment_differences(baseline, current=None):
+    """{key: (baseline value, current value)} of the environment entries that differ from
+    `baseline`'s (`current` defaults to this environment)"""
+    current = current or environment()
+    return {
+        key: (baseline.environment.get(key), value)
+        for key, value in current.items() if baseline.environment.get(key) != value
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE, current=None):
+    """`Regression`s of `results` against the `Baseline` beyond a relative `tolerance`, comparing
+    throughput in rows per second (so fixtures may change size) and peak memory. Throughput
+    is only compared when the baseline was recorded on the same host as `current` (default:
+    this environment). Stages missing from the baseline are skipped."""
+    same_host = not set(environment_differences(baseline, current)) & set(HOST_KEYS)
+    regressions = []
+    for result in results:
+        if result.stage not in baseline.stages:
+            continue
+        base = baseline.stages[result.stage]
+        base_rate, rate = base["rows"] / base["seconds"], rates(result)[0]
+        if same_host and rate * (1 + tolerance) < base_rate:
+            regressions.append(Regression(result.stage, "rows_per_second", base_rate, rate))
+        if result.peak_bytes > base["peak_bytes"] * (1 + tolerance) + MEMORY_SLACK:
+            regressions.append(Regression(result.stage, "peak_bytes", base["peak_bytes"], result.peak_bytes))
+    return regressions
@@ -0,0 +1,214 @@
+"""Content-addressed, resumable download cache shared by the dataset download scripts.
+
+Downloaded files are stored once under ``objects/<sha256>`` and an index entry under
+``urls/<sha256 of url>.json`` maps each URL to its content hash. Interrupted downloads
+are kept under ``partial/`` and resumed with an HTTP Range request on the next fetch. The
+server's validator of the content (a strong ETag, else its Last-Modified date) is kept
+next to a partial download and sent as ``If-Range``, so if the remote file changed in the
+meantime the server sends it whole and the download restarts from zero. Partial downloads
+without a validator are not resumed.
+
+Expected digests of dataset sources are pinned by URL in ``tig_sota/digests.json`` and
+checked on every download of a pinned URL. ``python -m tig_sota pin-digests`` records the
+digests of the URLs in a cache there, once their contents have been checked. The registry
+ships empty, so checksums are only enforced for the URLs pinned that way (or fetched with an
+explicit `sha256`).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import urllib.parse
+import urllib.request
+
+import requests
+
+CHUNK_SIZE = 1 << 20
+DEFAULT_ROOT = os.environ.get(
+    "TIG_SOTA_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "tig-sota")
+)
+DIGESTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "digests.json")
+# suffix of the file next to a partial download holding the server's validator of its content
+VALIDATOR_SUFFIX = ".validator"
+
+
+def load_digests(path=DIGESTS_PATH):
+    """{url: sha256} of the pinned source digests"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_digests(digests, path=DIGESTS_PATH):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(dict(sorted(digests.items())), f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+class ChecksumError(ValueError):
+    pass
+
+
+class DownloadCache:
+    def __init__(self, root=DEFAULT_ROOT, session=None, digests=None):
+        """`digests` ({url: sha256}, default: the pinned ``digests.json``) are checked whenever
+        one of their URLs is fetched without an explicit `sha256`."""
+        self.root = root
+        self.session = session or requests.Session()
+        self.digests = load_digests() if digests is None else digests
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        for sub in ("objects", "urls", "partial"):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+
+    def fetch(self, url, sha256=None, **request_kwargs):
+        """Return the path of the cached copy of `url`, downloading only the missing bytes.
+
+        If `sha256` is given, or pinned for `url`, the content must match it, and a cached
+        object with that hash is reused without touching the network. Extra keyword
+        arguments (e.g. ``timeout``) are passed to ``requests``.
+        """
+        sha256 = sha256 or self.digests.get(url)
+        if sha256 and os.path.exists(self._object_path(sha256)):
+            return self._object_path(sha256)
+        key = hashlib.sha256(url.encode()).hexdigest()
+        with self._lock(key):
+            entry = self._read_entry(key)
+            if entry and (not sha256 or entry["sha256"] == sha256):
+                path = self._object_path(entry["sha256"])
+                if os.path.exists(path) and os.path.getsize(path) == entry["size"]:
+                    return path
+
+            part = os.path.join(self.root, "partial", key)
+            if urllib.parse.urlparse(url).scheme in ("http", "https"):
+                digest = self._download_http(url, part, **request_kwargs)
+            else:
+                digest = self._download_urllib(url, part)
+            if sha256 and digest != sha256:
+                self._discard_partial(part)
+                raise ChecksumError(f"{url}: expected sha256 {sha256}, got {digest}")
+
+            path = self._object_path(digest)
+            size = os.path.getsize(part)
+            os.replace(part, path)
+            self._discard_partial(part)
+            self._write_entry(key, {"url": url, "sha256": digest, "size": size})
+            return path
+
+    def digest(self, url):
+        """SHA-256 of `url` if known without downloading it: pinned, or of a cached copy"""
+        if url in self.digests:
+            return self.digests[url]
+        entry = self._read_entry(hashlib.sha256(url.encode()).hexdigest())
+        if entry and os.path.exists(self._object_path(entry["sha256"])):
+            return entry["sha256"]
+        return None
+
+    def cached(self):
+        """{url: sha256} of every URL in the cache whose object is present"""
+        cached = {}
+        for name in os.listdir(os.path.join(self.root, "urls")):
+            entry = self._read_entry(name[:-len(".json")]) if name.endswith(".json") else None
+            if entry and os.path.exists(self._object_path(entry["sha256"])):
+                cached[entry["url"]] = entry["sha256"]
+        return cached
+
+    def read_bytes(self, url, sha256=None, **request_kwargs):
+        with open(self.fetch(url, sha256, **request_kwargs), "rb") as f:
+            return f.read()
+
+    def copy(self, url, dest, sha256=None, **request_kwargs):
+        shutil.copyfile(self.fetch(url, sha256, **request_kwargs), dest)
+        return dest
+
+    def _download_http(self, url, part, **request_kwargs):
+        digest = hashlib.sha256()
+        validator = self._read_validator(part)
+        # without a validator there is no telling whether the partial bytes are still current
+        offset = os.path.getsize(part) if validator and os.path.exists(part) else 0
+        # identity encoding so Range offsets refer to the bytes we store
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            # the server only sends the range if the content is unchanged, and all of it otherwise
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        with self.session.get(url, headers=headers, stream=True, **request_kwargs) as resp:
+            if offset and resp.status_code == 416:
+                # stale partial file no longer lines up with the remote content
+                self._discard_partial(part)
+                return self._download_http(url, part, **request_kwargs)
+            resp.raise_for_status()
+            if offset and resp.status_code == 206:
+                with open(part, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                mode = "ab"
+            else:
+                mode = "wb"
+                self._write_validator(part, resp.headers)
+            with open(part, mode) as f:
+                for chunk in resp.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def _download_urllib(self, url, part):
+        # e.g. ftp:// where resuming is not supported
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url) as resp, open(part, "wb") as f:
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                f.write(chunk)
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_validator(part):
+        try:
+            with open(part + VALIDATOR_SUFFIX) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write_validator(part, headers):
+        # weak ETags cannot be used in If-Range
+        etag = headers.get("ETag")
+        validator = etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+        if validator:
+            with open(part + VALIDATOR_SUFFIX, "w") as f:
+                f.write(validator)
+        elif os.path.exists(part + VALIDATOR_SUFFIX):
+            os.remove(part + VALIDATOR_SUFFIX)
+
+    @staticmethod
+    def _discard_partial(part):
+        for path in (part, part + VALIDATOR_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _object_path(self, sha256):
+        return os.path.join(self.root, "objects", sha256)
+
+    def _read_entry(self, key):
+        try:
+            with open(os.path.join(self.root, "urls", f"{key}.json")) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_entry(self, key, entry):
+        path = os.path.join(self.root, "urls", f"{key}.json")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def _lock(self, key):
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
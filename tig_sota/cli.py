@@ -0,0 +1,212 @@
+"""Command line entry point: ``python -m tig_sota <command> ...``"""
+
+import argparse
+import os
+import sys
+
+
+def fetch(args):
+    from . import datasets
+
+    names = list(datasets.DATASETS[args.challenge]) if args.all else args.datasets
+    if not names:
+        sys.exit(f"No datasets given, choose from {list(datasets.DATASETS[args.challenge])} or pass --all")
+    failures = datasets.build(
+        args.challenge, names,
+        data_dir=args.data_dir, jobs=args.jobs or len(names), workers=args.workers, fetch_workers=args.fetch_workers,
+        verify=args.verify, force=args.force,
+    )
+    if failures:
+        sys.exit(f"Failed to build: {', '.join(sorted(failures))}")
+
+
+def pin_digests(args):
+    from . import cache
+
+    digests = cache.load_digests()
+    cached = cache.DownloadCache(args.cache or cache.DEFAULT_ROOT, digests={}).cached()
+    changed = sorted(url for url, sha256 in cached.items() if digests.get(url, sha256) != sha256)
+    if changed and not args.replace:
+        sys.exit(f"Cached content differs from the pinned digest of: {', '.join(changed)} (pass --replace to repin)")
+    added = sorted(set(cached) - set(digests))
+    digests.update(cached)
+    cache.save_digests(digests)
+    print(f"Pinned {len(added)} new and {len(changed)} changed digests in {cache.DIGESTS_PATH}")
+
+
+def import_results(args):
+    from . import results
+
+    root = args.root or results.DEFAULT_ROOT
+    written = results.import_paths(args.paths, root=root)
+    print(f"Imported {len(written)} evaluation files into {root}")
+
+
+def evaluate(args):
+    from .evaluate import evaluate
+    from .supervise import parse_size
+
+    failures = evaluate(
+        args.challenge, args.algorithms, datasets=args.datasets,
+        workers=args.workers, threads=args.threads, build_workers=args.build_workers,
+        timeout=args.timeout, memory_limit=args.memory_limit and parse_size(args.memory_limit),
+        supervised=args.supervised, shared_target=args.shared_target,
+    )
+    if failures:
+        sys.exit(f"Failed: {', '.join(sorted(map(str, failures)))}")
+
+
+def ground_truth(args):
+    from .datasets.vector_search import ground_truth
+
+    failed = []
+    for path in args.paths:
+        if args.write:
+            changed = ground_truth.regenerate(path, workers=args.workers)
+            print(f"{path}: rewrote nearest neighbours, {changed} changed")
+            continue
+        wrong, _ = ground_truth.verify(path, workers=args.workers)
+        print(f"{path}: {len(wrong)} queries with a wrong nearest neighbour")
+        if len(wrong):
+            failed.append(path)
+    if failed:
+        sys.exit(f"Wrong ground truth in: {', '.join(failed)}")
+
+
+def audit(args):
+    import concurrent.futures
+    import importlib
+
+    from . import solutions
+
+    scorer = importlib.import_module(args.scorer, __package__)
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as executor:
+        results = scorer.audit(args.dataset_dir, args.solutions_dir, executor=executor)
+    failed = solutions.report(results, scorer.summary)
+    if failed:
+        sys.exit(f"{args.failure} for: {', '.join(failed)}")
+
+
+def variants(args):
+    from .variants import build_ladder
+
+    out_dirs = build_ladder(
+        args.challenge, args.dataset, args.sizes, seed=args.seed, data_dir=args.data_dir,
+        workers=args.workers, force=args.force,
+    )
+    print(f"Variants: {', '.join(os.path.basename(d) for d in out_dirs)}")
+
+
+def bench(args):
+    from . import bench
+
+    path = args.baseline or bench.BASELINE_PATH
+    results = bench.run(args.benchmarks, repeat=args.repeat)
+    if args.save:
+        bench.save_baseline(results, path)
+        print(f"Saved baseline to {path}")
+        return
+    if not os.path.exists(path):
+        print(f"No baseline at {path}, record one with --save")
+        return
+    baseline = bench.load_baseline(path)
+    differences = bench.environment_differences(baseline)
+    print(f"\nAgainst {path}:")
+    for key, (recorded, current) in differences.items():
+        print(f"WARNING: baseline {key} {recorded!r}, now {current!r}")
+    if set(differences) & set(bench.HOST_KEYS):
+        print("Baseline recorded on another host: comparing peak memory only, record one here with --save")
+    for result in results:
+        print(bench.format_result(result, baseline.stages.get(result.stage)))
+    tolerance = bench.TOLERANCE if args.tolerance is None else args.tolerance
+    regressions = bench.compare(results, baseline, tolerance=tolerance)
+    if regressions:
+        sys.exit("Regressions: " + ", ".join(
+            f"{r.stage} {r.metric} {r.baseline:,.0f} -> {r.current:,.0f}" for r in regressions
+        ))
+
+
+def main(argv=None):
+    from .datasets import DATASETS
+
+    parser = argparse.ArgumentParser(prog="python -m tig_sota")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("fetch", help="download and build benchmark datasets")
+    p.add_argument("challenge", choices=list(DATASETS))
+    p.add_argument("datasets", nargs="*", help="dataset names (default: none, see --all)")
+    p.add_argument("--all", action="store_true", help="build every dataset of the challenge")
+    p.add_argument("--jobs", type=int, default=None, help="datasets built concurrently (default: all selected)")
+    p.add_argument("--workers", type=int, default=os.cpu_count(), help="size of the shared process pool")
+    p.add_argument("--fetch-workers", type=int, default=8, help="concurrent downloads")
+    p.add_argument("--data-dir", default=None, help="output directory (default: <challenge>_evaluator/data)")
+    p.add_argument("--verify", action="store_true", help="re-hash existing outputs instead of only checking their sizes")
+    p.add_argument("--force", action="store_true", help="rebuild every instance, ignoring the manifest")
+    p.set_defaults(func=fetch)
+
+    p = commands.add_parser("evaluate", help="build algorithms once and evaluate them on datasets concurrently")
+    p.add_argument("challenge", choices=list(DATASETS))
+    p.add_argument("algorithms", nargs="+", help="TIG algorithm names, or local algorithms in src/")
+    p.add_argument("--datasets", nargs="+", default=None, help="datasets to evaluate on (default: all downloaded)")
+    p.add_argument("--workers", type=int, default=None, help="concurrent evaluations (default: one per core)")
+    p.add_argument("--threads", type=int, default=None, help="threads per evaluation (default: cores / workers)")
+    p.add_argument("--build-workers", type=int, default=2, help="algorithms compiled concurrently")
+    p.add_argument("--shared-target", action="store_true", default=None,
+                   help="build every algorithm in one target directory, one at a time (default without sccache)")
+    p.add_argument("--timeout", type=float, default=None,
+                   help="seconds per instance; runs each instance in its own supervised process")
+    p.add_argument("--memory-limit", default=None,
+                   help="resident memory per instance, e.g. 8G; runs each instance in its own supervised process")
+    p.add_argument("--supervised", action="store_true",
+                   help="run each instance in its own process, recording its wall and CPU time, peak memory and threads")
+    p.set_defaults(func=evaluate)
+
+    p = commands.add_parser("pin-digests", help="pin the digests of every cached download in tig_sota/digests.json")
+    p.add_argument("--cache", default=None, help="download cache (default: ~/.cache/tig-sota, or $TIG_SOTA_CACHE)")
+    p.add_argument("--replace", action="store_true", help="overwrite pinned digests that differ from the cache")
+    p.set_defaults(func=pin_digests)
+
+    p = commands.add_parser("import-results", help="import evaluation CSVs into the columnar results store")
+    p.add_argument("paths", nargs="+", help="evaluation CSVs, or directories of them")
+    p.add_argument("--root", default=None, help="results store (default: results/, or $TIG_SOTA_RESULTS)")
+    p.set_defaults(func=import_results)
+
+    p = commands.add_parser("ground-truth", help="check or recompute the nearest neighbours of vector search .bin files")
+    p.add_argument("paths", nargs="+", help=".bin files")
+    p.add_argument("--write", action="store_true", help="overwrite the stored nearest neighbours with exact ones")
+    p.add_argument("--workers", type=int, default=None, help="threads (default: one per core)")
+    p.set_defaults(func=ground_truth)
+
+    for name, help, scorer, extension, failure in (
+        ("verify-sat", "check stored SAT assignments (<instance>.sol) against their instances",
+         ".datasets.satisfiability.verify", ".cnf", "Unsatisfying assignments"),
+        ("score-qkp", "score stored QKP selections (<instance>.sol) against their instances",
+         ".datasets.knapsack.qkp_score", ".txt", "Selections over budget"),
+    ):
+        p = commands.add_parser(name, help=help)
+        p.add_argument("dataset_dir", help=f"directory of {extension} instances")
+        p.add_argument("solutions_dir", nargs="?", default=None, help="directory of .sol files (default: dataset_dir)")
+        p.add_argument("--workers", type=int, default=os.cpu_count(), help="size of the process pool")
+        p.set_defaults(func=audit, scorer=scorer, failure=failure)
+
+    p = commands.add_parser("variants", help="derive smaller variants of a dataset for scaling benchmarks")
+    p.add_argument("challenge", choices=["vector_search", "vehicle_routing", "knapsack"])
+    p.add_argument("dataset", help="dataset to derive the variants from")
+    p.add_argument("sizes", nargs="+", type=int, help="database vectors, customers or items of each variant")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--data-dir", default=None, help="datasets directory (default: <challenge>_evaluator/data)")
+    p.add_argument("--workers", type=int, default=os.cpu_count(), help="size of the process pool")
+    p.add_argument("--force", action="store_true", help="rebuild every variant, ignoring the manifests")
+    p.set_defaults(func=variants)
+
+    p = commands.add_parser("bench", help="benchmark the dataset conversion pipeline on synthetic fixtures")
+    p.add_argument("benchmarks", nargs="*", help="benchmark groups (default: all of qkp, fvecs, hg, sota_csv, cnf)")
+    p.add_argument("--repeat", type=int, default=3, help="timed runs per stage, the best is kept")
+    p.add_argument("--baseline", default=None, help="baseline file (default: benchmarks/baseline.json)")
+    p.add_argument("--save", action="store_true", help="record the results as the new baseline")
+    p.add_argument("--tolerance", type=float, default=None,
+                   help="relative slowdown or memory growth reported as a regression (default: 0.3)")
+    p.set_defaults(func=bench)
+
+    args = parser.parse_args(argv)
+    args.func(args)
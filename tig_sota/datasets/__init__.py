@@ -0,0 +1,130 @@
+"""Registry of the benchmark datasets of each challenge and a concurrent builder for them.
+
+Every dataset module exposes ``build(out_dir, ctx)``, which downloads its sources through
+``ctx.engine``, runs CPU-heavy stages on the shared ``ctx.pool`` process pool and records
+what it built in ``ctx.manifest(out_dir)`` so that rebuilds only redo stale instances. Dataset
+modules are only imported when selected, so heavy dependencies such as pdfplumber or
+pandas are only loaded for the stages that need them.
+"""
+
+import concurrent.futures
+import importlib
+import os
+import traceback
+
+from ..fetch import FetchEngine
+from ..manifest import Manifest, source_hash
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# challenge -> {dataset name (as used by the notebooks and harnesses): module}
+DATASETS = {
+    "satisfiability": {
+        "2018_2024_3_SAT": "sat_2018_2024",
+        "SATLIB": "satlib",
+    },
+    "vehicle_routing": {
+        "HG": "hg",
+    },
+    "knapsack": {
+        "Standard_QKP": "standard_qkp",
+        "QKPGroupII": "qkp_group_ii",
+        "QKPGroupIII": "qkp_group_iii",
+        "Large_QKP": "large_qkp",
+    },
+    "vector_search": {
+        "SIFT": "sift",
+        "Fashion_MNIST": "fashion_mnist",
+    },
+}
+
+# prefix of each challenge's TIG algorithm ids and of its harness's evaluation files
+CHALLENGE_IDS = {
+    "satisfiability": "c001",
+    "vehicle_routing": "c002",
+    "knapsack": "c003",
+    "vector_search": "c004",
+}
+
+
+def load(challenge, name):
+    return importlib.import_module(f".{challenge}.{DATASETS[challenge][name]}", __name__)
+
+
+def default_data_dir(challenge):
+    return os.path.join(REPO_ROOT, f"{challenge}_evaluator", "data")
+
+
+class BuildContext:
+    """Download engine and process pool shared by all datasets built together"""
+
+    def __init__(self, workers=None, fetch_workers=8, verify=False, force=False):
+        self.workers = workers or os.cpu_count()
+        self.engine = FetchEngine(max_workers=fetch_workers)
+        self.pool = concurrent.futures.ProcessPoolExecutor(self.workers)
+        self.verify = verify
+        self.force = force
+
+    def manifest(self, out_dir):
+        return Manifest(out_dir, verify=self.verify, force=self.force)
+
+    def fetch_stale(self, manifest, downloads, build, **request_kwargs):
+        """Download and build the instances of `downloads` ({url: (instance, params)}) that are
+        stale, calling ``build(path, instance)`` on each downloaded file for the outputs it wrote.
+
+        An instance's source is its URL, the SHA-256 of the download and its `params`. That
+        digest is taken from the pinned digests, the download cache, or else the manifest
+        entry, so instances already built are recognised without downloading anything.
+        Returns the instances that failed."""
+        pending = {}
+        for url, (instance, params) in downloads.items():
+            sha256 = self.engine.cache.digest(url) or manifest.downloaded(instance, url)
+            if not (sha256 and manifest.fresh(instance, source_hash(url, sha256, *params))):
+                pending[url] = (instance, params)
+        print(f"{len(downloads) - len(pending)} up to date, {len(pending)} to fetch")
+
+        def handle(path, url, instance, params):
+            # cached downloads are named by their content hash
+            sha256 = os.path.basename(path)
+            source = source_hash(url, sha256, *params)
+            if not manifest.fresh(instance, source):
+                manifest.record(instance, source, build(path, instance), download={"url": url, "sha256": sha256})
+
+        failures = self.engine.run(
+            ((url, lambda path, url=url, job=job: handle(path, url, *job)) for url, job in pending.items()),
+            **request_kwargs,
+        )
+        return [downloads[url][0] for url, _ in failures]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.pool.shutdown()
+
+
+def build(challenge, names, data_dir=None, jobs=1, workers=None, fetch_workers=8, verify=False, force=False):
+    """Build `names` of `challenge` into `data_dir`, running up to `jobs` datasets concurrently.
+    Instances already built from the same sources are skipped unless `force` is set, and
+    `verify` re-hashes their outputs instead of just checking sizes.
+    Returns {name: formatted traceback} for the datasets that failed."""
+    data_dir = data_dir or default_data_dir(challenge)
+    for name in names:
+        if name not in DATASETS[challenge]:
+            raise KeyError(f"Unknown {challenge} dataset {name!r}, expected one of {list(DATASETS[challenge])}")
+
+    failures = {}
+    with BuildContext(workers, fetch_workers, verify, force) as ctx, concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        futures = {
+            executor.submit(load(challenge, name).build, os.path.join(data_dir, name), ctx): name
+            for name in names
+        }
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+                print(f"Built {challenge} dataset {name}")
+            except Exception:
+                failures[name] = traceback.format_exc()
+                print(f"Failed to build {challenge} dataset {name}:\n{failures[name]}")
+    return failures
@@ -0,0 +1 @@
+"""QKP dataset builders and the shared instance conversion and SOTA extraction helpers."""
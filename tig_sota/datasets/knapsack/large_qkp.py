@@ -0,0 +1,145 @@
+"""Large QKP instances of size 500-10000 items, regenerated from the published seed, with SOTA results."""
+
+import os
+import shutil
+
+import numpy as np
+
+from . import qkp_binary, qkp_convert, qkp_sota
+from ...manifest import IncompleteBuild, describe, source_hash
+
+PDF_URL = "https://raw.githubusercontent.com/phil85/results-for-qkp-benchmark-instances/main/tables/Large-QKP_detailed_results.pdf"
+ROW_CHUNK = 500
+SEED = 24
+
+# Settings
+n_nodes_list = [500, 1000, 2000, 5000, 10000]
+densities = {500: [5, 10, 15, 20, 25, 50, 75, 100],
+            1000: [5, 10, 15, 20, 25, 50],
+            2000: [5, 10, 15, 20, 25],
+            5000: [5, 10, 15, 20],
+            10000: [5]}
+budgets = ('2.5', '5.0', '10.0', '25.0', '50.0', '75.0')
+combos = [(n_nodes, density)
+         for n_nodes in n_nodes_list
+         for density in densities[n_nodes]]
+
+
+# Instances are generated based on https://github.com/phil85/benchmark-instances-for-qkp/blob/main/generate_synthetic_instances.py
+# The original generator draws every combo sequentially from one np.random.seed(24) stream. To generate
+# combos in parallel, the stream is first replayed (drawing in row chunks, which consumes it identically)
+# to record the RNG state at the start of each combo
+def replay_states():
+    np.random.seed(SEED)
+    states = {}
+    for n_nodes, density in combos:
+        states[n_nodes, density] = np.random.get_state()
+        for start in range(0, n_nodes, ROW_CHUNK):
+            np.random.randint(1, 101, size=(min(ROW_CHUNK, n_nodes - start), n_nodes))
+        for start in range(0, n_nodes, ROW_CHUNK):
+            np.random.rand(min(ROW_CHUNK, n_nodes - start), n_nodes)
+        np.random.randint(1, 51, size=n_nodes)
+    return states
+
+
+def generate_instance(out_dir, n_nodes, density, state, ofvs):
+    rng = np.random.RandomState()
+    rng.set_state(state)
+
+    # Randomly draw linear and quadratic coefficients in [1, 100]
+    utility_matrix = np.empty((n_nodes, n_nodes), dtype=np.uint8)
+    for start in range(0, n_nodes, ROW_CHUNK):
+        end = min(start + ROW_CHUNK, n_nodes)
+        utility_matrix[start:end] = rng.randint(1, 101, size=(end - start, n_nodes))
+
+    # Apply density to the symmetrised matrix, whose upper triangle (i, j >= i) is utility_matrix[j, i]
+    rows, cols, vals = [], [], []
+    for start in range(0, n_nodes, ROW_CHUNK):
+        end = min(start + ROW_CHUNK, n_nodes)
+        block = utility_matrix[:, start:end].T * (rng.rand(end - start, n_nodes) < (density / 100))
+        r, c = np.nonzero(np.triu(block, start))
+        rows.append(r + start)
+        cols.append(c)
+        vals.append(block[r, c])
+
+    # Randomly draw weights in [1, 50]
+    weights = rng.randint(1, 51, size=n_nodes)
+
+    rows, cols, vals = np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+
+    # Write edges
+    temp_file = os.path.join(out_dir, f'{n_nodes}_{density}.txt')
+    with open(temp_file, 'w') as f:
+        f.write(f'{n_nodes} {len(vals)} int\n')
+        qkp_convert.write_edges(f, rows, cols, vals, fmt='%d %d %d\n')
+        # Write weights
+        f.write(''.join(f'{weight} ' for weight in weights))
+        f.write('\n')
+
+    # Add budgets
+    outputs = []
+    for b in budgets:
+        b = int(float(b) * 10)
+        instance = f'{n_nodes}_{density}_{b}.txt'
+        shutil.copyfile(
+            temp_file,
+            os.path.join(out_dir, instance)
+        )
+        print(f"Writing instance {instance} ...")
+        budget = int(b / 1000.0 * np.sum(weights))
+        with open(os.path.join(out_dir, instance), 'a') as f:
+            f.write(f'{budget}\n')
+            f.write(f'{ofvs[instance]}\n')
+        qkp_binary.write_instance(
+            os.path.join(out_dir, qkp_binary.bin_path(instance)), n_nodes, rows, cols, vals,
+            weights, budget, ofvs[instance]
+        )
+        outputs += [os.path.join(out_dir, instance), os.path.join(out_dir, qkp_binary.bin_path(instance))]
+    os.remove(temp_file)
+    return describe(*outputs)
+
+
+def build(out_dir, ctx):
+    # 1) Download PDF
+    print("Downloading Large-QKP results PDF...")
+    pdf_path = ctx.engine.fetch(PDF_URL)
+
+    # 2) Scrape OFV data
+    print("Extracting Best OFV and SOTA results...")
+    instance_data = qkp_sota.extract_budget_data(pdf_path, combos, budgets, crop_box=(40, 145, 535, 235), ctx=ctx)
+    print(f"Extracted data for {len(instance_data)} instances.")
+
+    # Each (n_nodes, density) combo is generated as a whole, so the manifest tracks combos
+    ofvs = {
+        f'{n_nodes}_{density}': {
+            instance: data['ofv'] for instance, data in instance_data.items()
+            if instance.startswith(f'{n_nodes}_{density}_')
+        }
+        for n_nodes, density in combos
+    }
+    sources = {
+        combo: source_hash(SEED, combo, sorted(ofvs[combo].items()), qkp_convert.FORMAT_VERSION)
+        for combo in ofvs
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    with ctx.manifest(out_dir) as manifest:
+        stale = manifest.stale(sources)
+        print(f"{len(sources) - len(stale)} combos up to date, {len(stale)} to generate")
+        failed = []
+        if stale:
+            print("Replaying random stream...")
+            states = replay_states()
+
+            # Largest instances first so they don't end up as stragglers
+            order = sorted(combos, key=lambda x: -x[0] * x[0] * x[1])
+            failed = manifest.build(ctx.pool, generate_instance, {
+                f'{n_nodes}_{density}': (sources[f'{n_nodes}_{density}'], (
+                    out_dir, n_nodes, density, states[n_nodes, density], ofvs[f'{n_nodes}_{density}']
+                ))
+                for n_nodes, density in order if f'{n_nodes}_{density}' in stale
+            })
+
+    print("Writing SOTA results ...")
+    qkp_sota.write_sota_csv(instance_data, os.path.join(out_dir, 'sota.csv'))
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
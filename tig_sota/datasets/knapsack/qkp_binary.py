@@ -0,0 +1,64 @@
+"""Packed binary form of QKP instances, written as {instance}.bin next to each {instance}.txt.
+
+Layout (little-endian)::
+
+    header   magic "QKPB", u32 version, u32 num_items, u32 num_edges, u32 budget, u64 best-known OFV
+    weights  u32[num_items]
+    edges    i32[num_edges] item1, i32[num_edges] item2, i32[num_edges] value (same order as the .txt edges)
+"""
+
+import collections
+import os
+import struct
+import numpy as np
+
+from ...manifest import sidecar_is_fresh
+
+MAGIC = b"QKPB"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIQ")
+
+QKPInstance = collections.namedtuple(
+    "QKPInstance", ["num_items", "budget", "ofv", "weights", "rows", "cols", "vals"]
+)
+
+
+def bin_path(txt_path):
+    return txt_path[:-len(".txt")] + ".bin" if txt_path.endswith(".txt") else txt_path + ".bin"
+
+
+def write_instance(path, num_items, rows, cols, vals, weights, budget, ofv):
+    with open(path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, num_items, len(vals), budget, ofv))
+        out.write(np.asarray(weights, dtype="<u4").tobytes())
+        for arr in (rows, cols, vals):
+            out.write(np.asarray(arr, dtype="<i4").tobytes())
+
+
+def read_instance(path):
+    """Memory-map a .bin instance; the weight and edge arrays are read-only views into the file"""
+    with open(path, "rb") as f:
+        magic, version, num_items, num_edges, budget, ofv = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} QKP binary instance")
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    weights = data[HEADER.size:HEADER.size + 4 * num_items].view("<u4")
+    edges = data[HEADER.size + 4 * num_items:].view("<i4").reshape(3, num_edges)
+    return QKPInstance(num_items, budget, ofv, weights, edges[0], edges[1], edges[2])
+
+
+def read_qkp(txt_path):
+    """`QKPInstance` of a QKP .txt instance, from its .bin sidecar when that is present and not
+    older than the .txt (as in the harness)"""
+    if sidecar_is_fresh(bin_path(txt_path), txt_path):
+        return read_instance(bin_path(txt_path))
+    with open(txt_path) as f:
+        num_items, num_edges, _ = f.readline().split()
+        edges = np.empty((0, 3))
+        if int(num_edges):
+            edges = np.loadtxt(f, dtype=np.float64, max_rows=int(num_edges), ndmin=2)
+        weights = np.array(f.readline().split(), dtype=np.int64)
+        budget = int(f.readline())
+        ofv = int(f.readline())
+    rows, cols, vals = edges.T.astype(np.int64)
+    return QKPInstance(int(num_items), budget, ofv, weights, rows, cols, vals)
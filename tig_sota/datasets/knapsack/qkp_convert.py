@@ -0,0 +1,59 @@
+"""Converter from upper-triangular QKP utility matrices to the `n m int` / `i j val` edge list format."""
+
+import numpy as np
+
+from . import qkp_binary
+
+# f"{val:.6f}" of an integer utility is just the integer followed by six zeros
+EDGE_FORMAT = "%d %d %d.000000\n"
+BLOCK_SIZE = 1 << 16
+# bump whenever the written .txt / .bin instances change, so that manifests mark them stale
+FORMAT_VERSION = 1
+
+
+def parse_triangular(lines, num_items):
+    """Parse the linear utility row followed by `num_items` upper-triangular rows of quadratic utilities"""
+    linear = np.fromstring(lines[0], dtype=np.int64, sep=" ")[:num_items]
+    quad = np.fromstring("\n".join(lines[1:1 + num_items]), dtype=np.int64, sep=" ")
+    if len(linear) != num_items:
+        raise ValueError(f"Expected {num_items} linear utilities, found {len(linear)}")
+    if len(quad) != num_items * (num_items - 1) // 2:
+        raise ValueError(f"Expected {num_items * (num_items - 1) // 2} quadratic utilities, found {len(quad)}")
+    return linear, quad
+
+
+def triangular_edges(linear, quad, num_items, keep_zero_linear=True):
+    """Edges (all linear utilities first, then non-zero quadratic utilities in row-major order) as (rows, cols, vals) arrays"""
+    diag = np.arange(num_items, dtype=np.int64)
+    if not keep_zero_linear:
+        diag = diag[linear != 0]
+    # row i of the flattened triangle holds columns i + 1 .. num_items - 1
+    row_lengths = np.arange(num_items - 1, -1, -1, dtype=np.int64)
+    row_starts = np.cumsum(row_lengths) - row_lengths
+    nz = np.flatnonzero(quad)
+    rows = np.searchsorted(row_starts, nz, side="right") - 1
+    cols = nz - row_starts[rows] + rows + 1
+    return (
+        np.concatenate((diag, rows)),
+        np.concatenate((diag, cols)),
+        np.concatenate((linear[diag], quad[nz])),
+    )
+
+
+def write_edges(f, rows, cols, vals, fmt=EDGE_FORMAT):
+    """Write one formatted line per edge, formatting BLOCK_SIZE edges per string operation"""
+    for start in range(0, len(vals), BLOCK_SIZE):
+        end = min(start + BLOCK_SIZE, len(vals))
+        block = np.column_stack((rows[start:end], cols[start:end], vals[start:end]))
+        f.write((fmt * (end - start)) % tuple(block.ravel().tolist()))
+
+
+def write_instance(path, num_items, rows, cols, vals, weights, budget, ofv):
+    """Write the .txt instance together with its packed .bin form"""
+    with open(path, "w") as out:
+        out.write(f"{num_items} {len(vals)} int\n")
+        write_edges(out, rows, cols, vals)
+        out.write(" ".join(str(w) for w in weights) + "\n")
+        out.write(f"{budget}\n")
+        out.write(f"{ofv}\n")
+    qkp_binary.write_instance(qkp_binary.bin_path(path), num_items, rows, cols, vals, weights, budget, ofv)
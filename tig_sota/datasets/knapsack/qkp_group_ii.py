@@ -0,0 +1,112 @@
+"""QKP Group II instances of size 1000-2000 items, with best-known OFVs and SOTA results."""
+
+import os
+import shutil
+import zipfile
+
+from . import qkp_binary, qkp_convert, qkp_sota
+from ...manifest import IncompleteBuild, describe, source_hash
+
+PDF_URL = "https://raw.githubusercontent.com/phil85/results-for-qkp-benchmark-instances/main/tables/QKPGroupII_detailed_results.pdf"
+ZIP_URL = "https://leria-info.univ-angers.fr/~jinkao.hao/QKPDATA/QKPGroupII.zip"
+
+n_nodes_list = [1000, 2000]
+densities = {
+    1000: sorted(map(str, [25, 50, 75, 100])),
+    2000: sorted(map(str, [25, 50, 75, 100])),
+}
+n_instances = 10
+combos = [(n_nodes, density, idx)
+         for n_nodes in n_nodes_list
+         for density in densities[n_nodes]
+         for idx in sorted(map(str, range(1, n_instances + 1)))]
+instances = [f"{nn}_{d}_{idx}.txt" for nn, d, idx in combos]
+
+
+def process_dat_file(dat_path, out_path, ofv):
+    print(f"Processing {os.path.basename(out_path)}")
+    lines = open(dat_path, 'r').read().splitlines()
+    nn = int(lines[0].strip())
+
+    linear, quad = qkp_convert.parse_triangular(lines[1:2 + nn], nn)
+    rows, cols, vals = qkp_convert.triangular_edges(linear, quad, nn)
+
+    budget = int(lines[3 + nn].strip())
+    weights = [int(v) for v in lines[4 + nn].split() if v]
+
+    qkp_convert.write_instance(out_path, nn, rows, cols, vals, weights, budget, ofv)
+    return describe(out_path, qkp_binary.bin_path(out_path))
+
+
+def extract_raw(zip_path, raw_dir):
+    """Unzip the raw data, then extract each of its .rar archives into raw_dir"""
+    import patoolib
+
+    if not shutil.which('unrar'):
+        raise RuntimeError("You need to have 'unrar' installed to extract RAR files.")
+    os.makedirs(raw_dir, exist_ok=True)
+
+    print("Extracting raw Group II data...")
+    with zipfile.ZipFile(zip_path) as zf:
+        zf.extractall(raw_dir)
+
+    for prefix in ['1000', '2000']:
+        if prefix == '1000':
+            dens_list = [25, 50, 75, 100]
+        else:
+            dens_list = ['25', '50(1)', '50(2)', '75(1)', '75(2)', '100(1)', '100(2)']
+        for d in dens_list:
+            rar_name = f"{prefix}_{d}.rar"
+            rar_path = os.path.join(raw_dir, "QKPGroupII", rar_name)
+            patoolib.extract_archive(rar_path, outdir=raw_dir)
+            # Move contents up one level
+            folder = os.path.join(raw_dir, f"{prefix}_{d}")
+            if os.path.isdir(folder):
+                for f_name in os.listdir(folder):
+                    os.replace(os.path.join(folder, f_name), os.path.join(raw_dir, f_name))
+
+
+def build(out_dir, ctx):
+    raw_dir = os.path.join(out_dir, 'raw_data')
+
+    # 1) Download & parse the PDF
+    print("Downloading Group II detailed results PDF...")
+    pdf_path = ctx.engine.fetch(PDF_URL)
+
+    print("Extracting Best OFV and SOTA results...")
+    instance_data = qkp_sota.extract_instance_data(pdf_path, instances, crop_box=(35, 142, 535, 192), ctx=ctx)
+    print(f"Extracted data for {len(instance_data)} instances.")
+
+    # 2) Download the raw data ZIP and find the instances that are missing or stale
+    print("Downloading raw Group II zip...")
+    zip_path = ctx.engine.fetch(ZIP_URL)
+    # cached downloads are named by their content hash
+    sources = {
+        instance: source_hash(os.path.basename(zip_path), instance_data[instance]['ofv'], qkp_convert.FORMAT_VERSION)
+        for instance in instances
+    }
+    with ctx.manifest(out_dir) as manifest:
+        stale = manifest.stale(sources)
+        print(f"{len(instances) - len(stale)} instances up to date, {len(stale)} to build")
+        failed = []
+        if stale:
+            extract_raw(zip_path, raw_dir)
+
+            # 3) Process .dat files into .txt files with OFV appended
+            print("Processing .dat files into .txt format...")
+            failed = manifest.build(ctx.pool, process_dat_file, {
+                instance: (sources[instance], (
+                    os.path.join(raw_dir, instance.replace('.txt', '.dat')),
+                    os.path.join(out_dir, instance),
+                    instance_data[instance]['ofv'],
+                ))
+                for instance in stale
+            })
+
+            print("Removing raw data")
+            shutil.rmtree(raw_dir, ignore_errors=True)
+
+    print("Writing SOTA results ...")
+    qkp_sota.write_sota_csv(instance_data, os.path.join(out_dir, 'sota.csv'))
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
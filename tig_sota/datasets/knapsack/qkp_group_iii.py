@@ -0,0 +1,91 @@
+"""QKP Group III instances of size 5000-6000 items, with best-known OFVs and SOTA results."""
+
+import os
+import shutil
+import zipfile
+
+from . import qkp_binary, qkp_convert, qkp_sota
+from ...manifest import IncompleteBuild, describe, source_hash
+
+ZIP_URL = "https://leria-info.univ-angers.fr/%7Ejinkao.hao/QKPDATA/QKPGroupIII.zip"
+PDF_URL = "https://raw.githubusercontent.com/phil85/results-for-qkp-benchmark-instances/main/tables/QKPGroupIII_detailed_results.pdf"
+
+n_nodes_list = [5000, 6000]
+densities = {5000: sorted(map(str, [25, 50, 75, 100])),
+            6000: sorted(map(str, [25, 50, 75, 100]))}
+n_instances = 5
+combos = [(n_nodes, density, idx)
+         for n_nodes in n_nodes_list
+         for density in densities[n_nodes]
+         for idx in range(1, n_instances + 1)]
+instances = [f"{nn}_{d}_{idx}.txt" for nn, d, idx in combos]
+
+
+def process_file(raw_path, out_path, ofv):
+    print(f"Processing {os.path.basename(out_path)}")
+    lines = open(raw_path, 'r').readlines()
+
+    # Get number of nodes and linear + quadratic utilities, removing edges with utility of zero
+    actual_nodes = int(lines[1])
+    linear, quad = qkp_convert.parse_triangular(lines[3:4 + actual_nodes], actual_nodes)
+    rows, cols, vals = qkp_convert.triangular_edges(linear, quad, actual_nodes, keep_zero_linear=False)
+
+    # Get weights
+    budget = int(lines[6 + actual_nodes].strip('\n'))
+    weights = [int(v) for v in lines[7 + actual_nodes].strip('\n').split(' ') if v != '']
+
+    # Write output file
+    qkp_convert.write_instance(out_path, actual_nodes, rows, cols, vals, weights, budget, ofv)
+    return describe(out_path, qkp_binary.bin_path(out_path))
+
+
+def build(out_dir, ctx):
+    raw_dir = os.path.join(out_dir, 'raw_data')
+
+    # 1) Download & parse the PDF
+    print("Downloading Group III detailed results PDF...")
+    pdf_path = ctx.engine.fetch(PDF_URL)
+
+    print("Extracting Best OFV and SOTA results...")
+    instance_data = qkp_sota.extract_instance_data(pdf_path, instances, crop_box=(35, 142, 535, 192), ctx=ctx)
+    print(f"Extracted data for {len(instance_data)} instances")
+
+    # 2) Download the raw data zip and find the instances that are missing or stale
+    print("Downloading raw Group III zip...")
+    zip_path = ctx.engine.fetch(ZIP_URL)
+    # cached downloads are named by their content hash
+    sources = {
+        instance: source_hash(os.path.basename(zip_path), instance_data[instance]['ofv'], qkp_convert.FORMAT_VERSION)
+        for instance in instances
+    }
+    with ctx.manifest(out_dir) as manifest:
+        stale = manifest.stale(sources)
+        print(f"{len(instances) - len(stale)} instances up to date, {len(stale)} to build")
+        failed = []
+        if stale:
+            print("Extracting raw Group III data...")
+            os.makedirs(raw_dir, exist_ok=True)
+            with zipfile.ZipFile(zip_path) as zf:
+                # only what needs rebuilding; missing members fail their instance below
+                members = set(zf.namelist())
+                zf.extractall(raw_dir, members=[
+                    f"QKPGroupIII/{instance}" for instance in stale if f"QKPGroupIII/{instance}" in members
+                ])
+
+            # 3) Process each instance file
+            failed = manifest.build(ctx.pool, process_file, {
+                instance: (sources[instance], (
+                    os.path.join(raw_dir, 'QKPGroupIII', instance),
+                    os.path.join(out_dir, instance),
+                    instance_data[instance]['ofv'],
+                ))
+                for instance in stale
+            })
+
+            print("Removing raw data")
+            shutil.rmtree(raw_dir, ignore_errors=True)
+
+    print("Writing SOTA results ...")
+    qkp_sota.write_sota_csv(instance_data, os.path.join(out_dir, 'sota.csv'))
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
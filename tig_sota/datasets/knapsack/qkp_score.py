@@ -0,0 +1,136 @@
+"""Batch scoring of QKP item selections without the dense interaction matrix.
+
+The quadratic utilities of an instance are held once per item pair as a CSR upper triangle
+(`QKPMatrix`), so memory follows the number of edges rather than ``num_items ** 2``. A batch
+of selections, a (batch, num_items) bool array, is scored block by block of CSR rows: each
+block gathers the selection flags of both items of its edges, and one matrix-vector product
+with the edge utilities sums the edges every selection contains. Objectives, weights and gaps follow the
+harness: each pair counts once, an edge listed twice keeps its last value, and negative
+totals score 0.
+
+Stored solutions are ``<instance>.sol`` files of item indices, one selection per line.
+"""
+
+import collections
+
+import numpy as np
+
+from .qkp_binary import read_qkp
+from ... import solutions
+
+# (selection, edge) pairs gathered at once; peak memory is a few bytes per pair
+GATHER_SIZE = 1 << 20
+
+QKPMatrix = collections.namedtuple("QKPMatrix", ["num_items", "values", "indptr", "indices", "data"])
+Scores = collections.namedtuple("Scores", ["value", "weight", "feasible", "gap_percent"])
+
+
+def qkp_matrix(instance):
+    """`QKPMatrix` of a `qkp_binary.QKPInstance`: linear `values` and the pairs (i < j) as CSR
+    `indptr`, `indices` (column j) and `data`"""
+    n = instance.num_items
+    rows = np.asarray(instance.rows, dtype=np.int64)
+    cols = np.asarray(instance.cols, dtype=np.int64)
+    vals = np.asarray(instance.vals)
+
+    diag = rows == cols
+    values = np.zeros(n, dtype=np.int64)
+    values[rows[diag]] = vals[diag]
+
+    lo, hi, vals = np.minimum(rows, cols)[~diag], np.maximum(rows, cols)[~diag], vals[~diag]
+    keys = lo * n + hi
+    # converted instances are already in row-major order with each pair once
+    if len(keys) > 1 and not (keys[1:] > keys[:-1]).all():
+        order = np.argsort(keys, kind="stable")
+        keys, vals = keys[order], vals[order]
+        last = np.append(keys[1:] != keys[:-1], True)
+        keys, vals = keys[last], vals[last]
+    nonzero = vals != 0
+    keys, vals = keys[nonzero], vals[nonzero]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+    return QKPMatrix(n, values, indptr, (keys % n).astype(np.int32), vals.astype(np.int32))
+
+
+def quadratic_values(matrix, selections):
+    """Sum of the pair utilities within each of `selections`, (batch, num_items) bool"""
+    indptr, counts = matrix.indptr, np.diff(matrix.indptr)
+    # one row per item, so each edge gathers its items' flags for the whole batch contiguously
+    flags = np.ascontiguousarray(np.asarray(selections, dtype=bool).T)
+    data = matrix.data.astype(np.float64)
+    total = np.zeros(len(selections), dtype=np.int64)
+    step = max(1, GATHER_SIZE // max(len(selections), 1))
+    start = 0
+    while start < matrix.num_items:
+        # rows whose edges fit in one gather, at least one row
+        stop = max(start + 1, int(np.searchsorted(indptr, indptr[start] + step, side="right")) - 1)
+        stop = min(stop, matrix.num_items)
+        first, last = indptr[start], indptr[stop]
+        if last > first:
+            both = flags[matrix.indices[first:last]]
+            both &= np.repeat(flags[start:stop], counts[start:stop], axis=0)
+            # exact in float64: a block's i32 utilities sum far below 2 ** 53
+            total += np.rint(data[first:last] @ both).astype(np.int64)
+        start = stop
+    return total
+
+
+def gap_percent(value, ofv):
+    """Gap of `value` to the best-known `ofv` as the harness reports it, infinite for 0"""
+    value = np.asarray(value, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        return (ofv / value - 1) * 100
+
+
+def score(instance, selections, matrix=None):
+    """`Scores` of each of `selections`, (batch, num_items) bool, on a `qkp_binary.QKPInstance`.
+    Pass `matrix` to reuse the `qkp_matrix` of the instance across calls."""
+    if matrix is None:
+        matrix = qkp_matrix(instance)
+    selections = np.atleast_2d(np.asarray(selections, dtype=bool))
+    if selections.shape[1] != instance.num_items:
+        raise ValueError(f"selections have {selections.shape[1]} items, expected {instance.num_items}")
+    value = np.maximum(selections @ matrix.values + quadratic_values(matrix, selections), 0)
+    weight = selections @ np.asarray(instance.weights, dtype=np.int64)
+    return Scores(value, weight, weight <= instance.budget, gap_percent(value, instance.ofv))
+
+
+def selection_matrix(item_lists, num_items):
+    """(batch, num_items) bool array of selections given as lists of item indices"""
+    selections = np.zeros((len(item_lists), num_items), dtype=bool)
+    for row, items in enumerate(item_lists):
+        items = np.asarray(items, dtype=np.int64)
+        if len(items) and (items.min() < 0 or items.max() >= num_items):
+            raise ValueError(f"selection {row}: item outside 0..{num_items - 1}")
+        if len(np.unique(items)) != len(items):
+            raise ValueError(f"selection {row}: duplicate items")
+        selections[row, items] = True
+    return selections
+
+
+def read_selections(path, num_items):
+    """(batch, num_items) bool array of the selections stored in the .sol file at `path`"""
+    with open(path) as f:
+        item_lists = [line.split() for line in f if line.strip()]
+    return selection_matrix(item_lists, num_items)
+
+
+def audit_instance(txt_path, sol_path):
+    """`Scores` of the selections stored in `sol_path`, against the instance at `txt_path`"""
+    instance = read_qkp(txt_path)
+    return score(instance, read_selections(sol_path, instance.num_items))
+
+
+def audit(dataset_dir, solutions_dir=None, executor=None):
+    """{instance name: `Scores`} of the stored solutions ``<instance>.sol`` in `solutions_dir`
+    (default: next to the instances) of the .txt instances in `dataset_dir`. Instances are
+    scored on `executor` when given."""
+    return solutions.audit(dataset_dir, ".txt", audit_instance, solutions_dir, executor)
+
+
+def summary(scores):
+    """(report line, whether any selection is over budget) of the `Scores` of an instance"""
+    infeasible = int((~scores.feasible).sum())
+    best = (f", best value {scores.value[scores.feasible].max()} (gap {scores.gap_percent[scores.feasible].min():.6f}%)"
+            if scores.feasible.any() else "")
+    return f"{len(scores.value)} selections, {infeasible} over budget{best}", infeasible > 0
@@ -0,0 +1,86 @@
+"""Parsing of the per-instance SOTA tables in phil85/results-for-qkp-benchmark-instances PDFs."""
+
+import functools
+
+from ...pdf_tables import extract_pages
+
+SOTA_algos = ('QKBP', 'RG', 'IHEA', 'LDP', 'DP', 'QK', 'Gurobi', 'Hexaly')
+TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+}
+# bump whenever the parsed output changes, so cached tables are re-extracted
+PARSER_VERSION = 1
+
+
+def parse_row(row):
+    return {
+        'ofv': int(float(row[1].replace(',', ''))),
+        'gaps': {
+            algo: None if row[2 + j] == '—' else float(row[2 + j].replace(',', ''))
+            for j, algo in enumerate(SOTA_algos)
+        },
+        'runtimes': {
+            algo: None if row[2 + len(SOTA_algos) + j] == '—' else float(row[2 + len(SOTA_algos) + j])
+            for j, algo in enumerate(SOTA_algos)
+        }
+    }
+
+
+def parse_instance_page(page, crop_box):
+    """Results of the single instance tabulated on `page`"""
+    table = page.crop(crop_box).extract_table(TABLE_SETTINGS)
+    if table[0][0] == 'γ BestOFV':
+        table[0][:1] = list(table[0][0].split(' '))
+        table[2][:1] = list(table[2][0].split(' '))
+    assert tuple(table[0]) == (('γ', 'BestOFV') + SOTA_algos + SOTA_algos)
+    assert tuple(row[0] for i, row in enumerate(table) if i != 2) == ('γ', '', '', 'Avg', 'Min', 'Max')
+    return parse_row(table[2])
+
+
+def parse_budget_page(page, crop_box, budgets):
+    """Results of one instance per budget tabulated on `page`, in the order of `budgets`"""
+    table = page.crop(crop_box).extract_table(TABLE_SETTINGS)
+    assert tuple(table[0]) == (('γ', 'BestOFV') + SOTA_algos + SOTA_algos)
+    assert tuple(row[0] for row in table) == (('γ', '') + budgets + ('', 'Avg', 'Min', 'Max'))
+    return [parse_row(table[2 + i]) for i in range(len(budgets))]
+
+
+def extract_instance_data(pdf_path, instances, crop_box, ctx):
+    """{instance: results} for `instances` tabulated one per page, starting from page 1"""
+    results = extract_pages(
+        pdf_path,
+        functools.partial(parse_instance_page, crop_box=crop_box),
+        key=f"qkp-instance-v{PARSER_VERSION}-{'-'.join(map(str, crop_box))}",
+        pages=range(1, len(instances) + 1),
+        workers=ctx.workers,
+        executor=ctx.pool,
+    )
+    return dict(zip(instances, results))
+
+
+def extract_budget_data(pdf_path, combos, budgets, crop_box, ctx):
+    """{instance: results} for each (n_nodes, density) combo tabulated one per page with a row per budget"""
+    results = extract_pages(
+        pdf_path,
+        functools.partial(parse_budget_page, crop_box=crop_box, budgets=budgets),
+        key=f"qkp-budget-v{PARSER_VERSION}-{'-'.join(map(str, crop_box))}",
+        pages=range(1, len(combos) + 1),
+        workers=ctx.workers,
+        executor=ctx.pool,
+    )
+    return {
+        f"{nn}_{d}_{int(float(b) * 10)}.txt": data
+        for (nn, d), page in zip(combos, results)
+        for b, data in zip(budgets, page)
+    }
+
+
+def write_sota_csv(instance_data, path):
+    with open(path, 'w') as f:
+        f.write('instance,algorithm,gap,runtime\n')
+        for instance in instance_data:
+            for algo in instance_data[instance]['gaps']:
+                f.write(f"{instance},{algo},{instance_data[instance]['gaps'][algo]},{instance_data[instance]['runtimes'][algo]}\n")
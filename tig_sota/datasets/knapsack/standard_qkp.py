@@ -0,0 +1,65 @@
+"""Standard QKP instances of size 100-300 items, with best-known OFVs and SOTA results."""
+
+import os
+
+from . import qkp_binary, qkp_convert, qkp_sota
+from ...manifest import IncompleteBuild, describe
+
+INSTANCE_URL_BASE = "https://cedric.cnam.fr/~soutif/QKP"
+PDF_URL = "https://github.com/phil85/results-for-qkp-benchmark-instances/raw/main/tables/Standard-QKP_detailed_results.pdf"
+
+n_nodes_list = [100, 200, 300]
+densities = {
+    100: [25, 50, 75, 100],
+    200: [25, 50, 75, 100],
+    300: [25, 50]
+}
+n_instances = 10
+combos = [(n_nodes, density, idx)
+         for n_nodes in n_nodes_list
+         for density in densities[n_nodes]
+         for idx in range(1, n_instances + 1)]
+instances = [f"{n_nodes}_{density}_{idx}.txt" for n_nodes, density, idx in combos]
+
+
+def save_instance(path, out_path, ofv):
+    with open(path, 'r') as f:
+        lines = f.read().split('\n')
+    nn = int(lines[1].strip())
+    linear, quad = qkp_convert.parse_triangular(lines[2:3 + nn], nn)
+    rows, cols, vals = qkp_convert.triangular_edges(linear, quad, nn)
+
+    budget = int(lines[4 + nn].strip())
+    weights = [int(v) for v in lines[5 + nn].split() if v]
+
+    qkp_convert.write_instance(out_path, nn, rows, cols, vals, weights, budget, ofv)
+    return describe(out_path, qkp_binary.bin_path(out_path))
+
+
+def build(out_dir, ctx):
+    # --- Step 1: Download and parse the OFV PDF ---
+    print("Downloading PDF of detailed results...")
+    pdf_path = ctx.engine.fetch(PDF_URL)
+
+    print("Extracting Best OFV and SOTA results...")
+    instance_data = qkp_sota.extract_instance_data(pdf_path, instances, crop_box=(40, 145, 535, 195), ctx=ctx)
+    print(f"Extracted data for {len(instance_data)} instances.")
+
+    # --- Step 2: Download and convert missing or stale instances in parallel ---
+    os.makedirs(out_dir, exist_ok=True)
+    downloads = {
+        f"{INSTANCE_URL_BASE}/jeu_{instance}": (instance, (instance_data[instance]['ofv'], qkp_convert.FORMAT_VERSION))
+        for instance in instances
+    }
+
+    def convert(path, instance):
+        return save_instance(path, os.path.join(out_dir, instance), instance_data[instance]['ofv'])
+
+    print(f"Checking {len(instances)} instances, fetching with {ctx.engine.max_workers} workers...")
+    with ctx.manifest(out_dir) as manifest:
+        failed = ctx.fetch_stale(manifest, downloads, convert)
+
+    print("Writing SOTA results ...")
+    qkp_sota.write_sota_csv(instance_data, os.path.join(out_dir, 'sota.csv'))
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
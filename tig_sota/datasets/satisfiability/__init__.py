@@ -0,0 +1 @@
+"""3-SAT dataset builders."""
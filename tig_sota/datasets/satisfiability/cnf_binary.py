@@ -0,0 +1,165 @@
+"""Packed binary form of CNF instances, written as {instance}.cnfb next to each {instance}.cnf,
+and a per-dataset index of instance statistics in ``cnf_index.csv``.
+
+Layout (little-endian)::
+
+    header    magic "CNFB", u32 version, u32 num_variables, u32 num_clauses, u64 num_literals
+    offsets   u64[num_clauses + 1], clause i is literals[offsets[i]:offsets[i + 1]]
+    literals  i32[num_literals], DIMACS literals without the terminating zeros
+"""
+
+import collections
+import csv
+import glob
+import os
+import struct
+
+import numpy as np
+
+from ...manifest import describe, source_hash
+
+MAGIC = b"CNFB"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIQ")
+INDEX_FILENAME = "cnf_index.csv"
+
+CNFInstance = collections.namedtuple("CNFInstance", ["num_variables", "num_clauses", "offsets", "literals"])
+
+# statistics recorded per instance in the index
+STATS = [
+    "num_variables", "num_clauses", "num_literals", "clause_ratio",
+    "min_clause_length", "max_clause_length", "positive_literals", "negative_literals",
+    "min_occurrences", "max_occurrences", "mean_occurrences",
+]
+
+
+def cnfb_path(cnf_path):
+    return os.path.splitext(cnf_path)[0] + ".cnfb"
+
+
+def parse_cnf(path):
+    """(num_variables, offsets, literals) of a DIMACS CNF file, keeping its first `num_clauses`
+    clauses as the evaluator does"""
+    num_variables = num_clauses = None
+    body = []
+    with open(path) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("p"):
+                _, _, num_variables, num_clauses = stripped.split()[:4]
+            elif stripped and not stripped.startswith(("c", "%")):
+                body.append(line)
+    if num_clauses is None:
+        raise ValueError(f"{path}: no problem line")
+    tokens = np.fromstring("".join(body), dtype=np.int64, sep=" ")
+    ends = np.flatnonzero(tokens == 0)[:int(num_clauses)]
+    if len(ends) < int(num_clauses):
+        raise ValueError(f"{path}: expected {num_clauses} clauses, found {len(ends)}")
+    # drop the zero terminators, then offsets follow from each clause's end
+    keep = np.ones(ends[-1] + 1 if len(ends) else 0, dtype=bool)
+    keep[ends] = False
+    literals = tokens[:len(keep)][keep].astype(np.int32)
+    offsets = np.zeros(len(ends) + 1, dtype=np.uint64)
+    offsets[1:] = ends - np.arange(len(ends))
+    return int(num_variables), offsets, literals
+
+
+def convert(cnf_path, out_path=None):
+    """Write the .cnfb form of `cnf_path`, returning the outputs as `describe` does"""
+    out_path = out_path or cnfb_path(cnf_path)
+    num_variables, offsets, literals = parse_cnf(cnf_path)
+    tmp = f"{out_path}.part"
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, num_variables, len(offsets) - 1, len(literals)))
+        out.write(offsets.astype("<u8").tobytes())
+        out.write(literals.astype("<i4").tobytes())
+    os.replace(tmp, out_path)
+    return describe(out_path)
+
+
+def read_instance(path):
+    """Memory-map a .cnfb instance; offsets and literals are read-only views into the file"""
+    with open(path, "rb") as f:
+        magic, version, num_variables, num_clauses, num_literals = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} binary CNF instance")
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    literals_start = HEADER.size + 8 * (num_clauses + 1)
+    offsets = data[HEADER.size:literals_start].view("<u8")
+    literals = data[literals_start:literals_start + 4 * num_literals].view("<i4")
+    return CNFInstance(num_variables, num_clauses, offsets, literals)
+
+
+def literal_counts(instance):
+    """Occurrences of each literal as a (num_variables + 1, 2) array of [positive, negative]
+    counts per variable (row 0 unused)"""
+    literals = np.asarray(instance.literals)
+    counts = np.zeros((instance.num_variables + 1, 2), dtype=np.int64)
+    counts[:, 0] = np.bincount(literals[literals > 0], minlength=instance.num_variables + 1)
+    counts[:, 1] = np.bincount(-literals[literals < 0], minlength=instance.num_variables + 1)
+    return counts
+
+
+def instance_stats(path):
+    """{statistic: value} of the .cnfb instance at `path`, for the index"""
+    instance = read_instance(path)
+    lengths = np.diff(np.asarray(instance.offsets).astype(np.int64))
+    occurrences = literal_counts(instance)[1:].sum(axis=1)
+    positive = int((np.asarray(instance.literals) > 0).sum())
+    return {
+        "num_variables": instance.num_variables,
+        "num_clauses": instance.num_clauses,
+        "num_literals": len(instance.literals),
+        "clause_ratio": round(instance.num_clauses / max(instance.num_variables, 1), 6),
+        "min_clause_length": int(lengths.min()) if len(lengths) else 0,
+        "max_clause_length": int(lengths.max()) if len(lengths) else 0,
+        "positive_literals": positive,
+        "negative_literals": len(instance.literals) - positive,
+        "min_occurrences": int(occurrences.min()) if len(occurrences) else 0,
+        "max_occurrences": int(occurrences.max()) if len(occurrences) else 0,
+        "mean_occurrences": round(float(occurrences.mean()), 6) if len(occurrences) else 0.0,
+    }
+
+
+def build(out_dir, manifest, executor):
+    """Convert the .cnf files of `out_dir` whose source changed, on `executor`, and rewrite the
+    index. Returns the names of the files that failed to convert."""
+    # the content hash of each .cnf, as recorded by the dataset's own manifest entries
+    cnf_hashes = {
+        name: output["sha256"]
+        for entry in list(manifest.entries.values())
+        for name, output in entry["outputs"].items() if name.endswith(".cnf")
+    }
+    tasks = {
+        os.path.basename(cnfb_path(name)): (source_hash(sha256, VERSION), (os.path.join(out_dir, name),))
+        for name, sha256 in cnf_hashes.items()
+    }
+    stale = manifest.stale({name: source for name, (source, _) in tasks.items()})
+    print(f"{len(tasks) - len(stale)} binary CNFs up to date, {len(stale)} to convert")
+    failed = manifest.build(executor, convert, {name: tasks[name] for name in stale})
+
+    paths = sorted(path for path in glob.glob(os.path.join(out_dir, "*.cnfb"))
+                   if os.path.basename(path) not in failed)
+    write_index(out_dir, zip(paths, executor.map(instance_stats, paths)))
+    return failed
+
+
+def write_index(out_dir, stats):
+    """Write ``cnf_index.csv`` from (path, `instance_stats`) pairs"""
+    path = os.path.join(out_dir, INDEX_FILENAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["instance"] + STATS)
+        for cnfb, row in stats:
+            writer.writerow([os.path.splitext(os.path.basename(cnfb))[0] + ".cnf"] + [row[name] for name in STATS])
+    os.replace(tmp, path)
+
+
+def read_index(out_dir):
+    """{instance: {statistic: value}} from ``cnf_index.csv``"""
+    with open(os.path.join(out_dir, INDEX_FILENAME), newline="") as f:
+        return {
+            row.pop("instance"): {name: float(value) if "." in value else int(value) for name, value in row.items()}
+            for row in csv.DictReader(f)
+        }
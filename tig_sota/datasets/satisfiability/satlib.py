@@ -0,0 +1,38 @@
+"""Uniform random 3-SAT instances from SATLIB."""
+
+import os
+
+from . import cnf_binary
+from ...fetch import extract_tar
+from ...manifest import IncompleteBuild, describe
+
+BASE_URL = "https://www.cs.ubc.ca/~hoos/SATLIB/Benchmarks/SAT/RND3SAT/"
+
+DATASETS = [
+    "uf20-91",
+    "uf50-218",
+    "uf75-325",
+    "uf100-430",
+    "uf125-538",
+    "uf150-645",
+    "uf175-753",
+    "uf200-860",
+    "uf225-960",
+    "uf250-1065",
+]
+
+
+def build(out_dir, ctx):
+    os.makedirs(out_dir, exist_ok=True)
+
+    # each archive is extracted as a whole, so the manifest tracks archives
+    def extract(path, dataset):
+        return describe(*extract_tar(path, out_dir, lambda member: member.name.endswith('.cnf')))
+
+    with ctx.manifest(out_dir) as manifest:
+        failed = ctx.fetch_stale(
+            manifest, {f"{BASE_URL}{dataset}.tar.gz": (dataset, ()) for dataset in DATASETS}, extract
+        )
+        failed += cnf_binary.build(out_dir, manifest, ctx.pool)
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
@@ -0,0 +1,105 @@
+"""Batch verification of SAT assignments, without the harness.
+
+An instance is held as flat literal and clause offset arrays (see `cnf_binary`). Checking a
+batch of assignments is one gather of every literal's variable value per assignment, and a
+``logical_or.reduceat`` over the clause boundaries, so thousands of assignments are
+checked in one pass over the instance.
+
+Stored solutions are DIMACS-style ``.sol`` files of signed literals, each assignment ending
+with ``0``, as SAT solvers print them (``v`` prefixes, ``s`` and ``c`` lines are ignored).
+A file may hold several assignments. Variables an assignment omits are false, as in a
+TIG solution.
+"""
+
+import numpy as np
+
+from . import cnf_binary
+from ... import solutions
+from ...manifest import sidecar_is_fresh
+
+# literal values gathered at once, bounding memory to about this many bytes
+GATHER_SIZE = 1 << 26
+
+
+def load(path):
+    """`cnf_binary.CNFInstance` of a .cnf file, from its .cnfb sidecar when that is present and
+    not older than the .cnf (as in the harness)"""
+    if sidecar_is_fresh(cnf_binary.cnfb_path(path), path):
+        return cnf_binary.read_instance(cnf_binary.cnfb_path(path))
+    num_variables, offsets, literals = cnf_binary.parse_cnf(path)
+    return cnf_binary.CNFInstance(num_variables, len(offsets) - 1, offsets, literals)
+
+
+def unsatisfied_clauses(instance, assignments):
+    """(batch, num_clauses) bool array of the clauses each of `assignments` leaves unsatisfied.
+    `assignments` is (batch, num_variables) bool, column i holding variable i + 1."""
+    assignments = np.atleast_2d(np.asarray(assignments, dtype=bool))
+    if assignments.shape[1] != instance.num_variables:
+        raise ValueError(f"assignments have {assignments.shape[1]} variables, expected {instance.num_variables}")
+    literals = np.asarray(instance.literals)
+    offsets = np.asarray(instance.offsets).astype(np.int64)
+    variables = np.abs(literals) - 1
+    positive = literals > 0
+    # reduceat cannot express empty segments: empty clauses stay unsatisfied, the others reduce
+    # over their own starts
+    nonempty = np.flatnonzero(offsets[1:] > offsets[:-1])
+    unsatisfied = np.ones((len(assignments), instance.num_clauses), dtype=bool)
+    if not len(nonempty):
+        return unsatisfied
+    starts = offsets[nonempty]
+    rows = max(1, GATHER_SIZE // max(len(literals), 1))
+    for start in range(0, len(assignments), rows):
+        satisfied = assignments[start:start + rows, variables] == positive
+        unsatisfied[start:start + rows, nonempty] = ~np.logical_or.reduceat(satisfied, starts, axis=1)
+    return unsatisfied
+
+
+def unsatisfied_counts(instance, assignments):
+    """Number of clauses each of `assignments` leaves unsatisfied; 0 means satisfying"""
+    return unsatisfied_clauses(instance, assignments).sum(axis=1)
+
+
+def read_assignments(path, num_variables):
+    """(batch, num_variables) bool array of the assignments stored in the .sol file at `path`"""
+    tokens = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if fields and fields[0] == "v":
+                fields = fields[1:]
+            elif fields and fields[0] in ("s", "c"):
+                continue
+            tokens.extend(fields)
+    literals = np.array(tokens, dtype=np.int64)
+    ends = np.flatnonzero(literals == 0)
+    if len(literals) and (not len(ends) or ends[-1] != len(literals) - 1):
+        # a final assignment without its terminator
+        ends = np.append(ends, len(literals))
+    if np.abs(literals).max(initial=0) > num_variables:
+        raise ValueError(f"{path}: literal beyond the {num_variables} variables of the instance")
+    assignments = np.zeros((len(ends), num_variables), dtype=bool)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    for row, (start, end) in enumerate(zip(starts, ends)):
+        chosen = literals[start:end]
+        assignments[row, chosen[chosen > 0] - 1] = True
+    return assignments
+
+
+def audit_instance(cnf_path, sol_path):
+    """Unsatisfied clause count of each assignment stored in `sol_path`, against `cnf_path`"""
+    instance = load(cnf_path)
+    return unsatisfied_counts(instance, read_assignments(sol_path, instance.num_variables))
+
+
+def audit(dataset_dir, solutions_dir=None, executor=None):
+    """{instance name: unsatisfied clause counts} of the stored solutions ``<instance>.sol`` in
+    `solutions_dir` (default: next to the instances) of the .cnf instances in `dataset_dir`.
+    Instances are checked on `executor` when given."""
+    return solutions.audit(dataset_dir, ".cnf", audit_instance, solutions_dir, executor)
+
+
+def summary(unsatisfied):
+    """(report line, whether any assignment is unsatisfying) of the counts `audit` returns for an instance"""
+    wrong = int((unsatisfied > 0).sum())
+    line = f"{len(unsatisfied)} assignments, {wrong} unsatisfying"
+    return line + (f" (up to {unsatisfied.max()} clauses)" if wrong else ""), wrong > 0
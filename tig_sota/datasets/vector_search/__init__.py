@@ -0,0 +1 @@
+"""Vector search dataset builders."""
@@ -0,0 +1,71 @@
+"""Fashion-MNIST dataset for ANN evaluation, converted to the evaluator's .bin format."""
+
+import os
+
+import numpy as np
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ...manifest import describe, source_hash
+
+BASE_URL = "https://huggingface.co/datasets/open-vdb/fashion-mnist-784-euclidean/resolve/main"
+BATCH_ROWS = 1 << 14
+
+
+def write_vectors(parquet, out):
+    """Write the `emb` list column as contiguous float32 rows, one record batch at a time. Returns the vector dimension"""
+    dims = None
+    for batch in parquet.iter_batches(batch_size=BATCH_ROWS, columns=["emb"]):
+        emb = batch.column(0)
+        lengths = pc.min_max(pc.list_value_length(emb))
+        if dims is None:
+            dims = lengths["min"].as_py()
+        if lengths["min"].as_py() != dims or lengths["max"].as_py() != dims:
+            raise ValueError(f"Expected {dims}-dimensional vectors")
+        out.write(np.ascontiguousarray(emb.flatten().to_numpy(), dtype=np.float32).data)
+    return dims
+
+
+def build(out_dir, ctx):
+    paths = []
+    for kind, name in (
+        ("query vectors", "test/test-00001-of-00001.parquet"),
+        ("database vectors", "train/train-00001-of-00001.parquet"),
+        ("nearest neighbors", "neighbors/neighbors-vector-emb-pk-idx-expr-None-metric-l2.parquet"),
+    ):
+        print(f"Downloading {kind}: {BASE_URL}/{name}")
+        paths.append(ctx.engine.fetch(f"{BASE_URL}/{name}"))
+    # cached downloads are named by their content hash
+    source = source_hash(*map(os.path.basename, paths))
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "784-euclidean.bin")
+    with ctx.manifest(out_dir) as manifest:
+        if manifest.fresh("784-euclidean.bin", source):
+            print("784-euclidean.bin is up to date")
+            return
+        write_bin(*paths, out_path)
+        manifest.record("784-euclidean.bin", source, describe(out_path))
+
+
+def write_bin(queries_path, database_path, neighbors_path, out_path):
+    queries = pq.ParquetFile(queries_path, memory_map=True)
+    num_queries = queries.metadata.num_rows
+    database = pq.ParquetFile(database_path, memory_map=True)
+    database_size = database.metadata.num_rows
+    neighbors = pq.ParquetFile(neighbors_path, memory_map=True)
+
+    with open(out_path + ".part", "wb") as f:
+        # vector dimension is filled in once the first batch has been read
+        f.write(bytes(4))
+        f.write(database_size.to_bytes(length=4, byteorder="little", signed=False))
+        f.write(num_queries.to_bytes(length=4, byteorder="little", signed=False))
+        vector_dims = write_vectors(database, f)
+        if write_vectors(queries, f) != vector_dims:
+            raise ValueError("Query and database vectors have different dimensions")
+        for batch in neighbors.iter_batches(batch_size=BATCH_ROWS, columns=["neighbors_id"]):
+            # keep just the nearest neighbour
+            nearest_neighbours = pc.list_element(batch.column(0), 0).to_numpy()
+            f.write(np.ascontiguousarray(nearest_neighbours, dtype=np.int32).data)
+        f.seek(0)
+        f.write(vector_dims.to_bytes(length=4, byteorder="little", signed=False))
+    os.replace(out_path + ".part", out_path)
@@ -0,0 +1,103 @@
+"""Exact k-nearest-neighbour ground truth on the CPU.
+
+Squared distances are computed in blocks as ``|q|^2 - 2 q.x + |x|^2``, so the work is one
+float32 matrix product (BLAS) per (query batch, database block). Each block's best
+candidates are merged into a running top list per query, so memory is bounded by the
+batch and block sizes rather than the database size. Query batches run on a thread pool,
+since BLAS releases the GIL. Float32 products lose precision when vector norms are large,
+so a few more candidates than needed are kept and re-ranked with exact float64 distances.
+Ties are broken by the lower database index.
+"""
+
+import concurrent.futures
+import os
+
+import numpy as np
+
+from .vector_bin import VectorDataset
+
+QUERY_BATCH = 256
+DATABASE_BLOCK = 1 << 15
+# extra candidates kept per query for the exact re-ranking
+RERANK_MARGIN = 16
+
+
+def _top(distances, indices, k):
+    """Per row, the `k` smallest of `distances` with their `indices`, unordered"""
+    if distances.shape[1] <= k:
+        return distances, indices
+    part = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(distances, part, axis=1), np.take_along_axis(indices, part, axis=1)
+
+
+def _search_batch(database, norms, queries, k, block):
+    candidates = min(k + RERANK_MARGIN, len(database))
+    queries32 = np.asarray(queries, dtype=np.float32)
+    query_norms = np.einsum("ij,ij->i", queries32, queries32)[:, None]
+    best = np.full((len(queries), 0), np.inf, dtype=np.float32)
+    best_indices = np.empty((len(queries), 0), dtype=np.int64)
+    for start in range(0, len(database), block):
+        chunk = np.asarray(database[start:start + block], dtype=np.float32)
+        distances = query_norms - 2 * (queries32 @ chunk.T) + norms[None, start:start + len(chunk)]
+        indices = np.broadcast_to(np.arange(start, start + len(chunk)), distances.shape)
+        distances, indices = _top(distances, indices, candidates)
+        best, best_indices = _top(
+            np.concatenate([best, distances], axis=1), np.concatenate([best_indices, indices], axis=1), candidates
+        )
+
+    # exact re-ranking of the candidates
+    queries64 = np.asarray(queries, dtype=np.float64)
+    exact = ((np.asarray(database[best_indices.ravel()], dtype=np.float64).reshape(*best_indices.shape, -1)
+              - queries64[:, None, :]) ** 2).sum(axis=2)
+    order = np.lexsort((best_indices, exact), axis=1)[:, :k]
+    return np.take_along_axis(best_indices, order, axis=1), np.sqrt(np.take_along_axis(exact, order, axis=1))
+
+
+def exact_knn(database, queries, k=1, workers=None, query_batch=QUERY_BATCH, database_block=DATABASE_BLOCK):
+    """(indices, distances) of the `k` nearest `database` vectors of each of `queries`, both
+    (num_queries, k) and ordered nearest first. Distances are Euclidean.
+
+    Peak memory per worker is about ``query_batch * database_block`` float32 values."""
+    norms = np.empty(len(database), dtype=np.float32)
+    for start in range(0, len(database), database_block):
+        chunk = np.asarray(database[start:start + database_block], dtype=np.float32)
+        norms[start:start + len(chunk)] = np.einsum("ij,ij->i", chunk, chunk)
+
+    indices = np.empty((len(queries), k), dtype=np.int64)
+    distances = np.empty((len(queries), k), dtype=np.float64)
+
+    def job(start):
+        stop = min(start + query_batch, len(queries))
+        indices[start:stop], distances[start:stop] = _search_batch(
+            database, norms, queries[start:stop], k, database_block
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+        for future in [executor.submit(job, start) for start in range(0, len(queries), query_batch)]:
+            future.result()
+    return indices, distances
+
+
+def verify(path, workers=None, rtol=1e-6):
+    """Check the ``nearest_neighbours`` stored in the .bin file at `path` against exact search.
+    Returns the indices of the queries whose stored neighbour is farther than the exact
+    nearest neighbour (beyond `rtol`), and the exact neighbours."""
+    data = VectorDataset(path)
+    exact, distances = exact_knn(data.database, data.queries, k=1, workers=workers)
+    stored = np.asarray(data.nearest_neighbours, dtype=np.int64)
+    stored_distances = np.sqrt(((np.asarray(data.database[stored], dtype=np.float64)
+                                 - np.asarray(data.queries, dtype=np.float64)) ** 2).sum(axis=1))
+    # a different index at the same distance is a tie, not an error
+    wrong = np.flatnonzero(stored_distances > distances[:, 0] * (1 + rtol))
+    return wrong, exact[:, 0]
+
+
+def regenerate(path, workers=None):
+    """Recompute and overwrite the ``nearest_neighbours`` of the .bin file at `path` in place.
+    Returns the number of queries whose neighbour changed."""
+    data = VectorDataset(path, mode="r+")
+    exact, _ = exact_knn(data.database, data.queries, k=1, workers=workers)
+    changed = int((data.nearest_neighbours != exact[:, 0]).sum())
+    data.nearest_neighbours[:] = exact[:, 0]
+    data.flush()
+    return changed
@@ -0,0 +1,77 @@
+"""Scale-Invariant Feature Transform (SIFT) dataset, converted to the evaluator's .bin format."""
+
+import io
+import os
+import tarfile
+
+import numpy as np
+
+from ...manifest import describe
+
+URL = "ftp://ftp.irisa.fr/local/texmex/corpus/sift.tar.gz"
+CHUNK_VECTORS = 1 << 16
+
+
+def extract_vectors(f, size, out, keep=None):
+    """Stream .fvecs/.ivecs records from f into out, dropping each record's leading dimension.
+    Only the first `keep` components of each vector are written if given. Returns (num_vectors, dim)"""
+    head = f.read(4)
+    dim = int(np.frombuffer(head, dtype="<i4")[0])
+    record_size = 4 * (dim + 1)
+    num_vectors = size // record_size
+    for start in range(0, num_vectors, CHUNK_VECTORS):
+        n = min(CHUNK_VECTORS, num_vectors - start)
+        records = np.frombuffer(head + f.read(n * record_size - len(head)), dtype="<i4").reshape(n, dim + 1)
+        head = b""
+        if (records[:, 0] != dim).any():
+            raise ValueError("Inconsistent vector dimensions")
+        out.write(records[:, 1:1 + (keep or dim)].tobytes())
+    return num_vectors, dim
+
+
+def build(out_dir, ctx):
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "sift.bin")
+
+    print("Downloading SIFT dataset: " + URL)
+    archive_path = ctx.engine.fetch(URL)
+    # cached downloads are named by their content hash
+    source = os.path.basename(archive_path)
+    with ctx.manifest(out_dir) as manifest:
+        if manifest.fresh("sift.bin", source):
+            print("sift.bin is up to date")
+            return
+        write_bin(archive_path, out_path)
+        manifest.record("sift.bin", source, describe(out_path))
+
+
+def write_bin(archive_path, out_path):
+    query_vectors = io.BytesIO()
+    nearest_neighbours = io.BytesIO()
+    with open(out_path + ".part", "wb") as out:
+        # header is filled in once all sizes are known, database vectors are streamed straight after it
+        out.write(bytes(12))
+        with open(archive_path, "rb") as archive, tarfile.open(fileobj=archive, mode="r|gz") as tar:
+            for member in tar:
+                if "sift_base.fvecs" in member.name:
+                    with tar.extractfile(member) as f:
+                        database_size, vector_dims = extract_vectors(f, member.size, out)
+                elif "sift_query.fvecs" in member.name:
+                    with tar.extractfile(member) as f:
+                        num_queries, _ = extract_vectors(f, member.size, query_vectors)
+                elif "sift_groundtruth.ivecs" in member.name:
+                    with tar.extractfile(member) as f:
+                        # keep just the nearest neighbour
+                        num_groundtruth, groundtruth_dims = extract_vectors(f, member.size, nearest_neighbours, keep=1)
+
+        out.write(query_vectors.getbuffer())
+        out.write(nearest_neighbours.getbuffer())
+        out.seek(0)
+        out.write(vector_dims.to_bytes(length=4, byteorder="little", signed=False))
+        out.write(database_size.to_bytes(length=4, byteorder="little", signed=False))
+        out.write(num_queries.to_bytes(length=4, byteorder="little", signed=False))
+    os.replace(out_path + ".part", out_path)
+
+    print("Database vectors shape:", database_size, "x", vector_dims)
+    print("Query vectors shape:", num_queries, "x", vector_dims)
+    print("Groundtruth vectors shape:", num_groundtruth, "x", groundtruth_dims)
@@ -0,0 +1,83 @@
+"""The evaluator's vector search .bin format, as written by the SIFT and Fashion-MNIST builders.
+
+Layout (little-endian)::
+
+    header              u32 vector_dims, u32 database_size, u32 num_queries
+    database            f32[database_size * vector_dims]
+    queries             f32[num_queries * vector_dims]
+    nearest_neighbours  u32[num_queries], index of each query's nearest database vector
+
+`VectorDataset` memory-maps a file, so sections, shards and batches are views into the page
+cache and only the rows actually touched are ever read.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+HEADER = struct.Struct("<III")
+# database rows copied per write
+CHUNK_ROWS = 1 << 16
+
+
+class VectorDataset:
+    """Zero-copy views of a .bin file: `database` (database_size, vector_dims), `queries`
+    (num_queries, vector_dims) and `nearest_neighbours` (num_queries,).
+    Open with ``mode="r+"`` to modify the file in place."""
+
+    def __init__(self, path, mode="r"):
+        self.path = path
+        with open(path, "rb") as f:
+            self.vector_dims, self.database_size, self.num_queries = HEADER.unpack(f.read(HEADER.size))
+        self._data = np.memmap(path, dtype=np.uint8, mode=mode)
+        database_end = HEADER.size + 4 * self.database_size * self.vector_dims
+        queries_end = database_end + 4 * self.num_queries * self.vector_dims
+        if len(self._data) != queries_end + 4 * self.num_queries:
+            raise ValueError(f"{path}: size does not match its header")
+        self.database = self._data[HEADER.size:database_end].view("<f4").reshape(self.database_size, self.vector_dims)
+        self.queries = self._data[database_end:queries_end].view("<f4").reshape(self.num_queries, self.vector_dims)
+        self.nearest_neighbours = self._data[queries_end:].view("<u4")
+
+    def __len__(self):
+        return self.database_size
+
+    def shard_bounds(self, index, count):
+        """(start, stop) database rows of shard `index` of `count` near-equal shards"""
+        if not 0 <= index < count:
+            raise IndexError(f"shard {index} of {count}")
+        return self.database_size * index // count, self.database_size * (index + 1) // count
+
+    def shard(self, index, count):
+        """(start row, database rows) of shard `index` of `count`"""
+        start, stop = self.shard_bounds(index, count)
+        return start, self.database[start:stop]
+
+    def shards(self, count):
+        """Every shard of `count`, as (start row, database rows)"""
+        return (self.shard(index, count) for index in range(count))
+
+    def query_batches(self, batch_size):
+        """(start, queries, nearest_neighbours) of consecutive batches of up to `batch_size` queries"""
+        for start in range(0, self.num_queries, batch_size):
+            stop = min(start + batch_size, self.num_queries)
+            yield start, self.queries[start:stop], self.nearest_neighbours[start:stop]
+
+    def flush(self):
+        self._data.flush()
+
+    def __repr__(self):
+        return (f"VectorDataset({self.path!r}, database={self.database_size}x{self.vector_dims}, "
+                f"queries={self.num_queries})")
+
+
+def write_bin(path, database, queries, nearest_neighbours):
+    """Write a .bin file, copying `database` (which may be a memmap) in chunks of rows"""
+    tmp = f"{path}.part"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(database.shape[1], len(database), len(queries)))
+        for start in range(0, len(database), CHUNK_ROWS):
+            f.write(np.ascontiguousarray(database[start:start + CHUNK_ROWS], dtype="<f4").data)
+        f.write(np.ascontiguousarray(queries, dtype="<f4").data)
+        f.write(np.ascontiguousarray(nearest_neighbours, dtype="<u4").data)
+    os.replace(tmp, path)
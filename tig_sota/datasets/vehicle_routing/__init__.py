@@ -0,0 +1 @@
+"""Vehicle routing dataset builders."""
@@ -0,0 +1,134 @@
+"""Homberger and Gehring CVRPTW instances with their best-known .sol files and SOTA results."""
+
+import itertools
+import os
+import re
+import shutil
+
+from . import hg_baseline, hg_distances
+from ...manifest import IncompleteBuild, describe, source_hash
+from ...pdf_tables import extract_pages
+
+BASE_URL = "https://vrp.galgos.inf.puc-rio.br/media/com_vrp/instances/HG/"
+PDF_URL = "https://www.cirrelt.ca/documentstravail/cirrelt-2011-61.pdf"
+
+# in the order of the original download script, which sota.csv rows follow
+INSTANCES = [
+    f"{combo[0]}_{combo[1]}_{combo[2]}"
+    for combo in itertools.product(
+        ['C1', 'C2', 'R1', 'R2', 'RC1', 'RC2'],
+        [2, 4, 6, 8, 10],
+        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    )
+]
+
+
+def find_table_11(page):
+    text = page.extract_text() or ""
+    return page.extract_table() if "Table 11" in text else None
+
+
+def build_matrix(txt_path, out_path):
+    return describe(hg_distances.write_matrix(txt_path, out_path))
+
+
+def build(out_dir, ctx):
+    import pandas as pd
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Download Dataset, copying only files that are missing or changed
+    def save(path, name):
+        save_path = os.path.join(out_dir, name)
+        shutil.copyfile(path, save_path)
+        return describe(save_path)
+
+    downloads = {}
+    for instance, extension in itertools.product(INSTANCES, [".txt", ".sol"]):
+        name = f"{instance}{extension}"
+        downloads[f"{BASE_URL}{name}"] = (name, ())
+
+    with ctx.manifest(out_dir) as manifest:
+        # the instance host serves an expired TLS certificate, so it cannot be verified (as in the
+        # original download script); pinned digests in tig_sota/digests.json still check the content
+        failed = ctx.fetch_stale(manifest, downloads, save, verify=False)
+
+        # Precompute the distance matrices of instances whose .txt is new or changed
+        txt_names = [name for name, _ in downloads.values() if name.endswith(".txt")]
+        sources = {
+            hg_distances.dist_path(name): source_hash(manifest.entries[name]["source"], hg_distances.VERSION)
+            for name in txt_names if name not in failed
+        }
+        stale = manifest.stale(sources)
+        print(f"{len(sources) - len(stale)} distance matrices up to date, {len(stale)} to compute")
+        failed += manifest.build(ctx.pool, build_matrix, {
+            name: (sources[name], (os.path.join(out_dir, name[:-len(".dist")] + ".txt"), os.path.join(out_dir, name)))
+            for name in stale
+        })
+    if failed:
+        raise IncompleteBuild(os.path.basename(out_dir), failed)
+
+    # Download SOTA results
+    print("Downloading SOTA results")
+    # pages are scanned in parallel and the result cached by PDF hash
+    pages = extract_pages(
+        ctx.engine.fetch(PDF_URL), find_table_11, key="hg-table-11-v1",
+        workers=ctx.workers, executor=ctx.pool,
+    )
+    tables = [t for t in pages if t is not None]
+    if not tables:
+        raise ValueError("Table 11 not found in the SOTA results PDF.")
+    table = tables[0]
+
+    # Parse the table into a DataFrame
+    print("Parsing SOTA results")
+    headers = table[0]
+    method_names = [h.strip() for h in headers[1:]]
+    records = []
+
+    for row in table[1:]:
+        # Parse n and vehicle options
+        tokens0 = re.split(r"\s+", (row[0] or "").strip())
+        if len(tokens0) < 2:
+            continue
+        n = int(tokens0[0])
+        vehicle_opts = [int(x) for x in tokens0[1:]]
+        # Extract each method column
+        for col_idx, method in enumerate(method_names, start=1):
+            tokens = re.split(r"\s+", (row[col_idx] or "").strip())
+            # Pair up used & distance
+            pairs = []
+            for i in range(0, len(tokens)-1, 2):
+                try:
+                    used = int(tokens[i])
+                    dist = float(tokens[i+1])
+                except ValueError:
+                    continue
+                pairs.append((used, dist))
+            # Record entries matching vehicle options
+            for idx, (used, dist) in enumerate(pairs[:len(vehicle_opts)]):
+                inst = f"{method.upper()}_{int(n/100)}_{idx+1}"
+                records.append({
+                    'instance': inst,
+                    # 'n': n,
+                    # 'num_veh': vehicle_opts[idx],
+                    # 'method': method.upper(),
+                    'nv': used,
+                    'distance': dist
+                })
+    sota_df = pd.DataFrame(records)
+
+    # Index baseline results, parsing the .sol files in parallel
+    print("Indexing baseline results")
+    baselines = hg_baseline.build_index(out_dir, ctx.pool, INSTANCES)
+    baseline_df = pd.DataFrame({
+        'instance': baselines.instances,
+        'baseline_fleet_size': baselines.fleet_sizes,
+        'baseline_distance': baselines.distances.round().astype(int),
+    })
+
+    # Merge SOTA + baseline and save results
+    print("Merging SOTA + baseline results, and saving to sota.csv")
+    merged_df = baseline_df.merge(sota_df, on='instance', how='left')
+    merged_df['rpd'] = 100 * (merged_df['distance'] - merged_df['baseline_distance']) / merged_df['distance']
+    merged_df.to_csv(os.path.join(out_dir, "sota.csv"), index=False)
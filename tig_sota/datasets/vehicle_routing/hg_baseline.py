@@ -0,0 +1,99 @@
+"""Baseline index of the best-known HG solutions.
+
+The ``.sol`` files of a dataset are parsed once, in parallel, into ``baselines.csv`` with
+one row per instance: its baseline fleet size, its baseline distance (as written in the
+``.sol`` file) and the number of customers on each route. The SOTA merge, the notebooks
+and the evaluator read this one file instead of re-scanning every ``.sol`` file.
+"""
+
+import collections
+import csv
+import glob
+import os
+import re
+
+import numpy as np
+
+FILENAME = "baselines.csv"
+HEADER = ["instance", "baseline_fleet_size", "baseline_distance", "route_lengths"]
+
+# customers follow the colon of "Route #1: 12 34 ..."
+ROUTE_RE = re.compile(r"^route\s+#[^:\n]*(?::(.*))?$", re.IGNORECASE | re.MULTILINE)
+COST_RE = re.compile(r"cost\s+(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+Baseline = collections.namedtuple("Baseline", ["instance", "fleet_size", "distance", "route_lengths"])
+
+
+def parse_sol(path):
+    """`Baseline` of the solution file at `path`; its distance is the last ``Cost`` in the file"""
+    with open(path) as f:
+        text = f.read()
+    costs = COST_RE.findall(text)
+    if not costs:
+        raise ValueError(f"Baseline distance not found in {os.path.basename(path)}")
+    route_lengths = [len(route.split()) for route in ROUTE_RE.findall(text)]
+    instance = os.path.splitext(os.path.basename(path))[0]
+    return Baseline(instance, len(route_lengths), float(costs[-1]), route_lengths)
+
+
+def build_index(dataset_dir, executor=None, instances=None):
+    """Parse the ``.sol`` files of `instances` (every ``.sol`` file of `dataset_dir`, sorted, by
+    default) on `executor` if given, into its ``baselines.csv`` in that order. Returns the
+    `BaselineIndex`."""
+    if instances is None:
+        paths = sorted(glob.glob(os.path.join(dataset_dir, "*.sol")))
+    else:
+        paths = [os.path.join(dataset_dir, f"{instance}.sol") for instance in instances]
+    if executor is None:
+        baselines = list(map(parse_sol, paths))
+    else:
+        baselines = list(executor.map(parse_sol, paths, chunksize=max(1, len(paths) // 64)))
+
+    path = os.path.join(dataset_dir, FILENAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(HEADER)
+        for b in baselines:
+            writer.writerow([b.instance, b.fleet_size, repr(b.distance), " ".join(map(str, b.route_lengths))])
+    os.replace(tmp, path)
+    return BaselineIndex(baselines)
+
+
+class BaselineIndex:
+    """Baselines of a dataset by instance name, with `instances`, `fleet_sizes` and
+    `distances` as aligned arrays for vectorized use"""
+
+    def __init__(self, baselines):
+        self._baselines = {b.instance: b for b in baselines}
+        self.instances = np.array(list(self._baselines), dtype=object)
+        self.fleet_sizes = np.array([b.fleet_size for b in self._baselines.values()], dtype=np.int32)
+        self.distances = np.array([b.distance for b in self._baselines.values()], dtype=np.float64)
+
+    @classmethod
+    def load(cls, dataset_dir):
+        with open(os.path.join(dataset_dir, FILENAME), newline="") as f:
+            return cls(
+                Baseline(row["instance"], int(row["baseline_fleet_size"]), float(row["baseline_distance"]),
+                         [int(n) for n in row["route_lengths"].split()])
+                for row in csv.DictReader(f)
+            )
+
+    def __getitem__(self, instance):
+        """`Baseline` of `instance`, with or without its extension"""
+        return self._baselines[os.path.splitext(instance)[0]]
+
+    def get(self, instance, default=None):
+        try:
+            return self[instance]
+        except KeyError:
+            return default
+
+    def __contains__(self, instance):
+        return os.path.splitext(instance)[0] in self._baselines
+
+    def __iter__(self):
+        return iter(self._baselines.values())
+
+    def __len__(self):
+        return len(self._baselines)
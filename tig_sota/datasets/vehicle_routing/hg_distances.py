@@ -0,0 +1,80 @@
+"""Precomputed distance matrices of HG instances, written as {instance}.dist next to each {instance}.txt.
+
+Distances are computed exactly as the evaluator does: coordinates scaled by `SCALE` and
+rounded, then the Euclidean distance between each pair rounded (half away from zero, as
+Rust's ``f64::round``), so the harness can load the matrix instead of recomputing it.
+
+Layout (little-endian)::
+
+    header   magic "HGDM", u32 version, u32 num_nodes (depot included)
+    matrix   i32[num_nodes * num_nodes], row-major
+"""
+
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"HGDM"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+
+# coordinate scaling of the evaluator (see SCALE in vehicle_routing_evaluator/src/main.rs.template)
+SCALE = 10.0
+
+
+def dist_path(txt_path):
+    return txt_path[:-len(".txt")] + ".dist" if txt_path.endswith(".txt") else txt_path + ".dist"
+
+
+def round_half_away(a):
+    """Round like Rust's ``f64::round`` (numpy rounds ties to even)"""
+    truncated = np.trunc(a)
+    return np.where(np.abs(a - truncated) == 0.5, truncated + np.sign(a), np.rint(a))
+
+
+def read_coordinates(txt_path):
+    """Scaled, rounded (x, y) of the depot and customers, accepting the same customer lines as the evaluator"""
+    xs, ys = [], []
+    in_customers = False
+    with open(txt_path) as f:
+        for line in f:
+            if "CUST NO." in line:
+                in_customers = True
+                continue
+            parts = line.split()
+            if not in_customers or len(parts) != 7:
+                continue
+            try:
+                _cid, _demand = int(parts[0]), int(parts[3])
+                x, y, _ready, _due, _service = (float(parts[i]) for i in (1, 2, 4, 5, 6))
+            except ValueError:
+                continue
+            xs.append(x)
+            ys.append(y)
+    return round_half_away(np.array(xs) * SCALE), round_half_away(np.array(ys) * SCALE)
+
+
+def distance_matrix(x, y):
+    return round_half_away(np.hypot(x[:, None] - x[None, :], y[:, None] - y[None, :])).astype(np.int32)
+
+
+def write_matrix(txt_path, out_path=None):
+    """Write the distance matrix of the instance at `txt_path`, returning the written path"""
+    out_path = out_path or dist_path(txt_path)
+    matrix = distance_matrix(*read_coordinates(txt_path))
+    tmp = f"{out_path}.part"
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, len(matrix)))
+        out.write(matrix.astype("<i4").tobytes())
+    os.replace(tmp, out_path)
+    return out_path
+
+
+def read_matrix(path):
+    """Memory-map a .dist file as a read-only (num_nodes, num_nodes) int32 array"""
+    with open(path, "rb") as f:
+        magic, version, num_nodes = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} HG distance matrix")
+    return np.memmap(path, dtype="<i4", mode="r", offset=HEADER.size, shape=(num_nodes, num_nodes))
@@ -0,0 +1,220 @@
+"""Evaluation orchestrator: build each algorithm once, then run it over many datasets concurrently.
+
+``run.sh`` rewrites ``Cargo.toml`` and ``src/main.rs`` in place, so evaluating N algorithms on
+M datasets compiles N x M times, one evaluation at a time. Here every algorithm gets its own
+crate under ``<challenge>_evaluator/build/<algorithm>``, and is built exactly once.
+Downloaded crates and git checkouts are shared through the usual ``CARGO_HOME``. With
+``sccache`` installed, compiled dependencies are shared through it and every crate has its
+own target directory, so algorithms build in parallel. Without it, all crates share one
+target directory so dependencies still compile once, and algorithms build one at a time
+(cargo locks the target directory), with a warning. Each binary is copied to
+``bin/<algorithm>`` in its crate. Built binaries are then run over (algorithm, dataset) pairs on a
+worker pool, splitting the machine's cores between concurrent evaluations. With a
+timeout or memory limit, or for per-instance resource telemetry, every instance runs in
+its own supervised process instead (see `supervise`).
+"""
+
+import concurrent.futures
+import os
+import re
+import contextlib
+import shutil
+import subprocess
+import threading
+
+from . import supervise
+from .datasets import CHALLENGE_IDS, DATASETS, REPO_ROOT
+
+# challenges whose evaluations share a GPU, so are run one at a time by default
+GPU_CHALLENGES = {"vector_search"}
+
+
+def evaluator_dir(challenge):
+    return os.path.join(REPO_ROOT, f"{challenge}_evaluator")
+
+
+def is_local(challenge, algorithm):
+    """Whether `algorithm` is a local algorithm in ``src/<algorithm>.rs`` rather than a TIG branch"""
+    return os.path.exists(os.path.join(evaluator_dir(challenge), "src", f"{algorithm}.rs"))
+
+
+def prepare_crate(challenge, algorithm, build_root=None):
+    """Write the evaluator crate of `algorithm` (the same files ``run.sh`` generates) into its
+    own directory and return that directory"""
+    src_dir = evaluator_dir(challenge)
+    crate_dir = os.path.join(build_root or os.path.join(src_dir, "build"), algorithm)
+    os.makedirs(os.path.join(crate_dir, "src"), exist_ok=True)
+
+    branch = "blank_slate" if is_local(challenge, algorithm) else f"{challenge}/{algorithm}"
+    with open(os.path.join(src_dir, "Cargo.toml.template")) as f:
+        cargo_toml = f.read().replace("${BRANCH}", branch)
+    with open(os.path.join(src_dir, "src", "main.rs.template")) as f:
+        main_rs = f.read().replace("${ALGORITHM}", algorithm)
+    _write_if_changed(os.path.join(crate_dir, "Cargo.toml"), cargo_toml)
+    _write_if_changed(os.path.join(crate_dir, "src", "main.rs"), main_rs)
+
+    # local algorithm sources and build scripts, next to main.rs as in the evaluator
+    shutil.copytree(
+        os.path.join(src_dir, "src"), os.path.join(crate_dir, "src"), dirs_exist_ok=True,
+        ignore=lambda _, names: [n for n in names if n.startswith("main.rs")],
+    )
+    if os.path.exists(os.path.join(src_dir, "build.rs")):
+        shutil.copy2(os.path.join(src_dir, "build.rs"), crate_dir)
+    return crate_dir
+
+
+def _write_if_changed(path, text):
+    # unchanged files keep their mtime so cargo does not rebuild
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def has_compiler_cache():
+    """Whether compiled dependencies are cached across target directories (sccache or another
+    ``RUSTC_WRAPPER``)"""
+    return "RUSTC_WRAPPER" in os.environ or shutil.which("sccache") is not None
+
+
+def build_env(algorithm):
+    env = {**os.environ, "ALGORITHM": algorithm}
+    if "RUSTC_WRAPPER" not in env and shutil.which("sccache"):
+        env["RUSTC_WRAPPER"] = "sccache"
+    return env
+
+
+# builds in a shared target directory all write their binary to the same path
+_shared_target_lock = threading.Lock()
+
+
+def build(challenge, algorithm, build_root=None, jobs=None, shared_target=False):
+    """Build `algorithm` in release mode, returning the path of its evaluator binary
+    (``bin/<algorithm>`` in its crate directory). Compiler output goes to ``build.log`` in the
+    crate directory. With `shared_target`, the build uses the ``target`` directory shared by
+    every crate of the build root, one build at a time."""
+    crate_dir = prepare_crate(challenge, algorithm, build_root)
+    with open(os.path.join(crate_dir, "Cargo.toml")) as f:
+        package = re.search(r'^name\s*=\s*"([^"]+)"', f.read(), re.MULTILINE).group(1)
+
+    cmd = ["cargo", "build", "--release", "--manifest-path", os.path.join(crate_dir, "Cargo.toml")]
+    if is_local(challenge, algorithm):
+        cmd += ["--features", "local"]
+    if jobs:
+        cmd += ["--jobs", str(jobs)]
+    target_dir = os.path.join(os.path.dirname(crate_dir) if shared_target else crate_dir, "target")
+    env = {**build_env(algorithm), "CARGO_TARGET_DIR": target_dir}
+    binary = os.path.join(crate_dir, "bin", algorithm)
+    os.makedirs(os.path.dirname(binary), exist_ok=True)
+    with _shared_target_lock if shared_target else contextlib.nullcontext():
+        print(f"Building {algorithm}")
+        with open(os.path.join(crate_dir, "build.log"), "w") as log:
+            subprocess.run(cmd, cwd=crate_dir, env=env, stdout=log, stderr=subprocess.STDOUT, check=True)
+        # through a temporary file, as a previous build of the binary may still be running
+        shutil.copy2(os.path.join(target_dir, "release", package), binary + ".part")
+        os.replace(binary + ".part", binary)
+    return binary
+
+
+def run_evaluation(challenge, algorithm, dataset, binary, threads=None, log_dir=None, timeout=None, memory_limit=None,
+                   supervised=False):
+    """Evaluate the built `binary` on ``data/<dataset>``, writing the usual
+    ``evaluations/c00X_<dataset>_<algorithm>.csv``. Output goes to ``<dataset>.log``
+    in `log_dir` (the crate directory by default).
+
+    When `supervised`, or given a `timeout` (seconds per instance) or `memory_limit` (bytes),
+    instances run one per supervised process, `threads` at a time, recording each one's
+    resource usage, and those exceeding a limit are recorded with a ``timeout`` / ``oom`` status."""
+    env = {**os.environ, "ALGORITHM": algorithm}
+    log_dir = log_dir or os.path.dirname(os.path.dirname(binary))
+    log_path = os.path.join(log_dir, f"{dataset}.log")
+    cwd = evaluator_dir(challenge)
+    print(f"Evaluating {algorithm} on {dataset}")
+    if supervised or timeout is not None or memory_limit is not None:
+        os.makedirs(os.path.join(cwd, "evaluations"), exist_ok=True)
+        counts = supervise.evaluate_dataset(
+            binary, challenge, algorithm, dataset,
+            eval_path=os.path.join(cwd, "evaluations", f"{CHALLENGE_IDS[challenge]}_{dataset}_{algorithm}.csv"),
+            dataset_dir=os.path.join(cwd, "data", dataset), workers=threads or 1,
+            timeout=timeout, memory_limit=memory_limit, env={**env, "RAYON_NUM_THREADS": "1"}, log_path=log_path,
+        )
+        print(f"{algorithm} on {dataset}: {counts}")
+        return
+    if threads:
+        env["RAYON_NUM_THREADS"] = str(threads)
+    with open(log_path, "w") as log:
+        subprocess.run(
+            [binary, os.path.join("data", dataset)], cwd=cwd, env=env,
+            stdout=log, stderr=subprocess.STDOUT, check=True,
+        )
+
+
+def available_datasets(challenge):
+    data_dir = os.path.join(evaluator_dir(challenge), "data")
+    return [name for name in DATASETS[challenge] if os.path.isdir(os.path.join(data_dir, name))]
+
+
+def evaluate(challenge, algorithms, datasets=None, workers=None, threads=None, build_workers=2, build_root=None,
+             timeout=None, memory_limit=None, supervised=False, shared_target=None):
+    """Build each of `algorithms` once and evaluate it on each of `datasets` (all downloaded
+    datasets by default).
+
+    Up to `build_workers` algorithms compile at once, and evaluations start as soon as their
+    algorithm is built. Without a compiler cache (`has_compiler_cache`), or with `shared_target`,
+    algorithms instead build one at a time in one shared target directory. `workers`
+    evaluations run concurrently (one per core, at most one per pair, and one at a time for GPU
+    challenges by default), each with `threads` rayon threads (by default the cores divided
+    between workers). When `supervised`, or with a per-instance `timeout` (seconds) or
+    `memory_limit` (bytes), each evaluation instead runs `threads` isolated single-instance
+    processes at a time (see `run_evaluation`).
+    Returns {algorithm or (algorithm, dataset): error} for whatever failed."""
+    algorithms = list(dict.fromkeys(algorithms))
+    datasets = available_datasets(challenge) if datasets is None else list(datasets)
+    cores = os.cpu_count()
+    if workers is None:
+        workers = 1 if challenge in GPU_CHALLENGES else max(1, min(cores, len(algorithms) * len(datasets)))
+    threads = threads or max(1, cores // workers)
+    if shared_target is None:
+        shared_target = not has_compiler_cache()
+        if shared_target:
+            print("WARNING: sccache not found, so algorithms share one target directory and build one at a time. "
+                  "Install sccache (cargo install sccache) to build them in parallel.")
+    if shared_target:
+        build_workers = 1
+
+    failures = {}
+    with concurrent.futures.ThreadPoolExecutor(build_workers) as builder, \
+            concurrent.futures.ThreadPoolExecutor(workers) as runner:
+        builds = {
+            builder.submit(
+                build, challenge, algorithm, build_root, max(1, cores // build_workers), shared_target,
+            ): algorithm
+            for algorithm in algorithms
+        }
+        runs = {}
+        for future in concurrent.futures.as_completed(builds):
+            algorithm = builds[future]
+            try:
+                binary = future.result()
+            except Exception as e:
+                print(f"Failed to build {algorithm}: {e}")
+                failures[algorithm] = e
+                continue
+            for dataset in datasets:
+                runs[runner.submit(
+                    run_evaluation, challenge, algorithm, dataset, binary, threads,
+                    timeout=timeout, memory_limit=memory_limit, supervised=supervised,
+                )] = (algorithm, dataset)
+        for future in concurrent.futures.as_completed(runs):
+            algorithm, dataset = runs[future]
+            try:
+                future.result()
+                print(f"Evaluated {algorithm} on {dataset}")
+            except Exception as e:
+                print(f"Failed to evaluate {algorithm} on {dataset}: {e}")
+                failures[algorithm, dataset] = e
+    return failures
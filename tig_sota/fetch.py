@@ -0,0 +1,93 @@
+"""Connection-pooled concurrent fetch engine for datasets made of many small files.
+
+All requests go through one keep-alive ``requests.Session`` whose pool is sized to the
+number of workers, are retried with exponential backoff, and land in the download cache.
+Archives are then decompressed from the cached copy straight to disk in a streaming pass.
+"""
+
+import concurrent.futures
+import lzma
+import os
+import shutil
+import tarfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ChecksumError, DownloadCache
+
+COPY_BUFFER = 1 << 20
+
+
+class FetchEngine:
+    def __init__(self, max_workers=8, retries=3, backoff=1.0, cache=None, **request_kwargs):
+        """`request_kwargs` (e.g. ``verify=False``) are passed to every request."""
+        self.max_workers = max_workers
+        # bounds concurrent downloads across every run() sharing this engine
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.request_kwargs = request_kwargs
+        if cache is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cache = DownloadCache(session=session)
+        self.cache = cache
+
+    def fetch(self, url, **request_kwargs):
+        """Path of the cached copy of `url`, retrying failed attempts with exponential backoff"""
+        request_kwargs = {**self.request_kwargs, **request_kwargs}
+        for attempt in range(self.retries):
+            try:
+                with self._slots:
+                    return self.cache.fetch(url, **request_kwargs)
+            except ChecksumError:
+                # the server's content changed, downloading it again will not help
+                raise
+            except Exception as e:
+                if attempt + 1 == self.retries:
+                    raise
+                print(f"Error downloading {url}: {e}")
+                print(f"Retrying {url}: {attempt + 1} of {self.retries}")
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def run(self, jobs, **request_kwargs):
+        """Fetch each `(url, handler)` job and call `handler(path)` on the cached file, at most
+        `max_workers` at a time. Returns the list of `(url, exception)` for jobs that failed."""
+        def job(url, handler):
+            print(f"Downloading {url}")
+            handler(self.fetch(url, **request_kwargs))
+
+        failures = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(job, url, handler): url for url, handler in jobs}
+            for future in concurrent.futures.as_completed(futures):
+                if future.exception() is not None:
+                    print(f"Failed {futures[future]}: {future.exception()}")
+                    failures.append((futures[future], future.exception()))
+        return failures
+
+
+def decompress_xz(src, dest):
+    with lzma.open(src, "rb") as f, open(dest + ".part", "wb") as out:
+        shutil.copyfileobj(f, out, COPY_BUFFER)
+    os.replace(dest + ".part", dest)
+
+
+def extract_tar(src, dest_dir, select=lambda member: True):
+    """Stream the members of a (compressed) tarball accepted by `select` into `dest_dir`, flattening their paths.
+    Returns the paths written"""
+    written = []
+    with tarfile.open(src, mode="r|*") as tar:
+        for member in tar:
+            if not member.isfile() or not select(member):
+                continue
+            path = os.path.join(dest_dir, os.path.basename(member.name))
+            with tar.extractfile(member) as f, open(path, "wb") as out:
+                shutil.copyfileobj(f, out, COPY_BUFFER)
+            written.append(path)
+    return written
@@ -0,0 +1,127 @@
+"""Per-instance build manifests for incremental dataset rebuilds.
+
+Each dataset directory carries a ``manifest.json`` recording, for every instance, a hash of
+the sources it was built from and the SHA-256 and byte size of each file written for it.
+A rebuild skips instances whose source hash is unchanged and whose outputs are still on
+disk with the recorded sizes (and, with ``verify``, the recorded hashes).
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+
+from .pdf_tables import file_sha256
+
+FILENAME = "manifest.json"
+
+
+class IncompleteBuild(RuntimeError):
+    def __init__(self, dataset, failed):
+        self.failed = sorted(failed)
+        super().__init__(f"{dataset}: failed to build {len(self.failed)} instances: {', '.join(self.failed)}")
+
+
+def source_hash(*parts):
+    """Hash of everything an instance is built from, e.g. the URL and SHA-256 of its download,
+    its best-known OFV and a converter version"""
+    return hashlib.sha256(json.dumps([str(p) for p in parts]).encode()).hexdigest()
+
+
+def describe(*paths):
+    """{file name: {"sha256", "size"}} of the output files of an instance. Picklable, so it
+    can be computed in the worker that wrote them."""
+    return {
+        os.path.basename(path): {"sha256": file_sha256(path), "size": os.path.getsize(path)}
+        for path in paths
+    }
+
+
+def sidecar_is_fresh(sidecar, source):
+    """Whether the `sidecar` derived from `source` (e.g. a .bin next to its .txt) was written no
+    earlier than it. The harnesses only read fresh sidecars, and so must everything else."""
+    try:
+        return os.path.getmtime(sidecar) >= os.path.getmtime(source)
+    except FileNotFoundError:
+        return False
+
+
+class Manifest:
+    """``manifest.json`` of `out_dir`, saved on exit when used as a context manager.
+    `force` treats every instance as stale."""
+
+    def __init__(self, out_dir, verify=False, force=False):
+        self.out_dir = out_dir
+        self.path = os.path.join(out_dir, FILENAME)
+        self.verify = verify
+        self.force = force
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)["instances"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.entries = {}
+
+    def fresh(self, instance, source):
+        """Whether `instance` was built from `source` and its outputs are intact"""
+        with self._lock:
+            entry = self.entries.get(instance)
+        if self.force or entry is None or entry["source"] != source:
+            return False
+        for name, output in entry["outputs"].items():
+            path = os.path.join(self.out_dir, name)
+            try:
+                if os.path.getsize(path) != output["size"]:
+                    return False
+            except FileNotFoundError:
+                return False
+            if self.verify and file_sha256(path) != output["sha256"]:
+                return False
+        return True
+
+    def stale(self, sources):
+        """Names of the instances in `sources` ({instance: source hash}) that need building"""
+        return [instance for instance, source in sources.items() if not self.fresh(instance, source)]
+
+    def record(self, instance, source, outputs, **details):
+        """Record `outputs` (as returned by `describe`) of `instance` built from `source`, with
+        `details` such as the {"url", "sha256"} of the ``download`` it was built from"""
+        with self._lock:
+            self.entries[instance] = {"source": source, "outputs": outputs, **details}
+
+    def downloaded(self, instance, url):
+        """SHA-256 of the download of `url` that `instance` was last built from, if recorded"""
+        with self._lock:
+            download = self.entries.get(instance, {}).get("download")
+        return download["sha256"] if download and download["url"] == url else None
+
+    def build(self, executor, fn, tasks, **details):
+        """Call ``fn(*args)`` on `executor` for every ``instance: (source, args)`` of `tasks`,
+        recording the outputs it returns (with `details`). Returns the names of the instances
+        that failed."""
+        futures = {executor.submit(fn, *args): (instance, source) for instance, (source, args) in tasks.items()}
+        failed = []
+        for future in concurrent.futures.as_completed(futures):
+            instance, source = futures[future]
+            try:
+                self.record(instance, source, future.result(), **details)
+            except Exception as e:
+                print(f"Failed {instance}: {e}")
+                failed.append(instance)
+        return failed
+
+    def save(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        with self._lock:
+            data = {"instances": dict(sorted(self.entries.items()))}
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
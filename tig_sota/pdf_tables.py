@@ -0,0 +1,78 @@
+"""Cached, parallel extraction of SOTA result tables from benchmark PDFs.
+
+Extracting tables with pdfplumber is the slowest step of building a dataset, so the parsed
+result of every page is cached as JSON keyed by the PDF's SHA-256 and an extractor `key`.
+Cold extractions split the pages into contiguous ranges parsed in a process pool.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+
+from .cache import DEFAULT_ROOT
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_range(pdf_path, parse, pages):
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [parse(pdf.pages[p]) for p in pages]
+
+
+def _map_ranges(executor, pdf_path, parse, ranges):
+    chunks = executor.map(_parse_range, [pdf_path] * len(ranges), [parse] * len(ranges), ranges)
+    return [r for chunk in chunks for r in chunk]
+
+
+def extract_pages(pdf_path, parse, key, pages=None, workers=None, executor=None, root=DEFAULT_ROOT):
+    """Return ``[parse(pdf.pages[p]) for p in pages]`` (all pages by default).
+
+    `parse` must be picklable and return JSON-serialisable data; any assertions it makes
+    run on cold extractions only, so validated results are what gets cached. `key`
+    identifies the parser and must change whenever its output would. Page ranges are
+    parsed on `executor` if given, otherwise on a pool of `workers` processes.
+    """
+    requested = None if pages is None else list(pages)
+    cache_path = os.path.join(root, "tables", f"{file_sha256(pdf_path)}.{key}.json")
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached["pages"] == requested:
+            return cached["results"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    pages = list(range(page_count(pdf_path))) if requested is None else requested
+    workers = max(1, min(workers or os.cpu_count(), len(pages)))
+    size = max(1, -(-len(pages) // workers))
+    ranges = [pages[i:i + size] for i in range(0, len(pages), size)]
+    if len(ranges) <= 1:
+        results = _parse_range(pdf_path, parse, pages)
+    elif executor is not None:
+        results = _map_ranges(executor, pdf_path, parse, ranges)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            results = _map_ranges(executor, pdf_path, parse, ranges)
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"pages": requested, "results": results}, f)
+    os.replace(tmp, cache_path)
+    return results
+
+
+def page_count(pdf_path):
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
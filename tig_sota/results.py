@@ -0,0 +1,219 @@
+"""Append-only columnar store of evaluation results.
+
+Results are Parquet files partitioned as ``<root>/<challenge>/dataset=<name>/algorithm=<name>/``,
+with typed columns, including the size, density, index and instance type parsed out of
+instance names. A query reads only the partitions and columns it needs. Evaluation CSVs
+written by the harnesses (``evaluations/c00X_<dataset>_<algorithm>.csv``) are imported
+with `import_csv`. A file that was already imported is skipped, so re-importing is cheap,
+and a re-run evaluation (same file name, new content) supersedes the parts it was
+previously imported as.
+"""
+
+import glob
+import hashlib
+import os
+import re
+import uuid
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pcsv
+import pyarrow.dataset as pds
+import pyarrow.parquet as pq
+
+from .datasets import CHALLENGE_IDS
+
+DEFAULT_ROOT = os.environ.get(
+    "TIG_SOTA_RESULTS", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "results")
+)
+
+# challenge of each evaluation file prefix
+CHALLENGES = {prefix: challenge for challenge, prefix in CHALLENGE_IDS.items()}
+
+# parsed out of instance names (without extension), null where an instance does not match
+INSTANCE_PATTERNS = {
+    "satisfiability": r"^(?P<instance_type>uf)(?P<size>\d+)-0*(?P<index>\d+)$",
+    "vehicle_routing": r"^(?P<instance_type>[A-Z]+\d*)_(?P<size>\d+)_(?P<index>\d+)$",
+    "knapsack": r"^(?P<size>\d+)_(?P<density>\d+)_(?P<index>\d+)$",
+    "vector_search": None,
+}
+
+INSTANCE_FIELDS = [
+    ("instance", pa.string()),
+    ("instance_type", pa.string()),
+    ("size", pa.int32()),
+    ("density", pa.int32()),
+    ("index", pa.int32()),
+]
+
+# columns of each harness's evaluation CSV, after renaming `instance_name` to `instance`
+RESULT_FIELDS = {
+    "satisfiability": [
+        ("time_milliseconds", pa.float64()),
+    ],
+    "vehicle_routing": [
+        ("distance", pa.float64()),
+        ("baseline_distance", pa.float64()),
+        ("num_vehicles", pa.int32()),
+        ("baseline_num_vehicles", pa.int32()),
+        ("gap_percent", pa.float64()),
+        ("time_microseconds", pa.float64()),
+    ],
+    "knapsack": [
+        ("knapsack_value", pa.int64()),
+        ("baseline_value", pa.int64()),
+        ("gap_percent", pa.float64()),
+        ("time_milliseconds", pa.float64()),
+    ],
+    "vector_search": [
+        ("average_distance", pa.float64()),
+        ("optimal_distance", pa.float64()),
+        ("time_milliseconds", pa.float64()),
+    ],
+}
+
+# per-instance resource usage recorded by supervised evaluations (see `supervise`), null otherwise
+TELEMETRY_FIELDS = [
+    ("wall_milliseconds", pa.float64()),
+    ("user_milliseconds", pa.float64()),
+    ("system_milliseconds", pa.float64()),
+    ("peak_rss_bytes", pa.int64()),
+    ("threads", pa.int32()),
+]
+
+# column names as written by older harnesses
+RENAMES = {"instance_name": "instance", "ime_milliseconds": "time_milliseconds"}
+
+PARTITIONING = pds.partitioning(pa.schema([("dataset", pa.string()), ("algorithm", pa.string())]), flavor="hive")
+
+
+def schema(challenge):
+    return pa.schema(
+        INSTANCE_FIELDS + RESULT_FIELDS[challenge] + TELEMETRY_FIELDS + [("status", pa.string()), ("source", pa.string())]
+    )
+
+
+def partition_dir(challenge, dataset, algorithm, root=DEFAULT_ROOT):
+    return os.path.join(root, challenge, f"dataset={dataset}", f"algorithm={algorithm}")
+
+
+def instance_columns(challenge, instances):
+    """Typed instance_type / size / density / index columns parsed from `instances`"""
+    stems = pc.replace_substring_regex(instances, r"\.[^.]*$", "")
+    pattern = INSTANCE_PATTERNS[challenge]
+    parsed = pc.extract_regex(stems, pattern) if pattern else None
+    columns = {}
+    for name, type in INSTANCE_FIELDS[1:]:
+        if parsed is not None and name in re.compile(pattern).groupindex:
+            columns[name] = pc.cast(pc.struct_field(parsed, name), type)
+        else:
+            columns[name] = pa.nulls(len(instances), type)
+    return columns
+
+
+def to_table(challenge, table, source=None):
+    """Conform an evaluation `table` of `challenge` to the store's schema"""
+    table = table.rename_columns([RENAMES.get(name, name) for name in table.column_names])
+    instances = pc.utf8_trim(pc.cast(table["instance"], pa.string()), '"')
+    columns = {"instance": instances, **instance_columns(challenge, instances)}
+    for name, type in RESULT_FIELDS[challenge] + TELEMETRY_FIELDS:
+        columns[name] = pc.cast(table[name], type) if name in table.column_names else pa.nulls(len(table), type)
+    columns["status"] = pc.utf8_trim(pc.cast(table["status"], pa.string()), '"')
+    columns["source"] = pa.array([source] * len(table), pa.string())
+    return pa.table(columns, schema=schema(challenge))
+
+
+def append(challenge, dataset, algorithm, table, name=None, root=DEFAULT_ROOT):
+    """Write `table` (already conformed with `to_table`) as a new part of its partition.
+    Returns the part's path, or None if a part called `name` already exists."""
+    directory = partition_dir(challenge, dataset, algorithm, root)
+    path = os.path.join(directory, f"part-{name or uuid.uuid4().hex}.parquet")
+    if os.path.exists(path):
+        return None
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def parse_csv_name(path, datasets=None):
+    """(challenge, dataset, algorithm) of an evaluation CSV named ``c00X_<dataset>_<algorithm>.csv``.
+
+    Both dataset and algorithm names may contain underscores, so the dataset is matched
+    against the known datasets of the challenge (longest first), and their variants."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    prefix, _, rest = stem.partition("_")
+    if prefix not in CHALLENGES:
+        raise ValueError(f"{path}: expected a name starting with one of {list(CHALLENGES)}")
+    challenge = CHALLENGES[prefix]
+    if datasets is None:
+        from .datasets import DATASETS
+        datasets = DATASETS[challenge]
+    for dataset in sorted(datasets, key=len, reverse=True):
+        # optionally followed by the size of a variant, e.g. HG-400 (see `variants`)
+        match = re.match(rf"({re.escape(dataset)}(?:-[^_]+)?)_(.+)$", rest)
+        if match:
+            return challenge, match.group(1), match.group(2)
+    raise ValueError(f"{path}: unknown {challenge} dataset, expected one of {sorted(datasets)}")
+
+
+def import_csv(path, challenge=None, dataset=None, algorithm=None, root=DEFAULT_ROOT):
+    """Import one evaluation CSV, inferring challenge, dataset and algorithm from its name
+    unless given. Returns the written part, or None if this exact file was imported before."""
+    if challenge is None or dataset is None or algorithm is None:
+        challenge, dataset, algorithm = parse_csv_name(path, None if dataset is None else [dataset])
+    with open(path, "rb") as f:
+        data = f.read()
+    table = pcsv.read_csv(
+        pa.BufferReader(data),
+        convert_options=pcsv.ConvertOptions(column_types={"status": pa.string()}),
+    )
+    # named by content, so importing the same evaluation twice is a no-op
+    name = hashlib.sha256(data).hexdigest()[:16]
+    source = os.path.basename(path)
+    table = to_table(challenge, table, source).replace_schema_metadata({"source": source})
+    written = append(challenge, dataset, algorithm, table, name, root)
+    if written is not None:
+        for part in glob.glob(os.path.join(os.path.dirname(written), "part-*.parquet")):
+            metadata = pq.read_schema(part).metadata or {}
+            if part != written and metadata.get(b"source") == source.encode():
+                os.remove(part)
+    return written
+
+
+def import_paths(paths, root=DEFAULT_ROOT):
+    """Import evaluation CSVs, expanding directories to their ``c00*_*.csv`` files.
+    Returns the parts written."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(glob.glob(os.path.join(path, "c00*_*.csv")))
+        else:
+            files.append(path)
+    written = [import_csv(path, root=root) for path in files]
+    return [path for path in written if path is not None]
+
+
+def read_table(challenge, datasets=None, algorithms=None, columns=None, filter=None, root=DEFAULT_ROOT):
+    """Arrow table of the results of `challenge`, reading only the partitions of `datasets` /
+    `algorithms` (all by default) and only `columns` (all by default, plus `dataset` and
+    `algorithm`). `filter` is an optional extra ``pyarrow.dataset`` expression."""
+    directory = os.path.join(root, challenge)
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"No {challenge} results under {root}")
+    dataset = pds.dataset(directory, format="parquet", partitioning=PARTITIONING, schema=schema(challenge).append(
+        pa.field("dataset", pa.string())).append(pa.field("algorithm", pa.string())))
+    expression = filter
+    for field, values in (("dataset", datasets), ("algorithm", algorithms)):
+        if values is not None:
+            condition = pc.field(field).isin(list(values))
+            expression = condition if expression is None else expression & condition
+    if columns is not None:
+        columns = list(dict.fromkeys(["dataset", "algorithm", *columns]))
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def load(challenge, datasets=None, algorithms=None, columns=None, filter=None, root=DEFAULT_ROOT):
+    """`read_table` as a pandas DataFrame"""
+    return read_table(challenge, datasets, algorithms, columns, filter, root).to_pandas()
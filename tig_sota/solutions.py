@@ -0,0 +1,39 @@
+"""Audits of stored solutions, ``<instance>.sol`` files, against the instances of a dataset.
+
+A challenge provides a scorer, ``audit_instance(instance_path, sol_path)``, returning the
+result of every solution stored in one file, and a ``summary(result)`` of that result as a
+(report line, failed) pair. `audit` runs the scorer over a dataset and `report` prints and
+collects the failures, so each challenge only implements the scoring itself.
+"""
+
+import glob
+import os
+
+
+def audit(dataset_dir, extension, audit_instance, solutions_dir=None, executor=None):
+    """{instance name: ``audit_instance(instance_path, sol_path)``} of the stored solutions
+    ``<instance>.sol`` in `solutions_dir` (default: next to the instances) of the `extension`
+    (e.g. ``.cnf``) instances in `dataset_dir`. Instances are audited on `executor` when given,
+    in which case `audit_instance` must be picklable."""
+    solutions_dir = solutions_dir or dataset_dir
+    pairs = {}
+    for instance_path in sorted(glob.glob(os.path.join(dataset_dir, f"*{extension}"))):
+        name = os.path.basename(instance_path)
+        sol_path = os.path.join(solutions_dir, os.path.splitext(name)[0] + ".sol")
+        if os.path.exists(sol_path):
+            pairs[name] = (instance_path, sol_path)
+    results = (executor.map if executor else map)(audit_instance, *zip(*pairs.values())) if pairs else []
+    return dict(zip(pairs, results))
+
+
+def report(results, summary):
+    """Print ``summary(result)`` of each instance of `results` and return the names of the
+    instances it reported as failed"""
+    failed = []
+    for name, result in results.items():
+        line, failure = summary(result)
+        print(f"{name}: {line}")
+        if failure:
+            failed.append(name)
+    print(f"Audited {len(results)} instances")
+    return failed
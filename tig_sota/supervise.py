@@ -0,0 +1,216 @@
+"""Isolated per-instance execution of evaluator binaries under wall-clock and memory limits.
+
+The harnesses evaluate every instance of a dataset in one process, so a single hanging or
+runaway instance stalls or kills the whole run. Here each instance runs in its own process,
+against a scratch dataset directory holding just that instance (and its sidecar files),
+while the supervisor samples its resident memory. An instance that exceeds its limits is
+killed and recorded with a ``timeout`` / ``oom`` status in the usual evaluation CSV, and
+the remaining instances carry on.
+
+Every row also records the instance's own wall time, user and system CPU time, peak
+resident memory and thread count. Unlike the harnesses' timings, these are not skewed
+by other instances running in the same process.
+"""
+
+import concurrent.futures
+import csv
+import glob
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+
+POLL_INTERVAL = 0.05
+
+# resource usage appended to each row of a supervised evaluation
+TELEMETRY_HEADER = ["wall_milliseconds", "user_milliseconds", "system_milliseconds", "peak_rss_bytes", "threads"]
+
+# instance file extension and sidecar extensions read alongside it by each harness
+INSTANCE_FILES = {
+    "satisfiability": (".cnf", [".cnfb"]),
+    "vehicle_routing": (".txt", [".sol", ".dist"]),
+    "knapsack": (".txt", [".bin"]),
+    "vector_search": (".bin", []),
+}
+
+# evaluation CSV header written by each harness (see src/main.rs.template)
+HEADERS = {
+    "satisfiability": ["instance_name", "ime_milliseconds", "status"],
+    "vehicle_routing": [
+        "instance_name", "distance", "baseline_distance", "num_vehicles",
+        "baseline_num_vehicles", "gap_percent", "time_microseconds", "status",
+    ],
+    "knapsack": ["instance", "knapsack_value", "baseline_value", "gap_percent", "time_milliseconds", "status"],
+    "vector_search": ["instance_name", "average_distance", "optimal_distance", "time_milliseconds", "status"],
+}
+
+
+def instance_files(challenge, dataset_dir):
+    extension, _ = INSTANCE_FILES[challenge]
+    return sorted(
+        path for path in glob.glob(os.path.join(dataset_dir, "*"))
+        if os.path.isfile(path) and path.lower().endswith(extension)
+    )
+
+
+def instance_name(challenge, path):
+    """Instance column value as the harness writes it (before CSV quoting)"""
+    name = os.path.basename(path)
+    return os.path.splitext(name)[0] if challenge == "vehicle_routing" else name
+
+
+def proc_status(pid):
+    """{field: value} of ``/proc/<pid>/status`` (empty once the process is gone)"""
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                fields[name] = value.split()
+    except (FileNotFoundError, ProcessLookupError):
+        pass
+    return fields
+
+
+class Telemetry:
+    """Resource usage of one instance's process: the peak resident memory and thread count
+    sampled from ``/proc`` while it runs, and its CPU times from its rusage once reaped.
+
+    The rusage's ``ru_maxrss`` is not used, as Linux carries the high-water mark of the
+    forked supervisor over the exec."""
+
+    def __init__(self):
+        self.start = time.monotonic()
+        self.wall = self.user = self.system = None
+        self.peak_rss = 0
+        self.threads = 0
+
+    def sample(self, pid):
+        """Record the current usage of `pid`, returning its resident memory in bytes"""
+        status = proc_status(pid)
+        rss = int(status.get("VmRSS", [0])[0]) * 1024
+        # VmHWM also covers peaks between samples
+        self.peak_rss = max(self.peak_rss, rss, int(status.get("VmHWM", [0])[0]) * 1024)
+        self.threads = max(self.threads, int(status.get("Threads", [0])[0]))
+        return rss
+
+    def finish(self, rusage):
+        self.wall = time.monotonic() - self.start
+        self.user, self.system = rusage.ru_utime, rusage.ru_stime
+
+    def row(self):
+        return [
+            round(self.wall * 1e3, 3), round(self.user * 1e3, 3), round(self.system * 1e3, 3),
+            # empty if the process exited before it was first sampled
+            self.peak_rss or "", self.threads or "",
+        ]
+
+
+def header(challenge):
+    return HEADERS[challenge] + TELEMETRY_HEADER
+
+
+def failure_row(challenge, path, status, elapsed):
+    """Harness CSV row for an instance the harness did not report on; unknown values are left empty"""
+    header = HEADERS[challenge]
+    row = dict.fromkeys(header, "")
+    row[header[0]] = instance_name(challenge, path)
+    time_column = next(name for name in header if "time" in name)
+    row[time_column] = int(elapsed * (1e6 if time_column.endswith("microseconds") else 1e3))
+    row["status"] = status
+    return [row[name] for name in header]
+
+
+def run_instance(binary, challenge, dataset, path, timeout=None, memory_limit=None, env=None, log=None):
+    """Run `binary` on the single instance at `path` in its own process group.
+
+    Kills it once it runs for more than `timeout` seconds or its resident memory exceeds
+    `memory_limit` bytes (either may be None). Returns the CSV rows to record for the
+    instance, with its `Telemetry` appended."""
+    _, sidecars = INSTANCE_FILES[challenge]
+    with tempfile.TemporaryDirectory(prefix="tig-instance-") as work_dir:
+        # the harness names its output after the dataset directory, so keep the name
+        dataset_dir = os.path.join(work_dir, dataset)
+        os.makedirs(dataset_dir)
+        stem = os.path.splitext(path)[0]
+        for source in [path] + [stem + ext for ext in sidecars if os.path.exists(stem + ext)]:
+            os.symlink(os.path.abspath(source), os.path.join(dataset_dir, os.path.basename(source)))
+
+        telemetry = Telemetry()
+        status = None
+        proc = subprocess.Popen(
+            [binary, dataset], cwd=work_dir, env=env, start_new_session=True,
+            stdout=log or subprocess.DEVNULL, stderr=subprocess.STDOUT,
+        )
+        # reaped with wait4 rather than Popen.wait to get the child's rusage
+        try:
+            while True:
+                pid, wait_status, rusage = os.wait4(proc.pid, os.WNOHANG)
+                if pid:
+                    break
+                rss = telemetry.sample(proc.pid)
+                if timeout is not None and time.monotonic() - telemetry.start > timeout:
+                    status = "timeout"
+                elif memory_limit is not None and rss > memory_limit:
+                    status = "oom"
+                if status is not None:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    _, wait_status, rusage = os.wait4(proc.pid, 0)
+                    break
+                time.sleep(POLL_INTERVAL)
+        except BaseException:
+            os.killpg(proc.pid, signal.SIGKILL)
+            os.wait4(proc.pid, 0)
+            raise
+        proc.returncode = os.waitstatus_to_exitcode(wait_status)
+        telemetry.finish(rusage)
+
+        rows = []
+        if status is None:
+            for output in glob.glob(os.path.join(work_dir, "evaluations", "*.csv")):
+                with open(output, newline="") as f:
+                    rows += list(csv.reader(f))[1:]
+            if not rows:
+                # killed by the kernel's OOM killer, or crashed before reporting
+                status = "oom" if proc.returncode == -signal.SIGKILL else f"error: exit code {proc.returncode}"
+        if status is not None:
+            rows = [failure_row(challenge, path, status, telemetry.wall)]
+        return [row + telemetry.row() for row in rows]
+
+
+def evaluate_dataset(binary, challenge, algorithm, dataset, eval_path, dataset_dir=None,
+                     workers=1, timeout=None, memory_limit=None, env=None, log_path=None):
+    """Evaluate every instance of `dataset` in its own supervised process, `workers` at a time,
+    writing the harness's CSV plus telemetry columns to `eval_path`. Returns {status: count}."""
+    dataset_dir = dataset_dir or os.path.join("data", dataset)
+    env = {**(env or os.environ), "ALGORITHM": algorithm}
+    lock = threading.Lock()
+    counts = {}
+    with open(eval_path, "w", newline="") as out, open(log_path or os.devnull, "w") as log:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(header(challenge))
+
+        def job(path):
+            rows = run_instance(binary, challenge, dataset, path, timeout, memory_limit, env, log)
+            with lock:
+                writer.writerows(rows)
+                out.flush()
+                for row in rows:
+                    status = row[len(HEADERS[challenge]) - 1].split(":")[0]
+                    counts[status] = counts.get(status, 0) + 1
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            for future in [executor.submit(job, path) for path in instance_files(challenge, dataset_dir)]:
+                future.result()
+    return counts
+
+
+def parse_size(text):
+    """Bytes in a size such as ``512M`` or ``8G`` (plain numbers are bytes)"""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
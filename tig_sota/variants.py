@@ -0,0 +1,266 @@
+"""Reproducible size ladders of existing datasets, for measuring how runtimes scale.
+
+A variant of dataset ``<name>`` at size ``<size>`` is written to ``data/<name>-<size>`` in the
+same on-disk format as the original, so the harnesses evaluate it unchanged:
+
+* vector search: a random subset of the database and the first queries of each ``.bin``
+  file, with the nearest neighbours recomputed by exact search
+* vehicle routing: the depot and a random subset of the customers of each HG instance
+  (renumbered, with precomputed distances). Subsets have no best-known solution, so a
+  nearest-neighbour solution (`hg_nearest_neighbour`) is written as the baseline
+  ``.sol`` and indexed into ``baselines.csv``.
+* knapsack: the first items of each QKP instance, keeping only edges between them, with
+  the budget scaled by the fraction of the total weight kept. The best-known OFV of a
+  prefix is unknown, so the value of a greedy selection (`qkp_greedy`) is written instead.
+
+Gaps of variants are thus relative to these heuristics, not to the best known solutions,
+and how each baseline was derived is recorded in the variant's manifest entries.
+
+Variants are derived from the largest instances of the dataset. Subsets are drawn from a
+generator seeded by (seed, size, instance name), so a ladder is identical wherever it is
+built, and a variant is only rebuilt when its source or parameters change.
+"""
+
+import concurrent.futures
+import glob
+import os
+import re
+import zlib
+
+import numpy as np
+
+from .datasets import default_data_dir
+from .datasets.knapsack import qkp_binary, qkp_convert, qkp_score
+from .datasets.vector_search import ground_truth
+from .datasets.vector_search.vector_bin import VectorDataset, write_bin
+from .datasets.vehicle_routing import hg_baseline, hg_distances
+from .manifest import IncompleteBuild, Manifest, describe, source_hash
+
+# bump whenever variants are derived differently, so that manifests mark them stale
+VERSION = 2
+
+
+def variant_name(dataset, size):
+    # no underscore, so evaluation CSV names still parse (see results.parse_csv_name)
+    return f"{dataset}-{size}"
+
+
+def rng(seed, size, name):
+    return np.random.default_rng([seed, size, zlib.crc32(name.encode())])
+
+
+def file_source(path, *params):
+    """Source hash of a variant derived from the file at `path` with `params`"""
+    stat = os.stat(path)
+    return source_hash(os.path.basename(path), stat.st_size, stat.st_mtime_ns, *params, VERSION)
+
+
+# --- vector search
+
+
+def vector_subset(path, out_path, size, seed=0, num_queries=None, workers=None):
+    """Write a .bin of `size` random database vectors (in their original order) and the first
+    `num_queries` queries (all by default) of `path`, with exact nearest neighbours"""
+    data = VectorDataset(path)
+    if size > data.database_size:
+        raise ValueError(f"{path}: cannot take {size} of {data.database_size} database vectors")
+    rows = np.sort(rng(seed, size, os.path.basename(path)).choice(data.database_size, size, replace=False))
+    database = data.database[rows]
+    queries = data.queries[:num_queries or data.num_queries]
+    neighbours, _ = ground_truth.exact_knn(database, queries, k=1, workers=workers)
+    write_bin(out_path, database, queries, neighbours[:, 0])
+    return describe(out_path)
+
+
+# --- vehicle routing
+
+CUSTOMER_ID = re.compile(r"^(\s*)(\d+)")
+
+
+def hg_customers(path):
+    """Number of customers (depot excluded) of an HG instance"""
+    x, _ = hg_distances.read_coordinates(path)
+    return len(x) - 1
+
+
+def hg_table(path):
+    """(capacity, demands, ready times, due times, service times) of an HG instance, times
+    scaled and rounded as the evaluator does, depot first"""
+    with open(path) as f:
+        lines = f.read().splitlines()
+    vehicle = next(i for i, line in enumerate(lines) if "CAPACITY" in line)
+    capacity = int(next(line for line in lines[vehicle + 1:] if line.split()).split()[1])
+    header_end = next(i for i, line in enumerate(lines) if "CUST NO." in line) + 1
+    rows = np.array([line.split() for line in lines[header_end:] if len(line.split()) == 7], dtype=np.float64)
+    times = hg_distances.round_half_away(rows[:, 4:7] * hg_distances.SCALE).astype(np.int64)
+    return capacity, rows[:, 3].astype(np.int64), times[:, 0], times[:, 1], times[:, 2]
+
+
+def hg_nearest_neighbour(path, dist):
+    """Routes (lists of customers) of a nearest-neighbour solution of the HG instance at `path`
+    with distance matrix `dist`: each route leaves the depot and repeatedly visits the nearest
+    unvisited customer it can still serve within its capacity and time window and still
+    return to the depot in time, until every customer is served"""
+    capacity, demands, ready, due, service = hg_table(path)
+    unvisited = np.ones(len(demands), dtype=bool)
+    unvisited[0] = False
+    routes = []
+    while unvisited.any():
+        route, node, time, load = [], 0, 0, 0
+        while True:
+            start = np.maximum(time + dist[node], ready)
+            feasible = (unvisited & (load + demands <= capacity) & (start <= due)
+                        & (start + service + dist[:, 0] <= due[0]))
+            if not feasible.any():
+                break
+            node = int(np.argmin(np.where(feasible, dist[node], np.iinfo(np.int64).max)))
+            route.append(node)
+            unvisited[node] = False
+            time, load = start[node] + service[node], load + demands[node]
+        if not route:
+            raise ValueError(f"{path}: no route can serve customers {np.flatnonzero(unvisited)[:10].tolist()}")
+        routes.append(route)
+    return routes
+
+
+def write_sol(path, routes, dist):
+    """Write `routes` as an HG .sol file, with their total distance in the units of the instance"""
+    cost = sum(int(dist[a, b]) for route in routes for a, b in zip([0] + route, route + [0]))
+    with open(path, "w") as f:
+        for i, route in enumerate(routes):
+            f.write(f"Route #{i + 1}: {' '.join(map(str, route))}\n")
+        f.write(f"Cost {cost / hg_distances.SCALE:.1f}\n")
+    return path
+
+
+def hg_subset(path, out_path, size, seed=0):
+    """Write an HG instance with the depot and `size` random customers of `path`, renumbered in
+    order, with a nearest-neighbour baseline solution"""
+    with open(path) as f:
+        lines = f.read().splitlines()
+    header_end = next(i for i, line in enumerate(lines) if "CUST NO." in line) + 1
+    customers = [i for i in range(header_end, len(lines)) if lines[i].split()]
+    if size >= len(customers):
+        raise ValueError(f"{path}: cannot take {size} of {len(customers) - 1} customers")
+    keep = np.sort(rng(seed, size, os.path.basename(path)).choice(np.arange(1, len(customers)), size, replace=False))
+    out = lines[:header_end] + [""]
+    for new_id, i in enumerate([customers[0]] + [customers[k] for k in keep]):
+        # keep the column alignment of the original file
+        out.append(CUSTOMER_ID.sub(lambda m: f"{new_id:>{len(m.group(0))}}", lines[i], count=1))
+    with open(out_path, "w") as f:
+        f.write("\n".join(out) + "\n")
+    dist_path = hg_distances.write_matrix(out_path)
+    dist = hg_distances.read_matrix(dist_path).astype(np.int64)
+    sol_path = write_sol(out_path[:-len(".txt")] + ".sol", hg_nearest_neighbour(out_path, dist), dist)
+    return describe(out_path, dist_path, sol_path)
+
+
+# --- knapsack
+
+
+def qkp_items(path):
+    with open(path) as f:
+        return int(f.readline().split()[0])
+
+
+def qkp_greedy(instance):
+    """Selection (bool array) of a greedy heuristic on a `qkp_binary.QKPInstance`: starting
+    empty, repeatedly add the item of largest positive marginal value per unit of weight that
+    still fits the budget"""
+    matrix = qkp_score.qkp_matrix(instance)
+    n = matrix.num_items
+    # both items of every pair, grouped by item, to update the marginal values of its neighbours
+    rows = np.repeat(np.arange(n), np.diff(matrix.indptr))
+    items, neighbours = np.concatenate([rows, matrix.indices]), np.concatenate([matrix.indices, rows])
+    order = np.argsort(items, kind="stable")
+    neighbours, values = neighbours[order], np.concatenate([matrix.data, matrix.data])[order].astype(np.int64)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(items, minlength=n), out=indptr[1:])
+
+    gain = matrix.values.astype(np.int64)
+    weights = np.asarray(instance.weights, dtype=np.int64)
+    selected = np.zeros(n, dtype=bool)
+    remaining = instance.budget
+    while True:
+        candidates = ~selected & (weights <= remaining) & (gain > 0)
+        if not candidates.any():
+            return selected
+        # zero-weight items count as weight 1
+        i = int(np.argmax(np.where(candidates, gain / np.maximum(weights, 1), -np.inf)))
+        selected[i] = True
+        remaining -= weights[i]
+        gain[neighbours[indptr[i]:indptr[i + 1]]] += values[indptr[i]:indptr[i + 1]]
+
+
+def qkp_prefix(path, out_path, size, seed=0):
+    """Write the sub-instance of the first `size` items of the QKP instance at `path`, with the
+    value of a greedy selection as its OFV"""
+    instance = qkp_binary.read_qkp(path)
+    if size > instance.num_items:
+        raise ValueError(f"{path}: cannot take {size} of {instance.num_items} items")
+    keep = (np.asarray(instance.rows) < size) & (np.asarray(instance.cols) < size)
+    weights = np.asarray(instance.weights, dtype=np.int64)
+    budget = int(instance.budget * weights[:size].sum() // max(weights.sum(), 1))
+    prefix = qkp_binary.QKPInstance(
+        size, budget, 0, weights[:size],
+        np.asarray(instance.rows)[keep], np.asarray(instance.cols)[keep], np.asarray(instance.vals)[keep],
+    )
+    ofv = int(qkp_score.score(prefix, qkp_greedy(prefix)).value[0])
+    qkp_convert.write_instance(out_path, size, prefix.rows, prefix.cols, prefix.vals, prefix.weights, budget, ofv)
+    return describe(out_path, qkp_binary.bin_path(out_path))
+
+
+# challenge -> (instance extension, instance size, variant writer, baseline derivation recorded in
+# the manifest, step run on the variant directory once its instances are written)
+VARIANTS = {
+    "vector_search": (".bin", lambda path: VectorDataset(path).database_size, vector_subset,
+                      "exact nearest neighbours of the subset", None),
+    "vehicle_routing": (".txt", hg_customers, hg_subset,
+                        "nearest-neighbour routes (capacity and time windows), written as <instance>.sol",
+                        hg_baseline.build_index),
+    "knapsack": (".txt", qkp_items, qkp_prefix,
+                 "greedy by marginal value per unit of weight, written as the OFV", None),
+}
+
+
+def build_ladder(challenge, dataset, sizes, seed=0, data_dir=None, workers=None, force=False):
+    """Write the variants of `dataset` at each of `sizes`, derived from its largest instances.
+    Returns the variant directories."""
+    if challenge not in VARIANTS:
+        raise ValueError(f"No variants of {challenge} datasets, expected one of {list(VARIANTS)}")
+    extension, instance_size, write_variant, baseline, finish = VARIANTS[challenge]
+    data_dir = data_dir or default_data_dir(challenge)
+    paths = sorted(glob.glob(os.path.join(data_dir, dataset, f"*{extension}")))
+    if not paths:
+        raise FileNotFoundError(f"No {extension} instances in {os.path.join(data_dir, dataset)}")
+    instance_sizes = {path: instance_size(path) for path in paths}
+    largest = max(instance_sizes.values())
+    sources = [path for path in paths if instance_sizes[path] == largest]
+
+    out_dirs = []
+    # vector subsets search on threads of their own, so are written one at a time
+    executor = (concurrent.futures.ThreadPoolExecutor(1) if challenge == "vector_search"
+                else concurrent.futures.ProcessPoolExecutor(workers))
+    with executor:
+        for size in sizes:
+            out_dir = os.path.join(data_dir, variant_name(dataset, size))
+            os.makedirs(out_dir, exist_ok=True)
+            with Manifest(out_dir, force=force) as manifest:
+                tasks = {
+                    os.path.basename(path): (
+                        file_source(path, size, seed),
+                        (path, os.path.join(out_dir, os.path.basename(path)), size, seed),
+                    )
+                    for path in sources
+                }
+                stale = manifest.stale({name: source for name, (source, _) in tasks.items()})
+                print(f"{variant_name(dataset, size)}: {len(tasks) - len(stale)} up to date, {len(stale)} to build")
+                failed = manifest.build(
+                    executor, write_variant, {name: tasks[name] for name in stale}, baseline=baseline,
+                )
+            if failed:
+                raise IncompleteBuild(variant_name(dataset, size), failed)
+            if finish is not None:
+                finish(out_dir)
+            out_dirs.append(out_dir)
+    return out_dirs